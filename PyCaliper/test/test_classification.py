@@ -4,6 +4,8 @@ from PyCaliper.uom.measurement_system import MeasurementSystem
 from PyCaliper.uom.enums import Unit
 from PyCaliper.uom.enums import UnitType
 from PyCaliper.uom.cache_manager import CacheManager
+from PyCaliper.uom.dimension import Dimension
+from PyCaliper.uom.caliper_exception import PyCaliperException
 
 class TestClassification(unittest.TestCase):    
     def testClassifications(self):
@@ -163,3 +165,77 @@ class TestClassification(unittest.TestCase):
         
         # irradiance
         self.assertTrue(kg.divide(s3).classify().unitType == UnitType.IRRADIANCE)
+
+    def testDimensions(self):
+        msys = MeasurementSystem.instance()
+
+        m = msys.getUOM(Unit.METRE)
+        ft = msys.getUOM(Unit.FOOT)
+        s = msys.getSecond()
+
+        # a Newton is kg.m/s^2
+        dimension = msys.getUOM(Unit.NEWTON).getDimension()
+        self.assertTrue(dimension.isKnown())
+        self.assertEqual(dimension.exponents[Dimension.INDEX[UnitType.MASS]], 1)
+        self.assertEqual(dimension.exponents[Dimension.INDEX[UnitType.LENGTH]], 1)
+        self.assertEqual(dimension.exponents[Dimension.INDEX[UnitType.TIME]], -2)
+
+        # same dimension in different systems
+        self.assertTrue(msys.getUOM(Unit.POUND_FORCE).getDimension() == dimension)
+        self.assertTrue(msys.getUOM(Unit.RADIAN).getDimension().exponents == Dimension.NONE)
+
+        # a mixed-system product of lengths is an area
+        self.assertTrue(m.multiply(ft).classify().unitType == UnitType.AREA)
+
+        # custom base units are not expressible in the unit types
+        beta = msys.createScalarUOM(UnitType.UNCLASSIFIED, None, "beta", "beta_dim", "Beta")
+        self.assertFalse(beta.getDimension().isKnown())
+        self.assertTrue(beta.divide(s).classify().unitType == UnitType.UNCLASSIFIED)
+
+        # a product, quotient or power has the combined dimension of its operands
+        kg = msys.getUOM(Unit.KILOGRAM)
+        s2 = msys.createUnclassifiedPowerUOM(s, 2)
+        newton = kg.multiply(m).divide(s2)
+        self.assertTrue(newton.getDimension() == dimension)
+        self.assertEqual(s2.getDimension().exponents, s.getDimension().power(2).exponents)
+        self.assertEqual(m.divide(s).getDimension().exponents, m.getDimension().multiply(s.getDimension().power(-1)).exponents)
+        self.assertTrue(newton.classify().unitType == UnitType.FORCE)
+
+        # and agrees with the reduction to base units
+        for uom in [newton, m.multiply(ft), ft.divide(s2), msys.getUOM(Unit.WATT_HOUR)]:
+            reducer = uom.getReducer()
+            self.assertEqual(uom.getDimension().exponents, Dimension.fromTerms(reducer.terms, reducer.mapScalingFactor).exponents)
+
+        # an operand redefinition is seen by the product
+        mine = msys.createScalarUOM(UnitType.LENGTH, None, "mine_dim", "mine_dim", "Mine")
+        mine.setConversion(1.0, m)
+        area = mine.multiply(mine)
+        self.assertTrue(area.classify().unitType == UnitType.AREA)
+        mine.setConversion(1.0, s)
+        reducer = area.getReducer()
+        self.assertEqual(area.getDimension().exponents, Dimension.fromTerms(reducer.terms, reducer.mapScalingFactor).exponents)
+
+        # exponents must agree for a conversion
+        m2 = msys.createUnclassifiedPowerUOM(m, 2)
+        with self.assertRaises(PyCaliperException):
+            m2.getConversionFactor(msys.getUOM(Unit.CUBIC_METRE))
+
+    def testClassifyMany(self):
+        msys = MeasurementSystem.instance()
+        cacheManager = CacheManager.instance()
+
+        m = msys.getUOM(Unit.METRE)
+        s = msys.getUOM(Unit.SECOND)
+        kg = msys.getUOM(Unit.KILOGRAM)
+
+        # the index has the first unit type in definition order for each dimension
+        self.assertEqual(cacheManager.getDimensionType(cacheManager.getTypeDimension(UnitType.FORCE)), UnitType.FORCE)
+        self.assertEqual(cacheManager.getDimensionType(Dimension.NONE), UnitType.UNITY)
+        self.assertEqual(cacheManager.getDimensionType((9,) * len(Dimension.TYPES)), UnitType.UNCLASSIFIED)
+
+        uoms = [m.divide(s), m.multiply(m), kg.multiply(m).divide(s).divide(s), m.divide(m), m.divide(s).divide(s)]
+        classified = msys.classifyMany(uoms)
+
+        self.assertTrue(classified[0] is uoms[0])
+        self.assertEqual([uom.unitType for uom in classified],
+                         [UnitType.VELOCITY, UnitType.AREA, UnitType.FORCE, UnitType.UNITY, UnitType.ACCELERATION])
@@ -0,0 +1,183 @@
+import random
+import sys
+import threading
+import unittest
+
+from PyCaliper.uom.measurement_system import MeasurementSystem
+from PyCaliper.uom.cache_manager import CacheManager
+from PyCaliper.uom.enums import Unit
+from PyCaliper.uom.quantity import Quantity
+from PyCaliper.uom.localizer import Localizer
+
+class TestConcurrency(unittest.TestCase):
+    THREADS = 16
+
+    def testConcurrentCreation(self):
+        # race against an empty cache, then restore the shared one
+        metre = MeasurementSystem.instance().getUOM(Unit.METRE)
+        shared = CacheManager.instance()
+        CacheManager.manager = CacheManager()
+
+        try:
+            self.createConcurrently()
+        finally:
+            CacheManager.manager = shared
+
+        self.assertTrue(MeasurementSystem.instance().getUOM(Unit.METRE) is metre)
+
+    def createConcurrently(self):
+        msys = MeasurementSystem.instance()
+
+        units = list(Unit)
+        symbols = msys.getDefinedSymbols()
+        barrier = threading.Barrier(TestConcurrency.THREADS)
+        results = [None] * TestConcurrency.THREADS
+        errors = []
+
+        def worker(index):
+            order = list(units)
+            random.Random(index).shuffle(order)
+            seen = {}
+
+            try:
+                barrier.wait()
+
+                for unit in order:
+                    # half of the threads look the units up by symbol
+                    if (index % 2 == 0):
+                        uom = msys.getUOM(unit)
+                    else:
+                        uom = msys.findUOMBySymbol(symbols[unit])
+
+                    # the unit of measure must be completely defined when returned
+                    seen[unit] = (uom, uom.scalingFactor, uom.abscissaUnit, uom.offset)
+
+                    Quantity(1.0, uom).convert(uom.abscissaUnit)
+            except Exception as e:
+                errors.append(e)
+
+            results[index] = seen
+
+        # switch threads often to provoke races
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+        try:
+            threads = [threading.Thread(target=worker, args=(i,)) for i in range(TestConcurrency.THREADS)]
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(errors, [])
+
+        # every thread got the same, fully defined instance of each unit
+        for unit in units:
+            uom = msys.getUOM(unit)
+            expected = (uom, uom.scalingFactor, uom.abscissaUnit, uom.offset)
+
+            for seen in results:
+                self.assertTrue(seen[unit][0] is uom)
+                self.assertEqual(seen[unit], expected)
+
+            self.assertTrue(msys.getUOMBySymbol(uom.symbol) is uom)
+
+    def testPendingSymbol(self):
+        msys = MeasurementSystem.instance()
+        foot = msys.getUOM(Unit.FOOT)
+        found = []
+
+        def worker():
+            found.append(msys.getUOMBySymbol(foot.symbol))
+
+        # a unit of measure being created by another thread is not returned until it is complete
+        with msys.lock:
+            msys.pending.add(Unit.FOOT)
+
+            try:
+                thread = threading.Thread(target=worker)
+                thread.start()
+                thread.join(0.2)
+                self.assertTrue(thread.is_alive())
+                self.assertEqual(found, [])
+
+                # the creating thread itself sees it
+                self.assertTrue(msys.getUOMBySymbol(foot.symbol) is foot)
+            finally:
+                msys.pending.discard(Unit.FOOT)
+
+        thread.join()
+        self.assertTrue(found[0] is foot)
+
+    def testConcurrentSingletons(self):
+        barrier = threading.Barrier(TestConcurrency.THREADS)
+        managers = []
+
+        def worker():
+            barrier.wait()
+            managers.append((CacheManager.instance(), MeasurementSystem.instance()))
+
+        threads = [threading.Thread(target=worker) for i in range(TestConcurrency.THREADS)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        for manager in managers:
+            self.assertTrue(manager[0] is CacheManager.instance())
+            self.assertTrue(manager[1] is MeasurementSystem.instance())
+
+    def testContextLocales(self):
+        msys = MeasurementSystem.instance()
+        localizer = Localizer.instance()
+        metre = msys.getUOM(Unit.METRE)
+        default = Localizer.getLocale()
+        name = metre.name
+
+        locales = ["de_DE", "fr_FR", "ja_JP", None]
+        barrier = threading.Barrier(len(locales))
+        seen = {}
+
+        def worker(lc):
+            # each thread has its own context
+            Localizer.setLocale(lc)
+            barrier.wait()
+            seen[lc] = (Localizer.getLocale(), localizer.getCatalog(), metre.name)
+
+        threads = [threading.Thread(target=worker, args=(lc,)) for lc in locales]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(seen[None][0], default)
+        self.assertTrue(seen[None][1] is localizer.getCatalog())
+
+        for lc in locales[:-1]:
+            self.assertEqual(seen[lc][0], lc)
+
+            # catalogs are loaded once per locale, with en_US as the fallback
+            self.assertTrue(seen[lc][1] is localizer.getCatalog(lc))
+            self.assertEqual(seen[lc][2], name)
+
+        self.assertEqual(Localizer.getLocale(), default)
+
+        with Localizer.useLocale("de_DE"):
+            self.assertEqual(Localizer.getLocale(), "de_DE")
+            self.assertEqual(localizer.langStr("m.name"), name)
+
+            token = Localizer.setLocale("fr_FR")
+            self.assertTrue(localizer.getCatalog() is localizer.getCatalog("fr_FR"))
+            Localizer.resetLocale(token)
+            self.assertEqual(Localizer.getLocale(), "de_DE")
+
+        self.assertEqual(Localizer.getLocale(), default)
+        self.assertTrue(Localizer.loadCatalog.cache_info().maxsize == Localizer.CATALOG_CACHE_SIZE)
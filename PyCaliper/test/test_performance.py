@@ -1,8 +1,12 @@
+import os
+import timeit
 import unittest
 
 from PyCaliper.uom.measurement_system import MeasurementSystem
-from PyCaliper.uom.enums import Unit
+from PyCaliper.uom.enums import Unit, UnitType
+from PyCaliper.uom.unit_of_measure import UnitOfMeasure
 from PyCaliper.uom.quantity import Quantity
+from PyCaliper.test.testing_utils import TestingUtils
 
 class TestPerformance(unittest.TestCase):
     def testPerformance(self):
@@ -60,4 +64,65 @@ class TestPerformance(unittest.TestCase):
                     _ = rowQty.uom
                     _ = str(rowQty)
 
-        
\ No newline at end of file
+        
+
+    def testCachedHash(self):
+        msys = MeasurementSystem.instance()
+        metre = msys.getUOM(Unit.METRE)
+
+        # equality of an equal copy
+        copy = UnitOfMeasure(metre.unitType, metre.name, metre.symbol, metre.description)
+        self.assertTrue(copy == metre)
+
+        # the hash is cached
+        uom = msys.createScalarUOM(UnitType.LENGTH, None, "hashed", "hashed", "")
+        uom.setConversion(3.0, metre)
+        h = hash(uom)
+        self.assertEqual(uom.hashValue, h)
+        self.assertEqual(hash(uom), h)
+        self.assertTrue(uom == uom)
+
+        # and invalidated by a new conversion
+        uom.setConversion(2.0, metre)
+        self.assertIsNone(uom.hashValue)
+        self.assertNotEqual(hash(uom), h)
+        self.assertAlmostEqual(uom.getConversionFactor(metre), 2.0, None, None, TestingUtils.DELTA6)
+
+        # and by a change of the abscissa unit's symbol or definition
+        base = msys.createScalarUOM(UnitType.LENGTH, None, "hashed_base", "hashed_base", "")
+        uom.setConversion(2.0, base)
+        h = hash(uom)
+        base.symbol = "hashed_base2"
+        self.assertIsNone(uom.hashValue)
+        self.assertNotEqual(hash(uom), h)
+
+        hash(uom)
+        base.setConversion(2.0, metre)
+        self.assertIsNone(uom.hashValue)
+
+    ##
+    # Time comparisons and hashes of the same unit of measure against an equal
+    # copy. Wall clock timings are not asserted; set PYCALIPER_BENCHMARK=1 to
+    # run it and print the timings.
+    #
+    @unittest.skipUnless(os.environ.get("PYCALIPER_BENCHMARK"), "set PYCALIPER_BENCHMARK=1 to run benchmarks")
+    def testEqualityBenchmark(self):
+        msys = MeasurementSystem.instance()
+        metre = msys.getUOM(Unit.METRE)
+        copy = UnitOfMeasure(metre.unitType, metre.name, metre.symbol, metre.description)
+
+        def compareSame():
+            for _ in range(10000):
+                metre.__eq__(metre)
+                metre.__hash__()
+
+        def compareEqual():
+            for _ in range(10000):
+                metre.__eq__(copy)
+                copy.hashValue = None
+                copy.__hash__()
+
+        same = min(timeit.repeat(compareSame, number=1, repeat=5))
+        equal = min(timeit.repeat(compareEqual, number=1, repeat=5))
+
+        print("\n10000 comparisons and hashes: same object " + str(same) + " s, equal copy " + str(equal) + " s")
@@ -1,11 +1,19 @@
+import array
+import copy
+import io
+import os
+import pickle
+import tempfile
 import unittest
 import math
 
 from PyCaliper.uom.measurement_system import MeasurementSystem
 from PyCaliper.uom.enums import Unit, UnitType, Constant
-from PyCaliper.uom.quantity import Quantity
+from PyCaliper.uom.quantity import Quantity, FrozenQuantity
+from PyCaliper.uom.quantity_formatter import QuantityFormatter
 from PyCaliper.uom.prefix import Prefix
 from PyCaliper.uom.cache_manager import CacheManager
+from PyCaliper.uom.caliper_exception import PyCaliperException
 from PyCaliper.test.testing_utils import TestingUtils
 
 class TestQuantity(unittest.TestCase): 
@@ -1151,3 +1159,333 @@ class TestQuantity(unittest.TestCase):
         density = mass.divide(volume).classify()
         self.assertTrue(density.uom.unitType == UnitType.DENSITY)
 
+
+    def testCompiledConversion(self):
+        msys = MeasurementSystem.instance()
+
+        celsius = msys.getUOM(Unit.CELSIUS)
+        fahrenheit = msys.getUOM(Unit.FAHRENHEIT)
+
+        converter = msys.compileConversion(celsius, fahrenheit)
+        self.assertAlmostEqual(converter(100.0), 212.0, None, None, TestingUtils.DELTA6)
+        self.assertAlmostEqual(converter(-40.0), -40.0, None, None, TestingUtils.DELTA6)
+
+        # same result as a quantity conversion
+        for amount in [-273.15, 0.0, 21.5, 1000.0]:
+            q = Quantity(amount, celsius).convert(fahrenheit)
+            self.assertAlmostEqual(converter(amount), q.amount, None, None, TestingUtils.DELTA6)
+
+        amounts = converter.convertAll([0.0, 100.0])
+        self.assertAlmostEqual(amounts[0], 32.0, None, None, TestingUtils.DELTA6)
+        self.assertAlmostEqual(amounts[1], 212.0, None, None, TestingUtils.DELTA6)
+
+        inverse = converter.inverse()
+        self.assertAlmostEqual(inverse(212.0), 100.0, None, None, TestingUtils.DELTA6)
+
+        # no offsets
+        km = msys.createPrefixedUOM(Prefix.kilo(), msys.getUOM(Unit.METRE))
+        converter = msys.compileConversion(msys.getUOM(Unit.MILE), km)
+        self.assertAlmostEqual(converter(1.0), 1.609344, None, None, TestingUtils.DELTA6)
+        self.assertAlmostEqual(converter.convertAll((2.0,))[0], 3.218688, None, None, TestingUtils.DELTA6)
+
+    def testFormatting(self):
+        msys = MeasurementSystem.instance()
+        kW = msys.createPrefixedUOM(Prefix.kilo(), msys.getUOM(Unit.WATT))
+        q = Quantity(1234.5, kW)
+
+        self.assertEqual(format(q), str(q))
+        self.assertEqual(format(q, ".2f"), "1234.50 kW")
+        self.assertEqual(format(q, ",.1f:symbol"), "1,234.5 kW")
+        self.assertEqual(format(q, ".0f:name"), "1234 " + kW.name)
+        self.assertEqual(format(q, "name"), "1234.5 " + kW.name)
+        self.assertEqual(format(q, ".1f:full"), "1234.5, [" + str(kW) + "] ")
+        self.assertEqual(f"{q:.3e}", "1.234e+03 kW")
+
+        # named constant
+        c = msys.getQuantity(Constant.LIGHT_VELOCITY)
+        self.assertEqual(format(c), str(c))
+        self.assertTrue(format(c, ".3e:full").endswith(c.name + ", " + c.description + ")"))
+
+        # unit of measure
+        self.assertEqual(format(kW), str(kW))
+        self.assertEqual(format(kW, "symbol"), "kW")
+        self.assertEqual(f"{kW:name}", kW.name)
+
+        with self.assertRaises(PyCaliperException):
+            format(q, ".2f:bold")
+
+        # the unit's text is rendered again after a change
+        uom = msys.createScalarUOM(UnitType.LENGTH, None, "format", "fmt", "format unit")
+        self.assertEqual(format(Quantity(1.0, uom), "name"), "1.0 format")
+        uom.name = "formatted"
+        uom.symbol = "fmtd"
+        self.assertEqual(format(Quantity(1.0, uom), "name"), "1.0 formatted")
+        self.assertEqual(format(Quantity(1.0, uom), ".1f"), "1.0 fmtd")
+        before = str(uom)
+        uom.setConversion(2.0, msys.getUOM(Unit.METRE))
+        self.assertNotEqual(str(uom), before)
+
+        # a column of amounts
+        formatter = QuantityFormatter.forSpec(".1f")
+        self.assertTrue(formatter is QuantityFormatter.forSpec(".1f"))
+        self.assertEqual(formatter.formatAmounts([1.0, 2.25], kW), ["1.0 kW", "2.2 kW"])
+        self.assertEqual(formatter.format(q), "1234.5 kW")
+
+        # the full text has no trailing separator
+        full = QuantityFormatter.forSpec(".1f:full").formatAmounts([1.0], kW)
+        self.assertEqual(full, ["1.0, [" + str(kW) + "]"])
+
+    def testStreamConversion(self):
+        msys = MeasurementSystem.instance()
+
+        celsius = msys.getUOM(Unit.CELSIUS)
+        fahrenheit = msys.getUOM(Unit.FAHRENHEIT)
+
+        # lazy
+        stream = msys.convertStream(iter([0.0, 100.0, -40.0]), celsius, fahrenheit)
+        self.assertAlmostEqual(next(stream), 32.0, None, None, TestingUtils.DELTA6)
+        self.assertEqual([round(x, 6) for x in stream], [212.0, -40.0])
+
+        # the conversion is resolved before the first amount
+        with self.assertRaises(PyCaliperException):
+            msys.convertStream([1.0], celsius, None)
+
+        # one amount per line
+        lines = io.StringIO("0\n\n100\n")
+        amounts = list(msys.convertLines(lines, celsius, fahrenheit))
+        self.assertEqual(len(amounts), 2)
+        self.assertAlmostEqual(amounts[1], 212.0, None, None, TestingUtils.DELTA6)
+
+        # CSV column
+        lines = io.StringIO("a,1.0\n\"b,c\",2.5\n")
+        amounts = list(msys.convertLines(lines, msys.getUOM(Unit.MILE), msys.getUOM(Unit.FOOT), 1))
+        self.assertAlmostEqual(amounts[0], 5280.0, None, None, TestingUtils.DELTA6)
+        self.assertAlmostEqual(amounts[1], 13200.0, None, None, TestingUtils.DELTA6)
+
+        lines = io.StringIO("1.0;x\n")
+        with self.assertRaises(PyCaliperException):
+            list(msys.convertLines(lines, celsius, fahrenheit, 1, ";"))
+
+        # a row without the column
+        lines = io.StringIO("a;1.0\nb\n")
+        converted = msys.convertLines(lines, celsius, fahrenheit, 1, ";")
+        self.assertAlmostEqual(next(converted), 33.8, None, None, TestingUtils.DELTA6)
+
+        with self.assertRaises(PyCaliperException):
+            next(converted)
+
+    def testBufferConversion(self):
+        msys = MeasurementSystem.instance()
+
+        celsius = msys.getUOM(Unit.CELSIUS)
+        fahrenheit = msys.getUOM(Unit.FAHRENHEIT)
+
+        # in place
+        amounts = array.array('d', [0.0, 100.0, -40.0])
+        self.assertEqual(msys.convertBuffer(amounts, celsius, fahrenheit), 3)
+        self.assertAlmostEqual(amounts[0], 32.0, None, None, TestingUtils.DELTA6)
+        self.assertAlmostEqual(amounts[1], 212.0, None, None, TestingUtils.DELTA6)
+        self.assertAlmostEqual(amounts[2], -40.0, None, None, TestingUtils.DELTA6)
+
+        # into a byte buffer
+        output = bytearray(24)
+        msys.convertBuffer(memoryview(amounts), fahrenheit, celsius, output)
+        self.assertAlmostEqual(memoryview(output).cast('d')[1], 100.0, None, None, TestingUtils.DELTA6)
+
+        with self.assertRaises(PyCaliperException):
+            msys.convertBuffer(bytes(8), celsius, fahrenheit)
+
+        with self.assertRaises(PyCaliperException):
+            msys.convertBuffer(bytearray(7), celsius, fahrenheit)
+
+        with self.assertRaises(PyCaliperException):
+            msys.convertBuffer(amounts, celsius, fahrenheit, bytearray(8))
+
+        # typed items other than doubles are not reinterpreted
+        floats = array.array('f', [0.0, 100.0])
+        longs = array.array('q', [0, 100])
+
+        for buffer in [floats, longs]:
+            with self.assertRaises(PyCaliperException):
+                msys.convertBuffer(buffer, celsius, fahrenheit)
+
+        self.assertEqual(list(floats), [0.0, 100.0])
+        self.assertEqual(list(longs), [0, 100])
+
+        # a file in chunks
+        fd, fileName = tempfile.mkstemp(suffix=".bin")
+        outFileName = fileName + ".out"
+
+        with os.fdopen(fd, "wb") as f:
+            f.write(array.array('d', range(10)).tobytes())
+
+        try:
+            mile = msys.getUOM(Unit.MILE)
+            foot = msys.getUOM(Unit.FOOT)
+
+            self.assertEqual(msys.convertFile(fileName, mile, foot, outFileName, 4), 10)
+            self.assertEqual(msys.convertFile(fileName, mile, foot, None, 3), 10)
+
+            for name in [fileName, outFileName]:
+                with open(name, "rb") as f:
+                    converted = array.array('d', f.read())
+
+                self.assertEqual(len(converted), 10)
+                self.assertAlmostEqual(converted[9], 9 * 5280.0, None, None, TestingUtils.DELTA6)
+
+            # a partial double is rejected before anything is converted
+            with open(fileName, "ab") as f:
+                f.write(bytes(3))
+
+            with open(fileName, "rb") as f:
+                before = f.read()
+
+            with self.assertRaises(PyCaliperException):
+                msys.convertFile(fileName, mile, foot, None, 3)
+
+            with open(fileName, "rb") as f:
+                self.assertEqual(f.read(), before)
+        finally:
+            os.remove(fileName)
+            os.remove(outFileName)
+
+    def testCompactLayout(self):
+        msys = MeasurementSystem.instance()
+        metre = msys.getUOM(Unit.METRE)
+
+        # no per-instance dictionaries
+        q = Quantity(1.0, metre)
+        self.assertFalse(hasattr(q, "__dict__"))
+        self.assertFalse(hasattr(metre, "__dict__"))
+
+        # names are only stored for named constants
+        self.assertIsNone(q.names)
+        self.assertIsNone(q.name)
+        q.symbol = None
+        self.assertIsNone(q.names)
+
+        c = msys.getQuantity(Constant.LIGHT_VELOCITY)
+        self.assertIsNotNone(c.name)
+        self.assertIsNotNone(c.symbol)
+        self.assertIsNotNone(c.description)
+        self.assertIsNone(c.multiply(q).names)
+
+        # copies and pickles
+        c = Quantity(c.amount, c.uom)
+        c.symbol = "c"
+        c2 = copy.copy(c)
+        self.assertEqual(c2.symbol, c.symbol)
+        self.assertTrue(c2.uom is c.uom)
+        c2.symbol = "c2"
+        self.assertEqual(c.symbol, "c")
+
+        uom = pickle.loads(pickle.dumps(msys.getUOM(Unit.NEWTON)))
+        self.assertEqual(uom.symbol, msys.getUOM(Unit.NEWTON).symbol)
+        self.assertAlmostEqual(uom.getConversionFactor(msys.getUOM(Unit.NEWTON)), 1.0, None, None, TestingUtils.DELTA6)
+
+    def testFrozenQuantity(self):
+        msys = MeasurementSystem.instance()
+        foot = msys.getUOM(Unit.FOOT)
+        metre = msys.getUOM(Unit.METRE)
+
+        q1 = Quantity(1.0, foot).freeze()
+        q2 = FrozenQuantity(1.0, foot)
+        self.assertTrue(isinstance(q1, Quantity))
+        self.assertTrue(q1.freeze() is q1)
+
+        # value semantics with unit of measure identity
+        self.assertEqual(q1, q2)
+        self.assertEqual(hash(q1), hash(q2))
+
+        # equal to a quantity that is not frozen, with the same hash
+        q3 = Quantity(q1.amount, q1.uom)
+        self.assertEqual(q3, q1)
+        self.assertEqual(hash(q3), hash(q1))
+        self.assertTrue(q3 in {q1})
+        self.assertTrue(q1 in {q3})
+
+        # equality with a plain quantity is exact, so that it is transitive
+        close = Quantity(1.0 + 1.0E-12, foot)
+        self.assertEqual(close, q3)
+        self.assertNotEqual(q1, close)
+        self.assertNotEqual(close, q1)
+
+        sameFoot = msys.createScalarUOM(UnitType.LENGTH, None, "ft_frozen", "ft_frozen", "")
+        sameFoot.setConversion(foot.scalingFactor, foot.abscissaUnit)
+        self.assertEqual(Quantity(1.0, sameFoot), q3)
+        self.assertNotEqual(Quantity(1.0, sameFoot), q1)
+        self.assertNotEqual(q1, Quantity(1.0, sameFoot))
+        self.assertFalse(q1 == 1.0)
+        self.assertNotEqual(q1, FrozenQuantity(2.0, foot))
+        self.assertNotEqual(q1, FrozenQuantity(1.0, metre))
+        self.assertEqual(len({q1, q2, FrozenQuantity(0.3048, metre)}), 2)
+        self.assertEqual(copy.copy(q1), q1)
+
+        # immutable
+        with self.assertRaises(PyCaliperException):
+            q1.amount = 2.0
+
+        with self.assertRaises(PyCaliperException):
+            q1.name = "foot"
+
+        # still a quantity
+        self.assertAlmostEqual(q1.convert(metre).amount, 0.3048, None, None, TestingUtils.DELTA6)
+        self.assertAlmostEqual(q1.add(q2).amount, 2.0, None, None, TestingUtils.DELTA6)
+
+        # canonical keys across measurement systems and offsets
+        self.assertEqual(q1.getCanonicalKey(), FrozenQuantity(0.3048, metre).getCanonicalKey())
+        self.assertEqual(q1.getCanonicalKey(), FrozenQuantity(12.0, msys.getUOM(Unit.INCH)).getCanonicalKey())
+        self.assertNotEqual(q1.getCanonicalKey(), FrozenQuantity(1.0, metre).getCanonicalKey())
+
+        freezing = FrozenQuantity(32.0, msys.getUOM(Unit.FAHRENHEIT)).getCanonicalKey()
+        self.assertEqual(freezing, FrozenQuantity(0.0, msys.getUOM(Unit.CELSIUS)).getCanonicalKey())
+        self.assertEqual(freezing, FrozenQuantity(273.15, msys.getUOM(Unit.KELVIN)).getCanonicalKey())
+
+        # offsets further down the path, e.g. a unit of two degrees Celsius
+        twoCelsius = msys.createScalarUOM(UnitType.TEMPERATURE, None, "2°C", "2°C", "")
+        twoCelsius.setConversion(2.0, msys.getUOM(Unit.CELSIUS))
+        key = FrozenQuantity(5.0, twoCelsius).getCanonicalKey()
+        self.assertEqual(key, FrozenQuantity(10.0, msys.getUOM(Unit.CELSIUS)).getCanonicalKey())
+        self.assertEqual(key, FrozenQuantity(283.15, msys.getUOM(Unit.KELVIN)).getCanonicalKey())
+        self.assertEqual(FrozenQuantity(0.0, twoCelsius).getCanonicalKey(), freezing)
+
+        # and the offset of a bridge
+        bridged = msys.createScalarUOM(UnitType.TEMPERATURE, None, "bridged°", "bridged°", "")
+        bridged.setBridgeConversion(1.0, msys.getUOM(Unit.KELVIN), 273.15)
+        self.assertEqual(FrozenQuantity(0.0, bridged).getCanonicalKey(), freezing)
+
+        psi = FrozenQuantity(1.0, msys.getUOM(Unit.PSI)).getCanonicalKey()
+        self.assertEqual(psi, Quantity(1.0, msys.getUOM(Unit.PSI)).convert(msys.getUOM(Unit.PASCAL)).freeze().getCanonicalKey())
+
+        # named constants keep their names
+        c = msys.getQuantity(Constant.LIGHT_VELOCITY).freeze()
+        self.assertEqual(c.symbol, msys.getQuantity(Constant.LIGHT_VELOCITY).symbol)
+
+    def testCachedConstants(self):
+        msys = MeasurementSystem.instance()
+
+        for constant in Constant:
+            c = msys.getQuantity(constant)
+
+            # created once and immutable
+            self.assertTrue(isinstance(c, FrozenQuantity))
+            self.assertTrue(msys.getQuantity(constant) is c)
+            self.assertTrue(CacheManager.instance().getConstant(constant) is c)
+
+        eps0 = msys.getQuantity(Constant.ELECTRIC_PERMITTIVITY)
+        amount = eps0.amount
+
+        with self.assertRaises(PyCaliperException):
+            eps0.amount = 1.0
+
+        self.assertEqual(msys.getQuantity(Constant.ELECTRIC_PERMITTIVITY).amount, amount)
+
+        # derived units of measure are interned
+        vc = msys.getQuantity(Constant.LIGHT_VELOCITY)
+        self.assertTrue(vc.multiply(vc).uom is vc.multiply(vc).uom)
+
+        # recreated after the cache is cleared
+        CacheManager.instance().clearCache()
+        c = msys.getQuantity(Constant.LIGHT_VELOCITY)
+        self.assertFalse(c is vc)
+        self.assertTrue(c.uom is msys.getUOM(Unit.METRE_PER_SEC))
@@ -0,0 +1,106 @@
+import unittest
+
+from PyCaliper.uom.measurement_system import MeasurementSystem
+from PyCaliper.uom.enums import Unit
+from PyCaliper.uom.prefix import Prefix
+from PyCaliper.uom.quantity import Quantity
+from PyCaliper.uom.caliper_exception import PyCaliperException
+from PyCaliper.test.testing_utils import TestingUtils
+
+try:
+    import numpy
+    from PyCaliper.uom.quantity_array import QuantityArray
+except ImportError:
+    numpy = None
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestQuantityArray(unittest.TestCase):
+    def testConvert(self):
+        msys = MeasurementSystem.instance()
+
+        celsius = msys.getUOM(Unit.CELSIUS)
+        fahrenheit = msys.getUOM(Unit.FAHRENHEIT)
+
+        amounts = [-40.0, 0.0, 37.0, 100.0]
+        qa = QuantityArray(amounts, celsius)
+        self.assertEqual(len(qa), 4)
+
+        converted = qa.convert(fahrenheit)
+        self.assertTrue(converted.uom == fahrenheit)
+
+        # each converted amount matches the scalar conversion
+        for i in range(len(amounts)):
+            expected = Quantity(amounts[i], celsius).convert(fahrenheit)
+            self.assertAlmostEqual(converted.amounts[i], expected.amount, None, None, TestingUtils.DELTA6)
+
+        self.assertAlmostEqual(converted.amounts[0], -40.0, None, None, TestingUtils.DELTA6)
+        self.assertAlmostEqual(converted.amounts[3], 212.0, None, None, TestingUtils.DELTA6)
+
+        # round trip
+        back = converted.convert(celsius)
+        self.assertTrue(numpy.allclose(back.amounts, amounts))
+
+        # the source is not modified
+        self.assertTrue(numpy.array_equal(qa.amounts, amounts))
+
+        # quantity access
+        q = converted[3]
+        self.assertAlmostEqual(q.amount, 212.0, None, None, TestingUtils.DELTA6)
+        self.assertTrue(q.uom == fahrenheit)
+
+    def testArithmetic(self):
+        msys = MeasurementSystem.instance()
+
+        m = msys.getUOM(Unit.METRE)
+        cm = msys.createPrefixedUOM(Prefix.centi(), m)
+        s = msys.getSecond()
+
+        q1 = QuantityArray([1.0, 2.0, 3.0], m)
+        q2 = QuantityArray([100.0, 200.0, 300.0], cm)
+
+        total = q1.add(q2)
+        self.assertTrue(total.uom == m)
+        self.assertTrue(numpy.allclose(total.amounts, [2.0, 4.0, 6.0]))
+
+        diff = total.subtract(q2)
+        self.assertTrue(numpy.allclose(diff.amounts, [1.0, 2.0, 3.0]))
+
+        # with a scalar quantity
+        total = q1.add(Quantity(50.0, cm))
+        self.assertTrue(numpy.allclose(total.amounts, [1.5, 2.5, 3.5]))
+
+        area = q1.multiply(q1)
+        self.assertTrue(numpy.allclose(area.amounts, [1.0, 4.0, 9.0]))
+        self.assertTrue(area.uom.getBaseSymbol() == msys.getUOM(Unit.SQUARE_METRE).getBaseSymbol())
+
+        velocity = q1.divide(Quantity(2.0, s))
+        self.assertTrue(numpy.allclose(velocity.amounts, [0.5, 1.0, 1.5]))
+        factor = velocity.uom.getConversionFactor(msys.getUOM(Unit.METRE_PER_SEC))
+        self.assertAlmostEqual(factor, 1.0, None, None, TestingUtils.DELTA6)
+
+        inverted = velocity.invert()
+        self.assertTrue(numpy.allclose(inverted.amounts, [2.0, 1.0, 2.0 / 3.0]))
+
+        with self.assertRaises(PyCaliperException):
+            q1.divide(QuantityArray([1.0, 0.0, 1.0], s))
+
+        with self.assertRaises(PyCaliperException):
+            QuantityArray([1.0, 0.0], s).invert()
+
+    def testQuantities(self):
+        msys = MeasurementSystem.instance()
+
+        ft = msys.getUOM(Unit.FOOT)
+        inch = msys.getUOM(Unit.INCH)
+
+        qa = QuantityArray.fromQuantities([Quantity(1.0, ft), Quantity(24.0, inch)])
+        self.assertTrue(qa.uom == ft)
+        self.assertTrue(numpy.allclose(qa.amounts, [1.0, 2.0]))
+
+        # the unit of measure is taken from the first quantity
+        with self.assertRaisesRegex(PyCaliperException, "empty"):
+            QuantityArray.fromQuantities([])
+
+        quantities = qa.convert(inch).toQuantities()
+        self.assertEqual(len(quantities), 2)
+        self.assertAlmostEqual(quantities[1].amount, 24.0, None, None, TestingUtils.DELTA6)
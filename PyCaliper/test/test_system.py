@@ -1,8 +1,15 @@
+import gc
+import os
+import tempfile
 import unittest
 import uuid
 
 from PyCaliper.uom.measurement_system import MeasurementSystem
-from PyCaliper.uom.enums import Unit, UnitType, Constant
+from PyCaliper.uom.enums import Unit, UnitType, Constant, MeasurementType
+from PyCaliper.uom.unit_definition import UnitDefinition, STANDARD_DEFINITIONS
+from PyCaliper.uom.caliper_exception import PyCaliperException
+from PyCaliper.test.testing_utils import TestingUtils
+from PyCaliper.uom.cache_manager import CacheManager
 
 class TestSystem(unittest.TestCase):
     def testUnifiedSystem(self):
@@ -76,3 +83,276 @@ class TestSystem(unittest.TestCase):
             
             if (unitType != UnitType.UNCLASSIFIED):
                 self.assertTrue(len(uoms) > 0)
+
+    def testUnitDefinitions(self):
+        msys = MeasurementSystem.instance()
+
+        # every unit is defined
+        for unit in Unit:
+            self.assertIsNotNone(msys.getUnitDefinition(unit))
+            self.assertTrue(msys.getUOM(unit).unit == unit)
+
+        definition = msys.getUnitDefinition(Unit.MINUTE)
+        self.assertTrue(definition.unitType == UnitType.TIME)
+        self.assertTrue(definition.abscissaUnit == Unit.SECOND)
+        self.assertAlmostEqual(definition.scalingFactor, 60.0, None, None, TestingUtils.DELTA6)
+
+        # override a definition from data
+        carat = msys.getUOM(Unit.CARAT)
+
+        try:
+            msys.defineUnits({"CARAT": {"unitType": "MASS", "name": "carat", "symbol": "ct_def", "description": "test",
+                                        "scalingFactor": 200.0, "abscissaUnit": "GRAM"}})
+            defined = msys.getUOM(Unit.CARAT)
+            self.assertFalse(defined is carat)
+            self.assertTrue(defined.symbol == "ct_def")
+            self.assertTrue(msys.getUOMBySymbol("ct_def") is defined)
+            self.assertAlmostEqual(defined.getConversionFactor(msys.getUOM(Unit.GRAM)), 200.0, None, None, TestingUtils.DELTA6)
+        finally:
+            msys.defineUnit(Unit.CARAT, STANDARD_DEFINITIONS[Unit.CARAT])
+
+        self.assertTrue(msys.getUOM(Unit.CARAT).symbol == carat.symbol)
+        self.assertAlmostEqual(msys.getUOM(Unit.CARAT).getConversionFactor(msys.getUOM(Unit.GRAM)), 0.2, None, None, TestingUtils.DELTA6)
+
+        # references by symbol
+        definition = UnitDefinition.fromDict({"unitType": "VELOCITY", "measurementType": "QUOTIENT", "name": "metre per second",
+                                              "symbol": "m/s_def", "description": "", "uom1": "m", "uom2": "SECOND"})
+        self.assertTrue(definition.measurementType == MeasurementType.QUOTIENT)
+        self.assertTrue(definition.uom2 == Unit.SECOND)
+        self.assertTrue(msys.resolveReference(definition.uom1) is msys.getUOM(Unit.METRE))
+
+        with self.assertRaises(PyCaliperException):
+            msys.resolveReference("not_a_symbol")
+
+    def testPreload(self):
+        msys = MeasurementSystem.instance()
+        cacheManager = CacheManager.instance()
+
+        elapsed = msys.preload()
+        self.assertTrue(elapsed >= 0.0)
+
+        for unit in Unit:
+            uom = cacheManager.getUOMByUnit(unit)
+            self.assertIsNotNone(uom)
+            self.assertIsNotNone(uom.reducer)
+
+        # conversions within a unit type are cached
+        cacheManager.resetConversionStatistics()
+        msys.getUOM(Unit.US_GALLON).getConversionFactor(msys.getUOM(Unit.LITRE))
+        msys.getUOM(Unit.MILE).getConversionFactor(msys.getUOM(Unit.METRE))
+        stats = cacheManager.getConversionStatistics()
+        self.assertTrue(stats["hits"] == 2)
+        self.assertTrue(stats["misses"] == 0)
+
+    def testSnapshot(self):
+        msys = MeasurementSystem.instance()
+        cacheManager = CacheManager.instance()
+        msys.preload()
+
+        foot = msys.getUOM(Unit.FOOT)
+        factor = msys.getUOM(Unit.MILE).getConversionFactor(msys.getUOM(Unit.METRE))
+
+        fd, fileName = tempfile.mkstemp(suffix=".snapshot")
+        os.close(fd)
+
+        try:
+            cacheManager.saveSnapshot(fileName)
+            cacheManager.loadSnapshot(fileName)
+
+            # restored copies of the units of measure
+            restored = msys.getUOM(Unit.FOOT)
+            self.assertFalse(restored is foot)
+            self.assertTrue(restored.symbol == foot.symbol)
+            self.assertTrue(restored.getBaseSymbol() == foot.getBaseSymbol())
+            self.assertTrue(restored.bridgeAbscissaUnit is msys.getUOM(Unit.METRE))
+            self.assertTrue(msys.getUOMBySymbol(foot.symbol) is restored)
+
+            # conversion factors are restored
+            cacheManager.resetConversionStatistics()
+            mile = msys.getUOM(Unit.MILE)
+            self.assertAlmostEqual(mile.getConversionFactor(msys.getUOM(Unit.METRE)), factor, None, None, TestingUtils.DELTA6)
+            self.assertTrue(cacheManager.getConversionStatistics()["hits"] == 1)
+
+            # the restored units of measure are still invalidated when changed
+            a = msys.createScalarUOM(UnitType.LENGTH, None, "a_snap", "a_snap", "")
+            a.setConversion(2.0, mile)
+            self.assertAlmostEqual(a.getConversionFactor(msys.getUOM(Unit.METRE)), 2.0 * factor, None, None, TestingUtils.DELTA6)
+
+            # wrong version
+            with open(fileName, "r+b") as f:
+                f.write(CacheManager.SNAPSHOT_HEADER.pack(CacheManager.SNAPSHOT_MAGIC, CacheManager.SNAPSHOT_VERSION + 1))
+
+            with self.assertRaises(PyCaliperException):
+                cacheManager.loadSnapshot(fileName)
+
+            # not a snapshot
+            with open(fileName, "wb") as f:
+                f.write(b"not a snapshot file")
+
+            with self.assertRaises(PyCaliperException):
+                cacheManager.loadSnapshot(fileName)
+        finally:
+            os.remove(fileName)
+
+    def testFreeze(self):
+        msys = MeasurementSystem.instance()
+        metre = msys.getUOM(Unit.METRE)
+        foot = msys.getUOM(Unit.FOOT)
+
+        try:
+            self.assertTrue(msys.freeze() >= 0.0)
+            self.assertTrue(gc.get_freeze_count() > 0)
+            self.assertTrue(foot.frozen)
+
+            # lookups and conversions work
+            self.assertTrue(msys.getUOM(Unit.FOOT) is foot)
+            self.assertAlmostEqual(foot.getConversionFactor(metre), 0.3048, None, None, TestingUtils.DELTA6)
+
+            # cached lookups are not recorded
+            cacheManager = CacheManager.instance()
+            stats = cacheManager.getConversionStatistics()
+            self.assertAlmostEqual(foot.getConversionFactor(metre), 0.3048, None, None, TestingUtils.DELTA6)
+            self.assertEqual(cacheManager.getConversionStatistics()["hits"], stats["hits"])
+            self.assertTrue(cacheManager.conversionRegistry.snapshot is not None)
+
+            # frozen units cannot be changed
+            with self.assertRaises(PyCaliperException):
+                foot.setConversion(2.0, metre)
+
+            with self.assertRaises(PyCaliperException):
+                foot.scalingFactor = 2.0
+
+            with self.assertRaises(PyCaliperException):
+                foot.symbol = "foot_frozen"
+
+            with self.assertRaises(PyCaliperException):
+                foot.name = "foot_frozen"
+
+            with self.assertRaises(PyCaliperException):
+                foot.unitType = UnitType.AREA
+
+            with self.assertRaises(PyCaliperException):
+                foot.offset = 1.0
+
+            with self.assertRaises(PyCaliperException):
+                foot.bridgeScalingFactor = 2.0
+
+            with self.assertRaises(PyCaliperException):
+                foot.category = "frozen"
+
+            self.assertEqual(foot.symbol, "ft")
+
+            # the caches are computed before freezing, so reads do not write
+            self.assertTrue(foot.hashValue is not None)
+            self.assertTrue(foot.texts is not None)
+            self.assertTrue(foot.reducer is not None)
+            self.assertTrue(foot.dimension is not None)
+            texts = foot.texts
+            reducer = foot.reducer
+            str(foot)
+            hash(foot)
+            foot.getDimension()
+            self.assertTrue(foot.texts is texts)
+            self.assertTrue(foot.getReducer() is reducer)
+
+            with self.assertRaises(PyCaliperException):
+                msys.defineUnit(Unit.FOOT, STANDARD_DEFINITIONS[Unit.FOOT])
+
+            self.assertAlmostEqual(foot.getConversionFactor(metre), 0.3048, None, None, TestingUtils.DELTA6)
+
+            # new units of measure can still be created
+            a = msys.createScalarUOM(UnitType.LENGTH, None, "a_frozen", "a_frozen", "")
+            a.setConversion(2.0, foot)
+            self.assertAlmostEqual(a.getConversionFactor(metre), 0.6096, None, None, TestingUtils.DELTA6)
+        finally:
+            msys.unfreeze()
+
+        self.assertFalse(foot.frozen)
+        self.assertTrue(CacheManager.instance().conversionRegistry.snapshot is None)
+
+    def testParseUOM(self):
+        msys = MeasurementSystem.instance()
+
+        # registered symbols
+        self.assertTrue(msys.parseUOM("m/s") is msys.getUOM(Unit.METRE_PER_SEC))
+        self.assertTrue(msys.parseUOM("us fl oz") is msys.getUOM(Unit.US_FLUID_OUNCE))
+
+        # expressions
+        uom = msys.parseUOM("kg·m/s²")
+        self.assertEqual(uom.unitType, UnitType.FORCE)
+        self.assertAlmostEqual(uom.getConversionFactor(msys.getUOM(Unit.NEWTON)), 1.0, None, None, TestingUtils.DELTA6)
+
+        uom = msys.parseUOM("kW·h")
+        self.assertEqual(uom.unitType, UnitType.ENERGY)
+        self.assertAlmostEqual(uom.getConversionFactor(msys.getUOM(Unit.JOULE)), 3.6E+06, None, None, TestingUtils.DELTA6)
+
+        uom = msys.parseUOM("m3/h")
+        self.assertEqual(uom.unitType, UnitType.VOLUMETRIC_FLOW)
+        factor = uom.getConversionFactor(msys.getUOM(Unit.CUBIC_METRE_PER_SEC))
+        self.assertAlmostEqual(factor, 1.0 / 3600.0, None, None, TestingUtils.DELTA6)
+
+        uom = msys.parseUOM("lbf/in^2")
+        self.assertEqual(uom.unitType, UnitType.PRESSURE)
+        self.assertAlmostEqual(uom.getConversionFactor(msys.getUOM(Unit.PSI)), 1.0, None, None, TestingUtils.DELTA6)
+
+        uom = msys.parseUOM("kg/(m·s)")
+        self.assertEqual(uom.getBaseSymbol(), "kg/(m·s)")
+        self.assertAlmostEqual(uom.getConversionFactor(msys.parseUOM("Pa·s")), 1.0, None, None, TestingUtils.DELTA6)
+
+        # same unit of measure from the cache
+        self.assertTrue(msys.parseUOM("kg/(m·s)") is uom)
+        self.assertTrue(CacheManager.instance().getParsedUOM("kg/(m·s)") is uom)
+
+        # grouping is kept, although the generated symbols are the same
+        grouped = msys.parseUOM("(kg/m)·s")
+        self.assertFalse(grouped is uom)
+        self.assertEqual(grouped.getBaseSymbol(), "kg·s/m")
+        self.assertTrue(msys.parseUOM("kg/m·s") is grouped)
+        self.assertTrue(msys.parseUOM("kg/(m·s)") is uom)
+        self.assertEqual(uom.getBaseSymbol(), "kg/(m·s)")
+
+        # exponents are limited
+        self.assertEqual(msys.parseUOM("m^64").getDimension().exponents, msys.parseUOM("m^32·m^32").getDimension().exponents)
+
+        # malformed
+        for expression in ["kg/(m", "m//s", "m^x", "not_a_unit", "", "m^65", "m^10000000", "m100000", "s^-1000"]:
+            with self.assertRaises(PyCaliperException):
+                msys.parseUOM(expression)
+
+    def testQuantitiesFromStrings(self):
+        msys = MeasurementSystem.instance()
+        metre = msys.getUOM(Unit.METRE)
+        foot = msys.getUOM(Unit.FOOT)
+
+        # a unit for each amount
+        batch = msys.quantitiesFromStrings(["1.5", "x", "3", "4", None, "2", "-2.5E+01"],
+                                           ["m", "m", "kW·h", Unit.FOOT, "ft", "not_a_unit", metre])
+
+        self.assertEqual(len(batch), 7)
+        self.assertFalse(batch.isValid())
+        self.assertEqual([error[0] for error in batch.errors], [1, 4, 5])
+        self.assertEqual(len(batch.getUOMs()), 3)
+
+        self.assertEqual(list(batch.getAmounts(metre)), [1.5, -25.0])
+        self.assertEqual(list(batch.getIndexes(metre)), [0, 6])
+        self.assertEqual(list(batch.getAmounts(foot)), [4.0])
+        self.assertEqual(list(batch.getIndexes(foot)), [3])
+        self.assertEqual(list(batch.getAmounts(msys.parseUOM("kW·h"))), [3.0])
+
+        # one unit for all of the amounts
+        batch = msys.quantitiesFromStrings(["1", "2", "bad", "4"], Unit.METRE)
+        self.assertEqual(list(batch.getAmounts(metre)), [1.0, 2.0, 4.0])
+        self.assertEqual(list(batch.getIndexes(metre)), [0, 1, 3])
+        self.assertEqual(batch.errors[0][0], 2)
+
+        batch = msys.quantitiesFromStrings(("1", "2"), "m")
+        self.assertTrue(batch.isValid())
+        self.assertEqual(batch.getAmounts(metre).typecode, 'd')
+
+        # every row has an unknown unit
+        batch = msys.quantitiesFromStrings(["1", "2"], "not_a_unit")
+        self.assertEqual([error[0] for error in batch.errors], [0, 1])
+        self.assertEqual(len(batch.getUOMs()), 0)
+
+        with self.assertRaises(PyCaliperException):
+            msys.quantitiesFromStrings(["1", "2"], ["m"])
@@ -7,6 +7,7 @@ from PyCaliper.uom.quantity import Quantity
 from PyCaliper.test.testing_utils import TestingUtils
 from PyCaliper.uom.cache_manager import CacheManager
 from PyCaliper.uom.unit_of_measure import Reducer, UnitOfMeasure
+from PyCaliper.uom.localizer import Localizer
 
 class TestUnits(unittest.TestCase):
     def testBaseUnits(self):
@@ -41,6 +42,157 @@ class TestUnits(unittest.TestCase):
             self.assertTrue(len(str(prefix)) > 0)
             fromName = Prefix.fromName(prefix.name)
             self.assertTrue(fromName == prefix)
+
+    def testPrefixLookup(self):
+        self.assertEqual(len(Prefix.getPrefixes()), 23)
+
+        for prefix in Prefix.getPrefixes():
+            self.assertTrue(Prefix.fromName(prefix.name) is prefix)
+            self.assertTrue(Prefix.fromSymbol(prefix.symbol) is prefix)
+            self.assertTrue(Prefix.fromFactor(prefix.factor) is prefix)
+
+        self.assertTrue(Prefix.fromFactor(1.0E-24) is Prefix.yocto())
+        self.assertTrue(Prefix.fromFactor(1024.0) is Prefix.kibi())
+        self.assertIsNone(Prefix.fromFactor(1.0))
+        self.assertIsNone(Prefix.fromName("none"))
+
+        # best prefix for a magnitude
+        self.assertTrue(Prefix.bestPrefix(1000.0) is Prefix.kilo())
+        self.assertTrue(Prefix.bestPrefix(0.5) is Prefix.milli())
+        self.assertTrue(Prefix.bestPrefix(1.0E+30) is Prefix.yotta())
+        self.assertTrue(Prefix.bestPrefix(2047.0, True) is Prefix.kibi())
+        self.assertIsNone(Prefix.bestPrefix(999.0))
+        self.assertIsNone(Prefix.bestPrefix(0.0))
+        self.assertIsNone(Prefix.bestPrefix(0.5, True))
+
+    def testAutoScale(self):
+        msys = MeasurementSystem.instance()
+        byte = msys.getUOM(Unit.BYTE)
+        metre = msys.getUOM(Unit.METRE)
+
+        q = msys.autoScale(Quantity(3221225472.0, byte), True)
+        self.assertAlmostEqual(q.amount, 3.0, None, None, TestingUtils.DELTA6)
+        self.assertTrue(q.uom is msys.createPrefixedUOM(Prefix.gibi(), byte))
+        self.assertAlmostEqual(q.convert(byte).amount, 3221225472.0, None, None, TestingUtils.DELTA6)
+
+        q = msys.autoScale(Quantity(-1.5E+07, metre))
+        self.assertAlmostEqual(q.amount, -15.0, None, None, TestingUtils.DELTA6)
+        self.assertEqual(q.uom.symbol, "Mm")
+
+        q = Quantity(12.0, metre)
+        self.assertTrue(msys.autoScale(q) is q)
+
+        # one prefix for all of the amounts
+        amounts, uom = msys.autoScaleAmounts([0.001, 0.0025], msys.getUOM(Unit.SECOND))
+        self.assertEqual(uom.symbol, "ms")
+        self.assertAlmostEqual(amounts[1], 2.5, None, None, TestingUtils.DELTA6)
+
+        amounts, uom = msys.autoScaleAmounts([1024.0, 5.0E+06], byte, True)
+        self.assertTrue(uom is msys.createPrefixedUOM(Prefix.mebi(), byte))
+        self.assertAlmostEqual(amounts[0], 1.0 / 1024.0, None, None, TestingUtils.DELTA6)
+
+        amounts, uom = msys.autoScaleAmounts([], byte)
+        self.assertTrue(uom is byte)
+
+        # a prefixed unit is scaled from its unprefixed unit
+        kB = msys.createPrefixedUOM(Prefix.kilo(), byte)
+        q = msys.autoScale(Quantity(1500.0, kB))
+        self.assertAlmostEqual(q.amount, 1.5, None, None, TestingUtils.DELTA6)
+        self.assertTrue(q.uom is msys.createPrefixedUOM(Prefix.mega(), byte))
+
+        q = msys.autoScale(Quantity(0.5, kB))
+        self.assertAlmostEqual(q.amount, 500.0, None, None, TestingUtils.DELTA6)
+        self.assertTrue(q.uom is byte)
+
+        km = msys.createPrefixedUOM(Prefix.kilo(), metre)
+        q = msys.autoScale(Quantity(2.0, km))
+        self.assertEqual(q.uom.symbol, "km")
+
+        amounts, uom = msys.autoScaleAmounts([1500.0, 2500.0], kB)
+        self.assertEqual(uom.symbol, "MB")
+        self.assertAlmostEqual(amounts[1], 2.5, None, None, TestingUtils.DELTA6)
+
+        amounts, uom = msys.autoScaleAmounts([0.25, 0.5], kB)
+        self.assertTrue(uom is byte)
+        self.assertAlmostEqual(amounts[0], 250.0, None, None, TestingUtils.DELTA6)
+
+    def testPrefixedUOMCache(self):
+        msys = MeasurementSystem.instance()
+        watt = msys.getUOM(Unit.WATT)
+
+        kW = msys.createPrefixedUOM(Prefix.kilo(), watt)
+        self.assertTrue(msys.createPrefixedUOM(Prefix.kilo(), watt) is kW)
+        self.assertTrue(msys.getUOMBySymbol("kW") is kW)
+        self.assertTrue(msys.quantityFromPrefixedUnit(2.0, Prefix.kilo(), Unit.WATT).uom is kW)
+        self.assertAlmostEqual(kW.getConversionFactor(watt), 1000.0, None, None, TestingUtils.DELTA6)
+
+        # convert to a prefixed unit
+        q = msys.convertQuantityToPrefixUnit(Quantity(1500.0, watt), Prefix.kilo(), Unit.WATT)
+        self.assertTrue(q.uom is kW)
+        self.assertAlmostEqual(q.amount, 1.5, None, None, TestingUtils.DELTA6)
+
+        # every SI prefix for several units
+        units = [Unit.WATT, msys.getUOM(Unit.JOULE), Unit.PASCAL]
+        prefixed = msys.createPrefixedUOMs(units)
+        self.assertEqual(len(prefixed), 3)
+
+        for uoms in prefixed:
+            self.assertEqual(len(uoms), 20)
+            self.assertTrue(Prefix.kibi() not in uoms)
+
+        self.assertTrue(prefixed[0][Prefix.kilo()] is kW)
+        self.assertEqual(prefixed[1][Prefix.milli()].symbol, "mJ")
+        self.assertAlmostEqual(prefixed[2][Prefix.mega()].getConversionFactor(msys.getUOM(Unit.PASCAL)), 1.0E+06, None, None, TestingUtils.DELTA6)
+
+        prefixed = msys.createPrefixedUOMs([Unit.BYTE], [Prefix.kibi(), Prefix.mebi()])
+        self.assertEqual(prefixed[0][Prefix.mebi()].symbol, "MiB")
+
+        # the cache is bounded, and an evicted unit is found again by its symbol
+        registry = CacheManager.instance().prefixedRegistry
+        maxSize = registry.maxSize
+        try:
+            registry.resize(5)
+            msys.createPrefixedUOMs(units)
+            self.assertTrue(len(registry) <= 5)
+            self.assertTrue(msys.createPrefixedUOM(Prefix.kilo(), watt) is kW)
+        finally:
+            registry.resize(maxSize)
+
+    def testLazyLocalization(self):
+        msys = MeasurementSystem.instance()
+        localizer = Localizer.instance()
+        metre = msys.getUOM(Unit.METRE)
+
+        # the name and description are looked up when they are read
+        self.assertIsNone(metre.nameText)
+        self.assertIsNone(metre.descriptionText)
+        self.assertEqual(metre.name, localizer.langStr(metre.textKey + ".name"))
+        self.assertEqual(metre.description, localizer.langStr(metre.textKey + ".desc"))
+        self.assertEqual(metre.symbol, localizer.langStr(metre.textKey + ".symbol"))
+        self.assertEqual(msys.getDefinedSymbols()[Unit.METRE], metre.symbol)
+        self.assertEqual(metre.category, localizer.langStr("default.category.text"))
+
+        km = msys.createPrefixedUOM(Prefix.kilo(), metre)
+        self.assertIsNone(km.nameText)
+        self.assertEqual(km.name, "kilo" + metre.name)
+        self.assertEqual(km.description, "1000.0 " + metre.name)
+
+        # set explicitly
+        uom = msys.createScalarUOM(UnitType.LENGTH, None, "lazy", "lazy", "lazy unit")
+        self.assertIsNone(uom.textKey)
+        self.assertEqual(uom.name, "lazy")
+        self.assertEqual(msys.createPrefixedUOM(Prefix.kilo(), uom).name, "kilolazy")
+
+        # named constants
+        c = msys.getQuantity(Constant.LIGHT_VELOCITY)
+        self.assertEqual(c.name, localizer.langStr("light.name"))
+        self.assertEqual(c.symbol, localizer.langStr("light.symbol"))
+
+        q = Quantity(c.amount, c.uom)
+        q.setTextKey("light")
+        q.description = "c"
+        self.assertEqual(q.name, localizer.langStr("light.name"))
+        self.assertEqual(q.description, "c")
             
     def testExceptions(self):
         msys = MeasurementSystem.instance()
@@ -474,6 +626,20 @@ class TestUnits(unittest.TestCase):
         u = u.multiply(velocity)
         self.assertTrue(u.getBaseSymbol() == msys.getOne().getBaseSymbol())
 
+    def testPowerInDivisor(self):
+        msys = MeasurementSystem.instance()
+
+        # the square inch is divided out of a pound force per square inch
+        inch = msys.getUOM(Unit.INCH)
+        in2 = msys.createPowerUOM(UnitType.AREA, None, "square inch", "in2_divisor", "", inch, 2)
+        psi = msys.createQuotientUOM(UnitType.PRESSURE, None, "psi", "psi_divisor", "", msys.getUOM(Unit.POUND_FORCE), in2)
+
+        bd = psi.getConversionFactor(msys.getUOM(Unit.PASCAL))
+        self.assertAlmostEqual(bd, 6894.757293168361, None, None, TestingUtils.DELTA6)
+
+        bd = psi.getConversionFactor(msys.getUOM(Unit.PSI))
+        self.assertAlmostEqual(bd, 1.0, None, None, TestingUtils.DELTA6)
+
     def testImperialUnits(self):
         msys = MeasurementSystem.instance()
 
@@ -793,3 +959,178 @@ class TestUnits(unittest.TestCase):
         self.assertTrue(symbol == sym)
 
         self.assertTrue(msys.getUOM(Unit.KATAL).getBaseSymbol() == "mol/s")
+
+    def testCachedReductions(self):
+        msys = MeasurementSystem.instance()
+
+        a = msys.createScalarUOM(UnitType.UNCLASSIFIED, None, "a_cache", "a_cache", "")
+        b = msys.createScalarUOM(UnitType.UNCLASSIFIED, None, "b_cache", "b_cache", "")
+        c = msys.createScalarUOM(UnitType.UNCLASSIFIED, None, "c_cache", "c_cache", "")
+        a.setConversion(2.0, b)
+
+        aPerSec = msys.createQuotientUOM(UnitType.UNCLASSIFIED, None, "a_cache/s", "a_cache/s", "", a, msys.getSecond())
+        self.assertTrue(aPerSec.getReducer() is aPerSec.getReducer())
+        self.assertAlmostEqual(aPerSec.getReducer().mapScalingFactor, 2.0, None, None, TestingUtils.DELTA6)
+
+        # changing the definition of an operand invalidates the dependent
+        a.setConversion(3.0, c)
+        self.assertAlmostEqual(aPerSec.getReducer().mapScalingFactor, 3.0, None, None, TestingUtils.DELTA6)
+        self.assertTrue(c in aPerSec.getBaseUnitsOfMeasure())
+        self.assertFalse(b in aPerSec.getBaseUnitsOfMeasure())
+
+        cPerSec = msys.createQuotientUOM(UnitType.UNCLASSIFIED, None, "c_cache/s", "c_cache/s", "", c, msys.getSecond())
+        self.assertAlmostEqual(aPerSec.getConversionFactor(cPerSec), 3.0, None, None, TestingUtils.DELTA6)
+
+        a.setConversion(4.0, c)
+        self.assertAlmostEqual(aPerSec.getConversionFactor(cPerSec), 4.0, None, None, TestingUtils.DELTA6)
+
+        # a dependent is cached by its new base symbol
+        cacheManager = CacheManager.instance()
+        d = msys.createScalarUOM(UnitType.UNCLASSIFIED, None, "d_cache", "d_cache", "")
+        dPerSec = msys.createQuotientUOM(UnitType.UNCLASSIFIED, None, "d_cache/s", "d_cache/s", "", d, msys.getSecond())
+        oldBaseSymbol = dPerSec.getBaseSymbol()
+        self.assertTrue(cacheManager.getBaseUOM(oldBaseSymbol) is dPerSec)
+
+        e = msys.createScalarUOM(UnitType.UNCLASSIFIED, None, "e_cache", "e_cache", "")
+        d.setConversion(2.0, e)
+        self.assertEqual(dPerSec.getBaseSymbol(), "e_cache/s")
+        self.assertTrue(cacheManager.getBaseUOM("e_cache/s") is dPerSec)
+        self.assertFalse(cacheManager.getBaseUOM(oldBaseSymbol) is dPerSec)
+
+    def testInterning(self):
+        msys = MeasurementSystem.instance()
+        cacheManager = CacheManager.instance()
+
+        m = msys.getUOM(Unit.METRE)
+        s = msys.getSecond()
+
+        # repeated operations return the same unit of measure
+        mps = m.divide(s)
+        self.assertTrue(m.divide(s) is mps)
+        self.assertTrue(m.multiply(s) is m.multiply(s))
+        self.assertFalse(m.multiply(s) is s.multiply(m))
+        self.assertTrue(s.invert() is s.invert())
+
+        q1 = Quantity(10.0, m).divide(Quantity(2.0, s))
+        q2 = Quantity(20.0, m).divide(Quantity(4.0, s))
+        self.assertTrue(q1.uom is q2.uom)
+
+        # a cloned power product keeps its own unit type
+        ft = msys.getUOM(Unit.FOOT)
+        fps = Quantity(1.0, mps).convertToPowerProduct(ft, s).uom
+        self.assertFalse(fps is ft.divide(s))
+
+        # changing an operand evicts the interned result
+        a = msys.createScalarUOM(UnitType.UNCLASSIFIED, None, "a_intern", "a_intern", "")
+        b = msys.createScalarUOM(UnitType.UNCLASSIFIED, None, "b_intern", "b_intern", "")
+        ab = a.multiply(b)
+        self.assertTrue(a.multiply(b) is ab)
+        a.setConversion(2.0, m)
+        self.assertFalse(a.multiply(b) is ab)
+
+        # changing an interned result does not change the result of later operations
+        metrePerSec = msys.getUOM(Unit.METRE_PER_SEC)
+        mine = m.divide(s)
+        mine.symbol = "mine"
+        mine.scalingFactor = 2.0
+        self.assertFalse(m.divide(s) is mine)
+        self.assertEqual(m.divide(s).symbol, "m/s")
+        q = Quantity(1.0, m).divide(Quantity(1.0, s)).convert(metrePerSec)
+        self.assertAlmostEqual(q.amount, 1.0, None, None, TestingUtils.DELTA6)
+        self.assertTrue(m.divide(s) is m.divide(s))
+
+        # registering an unrelated unit of measure keeps the interned results
+        mps = m.divide(s)
+        stats = cacheManager.derivedRegistry.getStatistics()
+        msys.createScalarUOM(UnitType.UNCLASSIFIED, None, "c_intern", "c_intern", "")
+        self.assertTrue(m.divide(s) is mps)
+        self.assertEqual(cacheManager.derivedRegistry.getStatistics()["hits"], stats["hits"] + 1)
+
+        # a new base unit of measure for a product replaces the interned product
+        d = msys.createScalarUOM(UnitType.UNCLASSIFIED, None, "d_intern", "d_intern", "")
+        e = msys.createScalarUOM(UnitType.UNCLASSIFIED, None, "e_intern", "e_intern", "")
+        de = d.multiply(e)
+        self.assertTrue(d.multiply(e) is de)
+        msys.createProductUOM(UnitType.UNCLASSIFIED, None, "de_intern", "de_intern", "", d, e)
+        self.assertFalse(d.multiply(e) is de)
+
+        # removing a unit of measure only drops the cached entries that refer to it
+        f = msys.createScalarUOM(UnitType.UNCLASSIFIED, None, "f_intern", "f_intern", "")
+        fs = msys.parseUOM("f_intern/s")
+        kgm = msys.parseUOM("kg·m")
+        self.assertTrue(cacheManager.getParsedUOM("f_intern/s") is fs)
+        cacheManager.unregisterUOM(f)
+        self.assertIsNone(cacheManager.getParsedUOM("f_intern/s"))
+        self.assertTrue(cacheManager.getParsedUOM("kg·m") is kgm)
+
+        # the table is bounded
+        size = cacheManager.derivedRegistry.maxSize
+        for i in range(size + 10):
+            u = UnitOfMeasure(UnitType.UNCLASSIFIED, "u_intern", "u_intern" + str(i), "")
+            u.multiply(m)
+        self.assertTrue(len(cacheManager.derivedRegistry) <= size)
+
+        # and so is the index of its keys by base symbol
+        self.assertEqual(len(cacheManager.derivedBaseSymbols), len(cacheManager.derivedRegistry))
+        self.assertEqual(sum(len(keys) for keys in cacheManager.derivedKeys.values()), len(cacheManager.derivedRegistry))
+
+    def testConversionRevision(self):
+        msys = MeasurementSystem.instance()
+
+        a = msys.createScalarUOM(UnitType.UNCLASSIFIED, None, "a_rev", "a_rev", "")
+        b = msys.createScalarUOM(UnitType.UNCLASSIFIED, None, "b_rev", "b_rev", "")
+        ab = a.multiply(b)
+        bb = b.multiply(b)
+        revision = ab.revision
+
+        # redefining an operand in terms of the other one bumps the revision of the product
+        a.setConversion(2.0, b)
+        self.assertTrue(ab.revision > revision)
+        self.assertAlmostEqual(ab.getConversionFactor(bb), 2.0, None, None, TestingUtils.DELTA6)
+        self.assertAlmostEqual(a.multiply(b).getConversionFactor(bb), 2.0, None, None, TestingUtils.DELTA6)
+
+        # and the cached factor is not reused after another change
+        a.setConversion(3.0, b)
+        self.assertAlmostEqual(ab.getConversionFactor(bb), 3.0, None, None, TestingUtils.DELTA6)
+
+    def testConversionCache(self):
+        msys = MeasurementSystem.instance()
+        cacheManager = CacheManager.instance()
+
+        m = msys.getUOM(Unit.METRE)
+        ft = msys.createScalarUOM(UnitType.LENGTH, None, "ft_conv", "ft_conv", "")
+        ft.setConversion(0.3048, m)
+        cacheManager.resetConversionStatistics()
+
+        # first conversion is a miss, then hits
+        factor = ft.getConversionFactor(m)
+        self.assertAlmostEqual(ft.getConversionFactor(m), factor, None, None, TestingUtils.DELTA6)
+        self.assertAlmostEqual(ft.getConversionFactor(m), factor, None, None, TestingUtils.DELTA6)
+        stats = cacheManager.getConversionStatistics()
+        self.assertTrue(stats["hits"] >= 2)
+        self.assertTrue(stats["misses"] >= 1)
+
+        # a redefined unit of measure is not converted with a stale factor
+        base = msys.createScalarUOM(UnitType.UNCLASSIFIED, None, "base_conv", "base_conv", "")
+        a = msys.createScalarUOM(UnitType.UNCLASSIFIED, None, "a_conv", "a_conv", "")
+        a.setConversion(2.0, base)
+        self.assertAlmostEqual(a.getConversionFactor(base), 2.0, None, None, TestingUtils.DELTA6)
+        a.setConversion(3.0, base)
+        self.assertAlmostEqual(a.getConversionFactor(base), 3.0, None, None, TestingUtils.DELTA6)
+
+        # bounded with LRU eviction
+        maxSize = stats["maxSize"]
+        try:
+            cacheManager.setConversionCacheSize(10)
+            cacheManager.resetConversionStatistics()
+
+            for i in range(20):
+                u = msys.createScalarUOM(UnitType.UNCLASSIFIED, None, "u_conv" + str(i), "u_conv" + str(i), "")
+                u.setConversion(float(i + 1), base)
+                u.getConversionFactor(base)
+
+            stats = cacheManager.getConversionStatistics()
+            self.assertTrue(stats["size"] <= 10)
+            self.assertTrue(stats["evictions"] >= 10)
+        finally:
+            cacheManager.setConversionCacheSize(maxSize)
@@ -1,24 +1,230 @@
+import pickle
+import struct
+import threading
+from collections import OrderedDict
+
 from PyCaliper.uom.enums import UnitType
+from PyCaliper.uom.dimension import Dimension
+from PyCaliper.uom.localizer import Localizer
+from PyCaliper.uom.caliper_exception import PyCaliperException
+
+##
+# A bounded map that evicts the least recently used entry when it is full.
+# Lookups do not lock; changes are serialized. While frozen, lookups are
+# served from a plain copy of the entries made at freeze time, without any
+# bookkeeping.
+#
+class LruCache:
+    ##
+    # Construct the cache
+    #
+    # @param maxSize Maximum number of entries
+    # @param onEvict Optional function of the key and value of an evicted entry
+    def __init__(self, maxSize, onEvict=None):
+        self.maxSize = maxSize
+        self.onEvict = onEvict
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+        # copy of the entries while frozen, otherwise None
+        self.snapshot = None
+
+        # usage statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    ##
+    # Get the value for this key and mark it as recently used
+    #
+    # @param key Key
+    # @return Value or None if not cached
+    def get(self, key):
+        snapshot = self.snapshot
+
+        if (snapshot is not None):
+            # reads do not write, so memory shared with forked processes is not copied
+            value = snapshot.get(key)
+            return value if value is not None else self.entries.get(key)
+
+        value = self.entries.get(key)
+
+        if (value is not None):
+            self.hits = self.hits + 1
+
+            try:
+                self.entries.move_to_end(key)
+            except KeyError:
+                # evicted by another thread
+                pass
+        else:
+            self.misses = self.misses + 1
+
+        return value
+
+    ##
+    # Cache this value, evicting the least recently used entry if full
+    #
+    # @param key Key
+    # @param value Value
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+
+            self.evict()
+
+    ##
+    # Evict the least recently used entries while there are too many
+    def evict(self):
+        while (len(self.entries) > self.maxSize):
+            key, value = self.entries.popitem(last=False)
+            self.evictions = self.evictions + 1
+
+            if (self.onEvict is not None):
+                self.onEvict(key, value)
+
+    ##
+    # Change the maximum number of entries, evicting entries if necessary
+    #
+    # @param maxSize Maximum number of entries
+    def resize(self, maxSize):
+        with self.lock:
+            self.maxSize = maxSize
+
+            self.evict()
+
+    ##
+    # Remove the entry for this key
+    #
+    # @param key Key
+    # @return Removed value or None
+    def remove(self, key):
+        with self.lock:
+            value = self.entries.pop(key, None)
+
+            if (self.snapshot is not None):
+                self.snapshot.pop(key, None)
+
+            return value
+
+    ##
+    # Remove the entries whose value matches a condition
+    #
+    # @param predicate Function of the value that is True to remove the entry
+    def removeIf(self, predicate):
+        with self.lock:
+            keys = [key for key, value in self.entries.items() if predicate(value)]
+
+            for key in keys:
+                del self.entries[key]
+
+                if (self.snapshot is not None):
+                    self.snapshot.pop(key, None)
+
+    ##
+    # Remove all entries
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+            if (self.snapshot is not None):
+                self.snapshot = {}
+
+    ##
+    # Serve lookups from a copy of the current entries, without recording
+    # their use
+    def freeze(self):
+        with self.lock:
+            self.snapshot = dict(self.entries)
+
+    ##
+    # Record the use of entries again after {@link #freeze}
+    def unfreeze(self):
+        with self.lock:
+            self.snapshot = None
+
+    ##
+    # Get the usage statistics
+    #
+    # @return Dictionary of size, maximum size, hits, misses and evictions
+    def getStatistics(self):
+        return {"size": len(self.entries), "maxSize": self.maxSize, "hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions}
+
+    ##
+    # Reset the hit, miss and eviction counters
+    def resetStatistics(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
 ##
 # This class manages the various caches for units of measure to improve performance.
+# Lookups do not lock. Changes to the registries are made under a lock so that
+# concurrent readers see a unit of measure either before or after the change.
 #
 class CacheManager:
     # single instance
     manager = None
+
+    # guards creation of the single instance
+    instanceLock = threading.Lock()
+
+    # maximum number of interned product and quotient units of measure
+    DERIVED_CACHE_SIZE = 1024
+
+    # maximum number of cached conversion factors
+    CONVERSION_CACHE_SIZE = 4096
+
+    # maximum number of cached unit of measure expressions
+    EXPRESSION_CACHE_SIZE = 1024
+
+    # maximum number of cached prefixed units of measure
+    PREFIXED_CACHE_SIZE = 1024
+
+    # snapshot file identification and format version
+    SNAPSHOT_MAGIC = b"PYCALIPER"
+    SNAPSHOT_VERSION = 2
+    SNAPSHOT_HEADER = struct.Struct(">9sH")
     
     def __init__(self):
-        CacheManager.manager = self
-        
+        self.lock = threading.RLock()
         self.symbolRegistry = {}
         self.baseRegistry = {}
         self.unitRegistry = {}
         self.unitTypeRegistry = {}
+        self.typeDimensionRegistry = {}
+        self.derivedRegistry = LruCache(CacheManager.DERIVED_CACHE_SIZE, self.forgetDerivedUOM)
+        self.conversionRegistry = LruCache(CacheManager.CONVERSION_CACHE_SIZE)
+        self.expressionRegistry = LruCache(CacheManager.EXPRESSION_CACHE_SIZE)
+        self.constantRegistry = {}
+
+        # keys of the interned units of measure by their base symbol, and the reverse
+        self.derivedKeys = {}
+        self.derivedBaseSymbols = {}
+
+        # (base unit of measure, prefixed unit of measure) by prefix symbol and identity of the base
+        self.prefixedRegistry = LruCache(CacheManager.PREFIXED_CACHE_SIZE)
+
+        # unit type by dimension exponents, the first unit type in definition order for each
+        self.dimensionTypeRegistry = {}
+
+        for unitType in UnitType:
+            self.dimensionTypeRegistry.setdefault(self.getTypeDimension(unitType), unitType)
         
     @staticmethod
     def instance():
         if (CacheManager.manager is None):
-            CacheManager()
+            with CacheManager.instanceLock:
+                if (CacheManager.manager is None):
+                    CacheManager.manager = CacheManager()
         return CacheManager.manager 
     
     ##
@@ -38,10 +244,8 @@ class CacheManager:
     # @param unit {@link Unit}
     # @return {@link UnitOfMeasure}    
     def getUOMByUnit(self, unit):
-        uom = None
-        if (unit in self.unitRegistry):
-            uom = self.unitRegistry[unit]
-        return uom
+        # one lookup, enumerations hash slowly
+        return self.unitRegistry.get(unit)
     
     ##
     # Get the unit of measure with this base symbol
@@ -57,12 +261,20 @@ class CacheManager:
     ##
     # Remove all cached units of measure
     def clearCache(self):
-        self.symbolRegistry.clear()
-        self.baseRegistry.clear()
-        self.unitRegistry.clear()
+        with self.lock:
+            self.symbolRegistry.clear()
+            self.baseRegistry.clear()
+            self.unitRegistry.clear()
+            self.derivedRegistry.clear()
+            self.derivedKeys.clear()
+            self.derivedBaseSymbols.clear()
+            self.conversionRegistry.clear()
+            self.expressionRegistry.clear()
+            self.constantRegistry.clear()
+            self.prefixedRegistry.clear()
           
     def getCachedUOMs(self):
-        return self.symbolRegistry.values()
+        return list(self.symbolRegistry.values())
     
     ##
     # Get the units of measure cached by their symbol
@@ -86,24 +298,31 @@ class CacheManager:
         return self.unitRegistry  
 
     ##
-    # Remove a UOM from the cache
+    # Remove a UOM from the cache. Only the entries that refer to this UOM are removed.
     # 
     # @param uom {@link UnitOfMeasure} to remove   
     def unregisterUOM(self, uom):
         if (uom is None):
             return
         
-        # remove by enumeration
-        if (uom.unit is not None and uom.unit in self.unitRegistry):
-            del self.unitRegistry[uom.unit] 
-            
-        # remove by symbol and base symbol
-        if (uom.symbol in self.symbolRegistry):
-            del self.symbolRegistry[uom.symbol]
-            
-        key = uom.getBaseSymbol()
-        if (key in self.baseRegistry):
-            del self.baseRegistry[key]
+        with self.lock:
+            # remove by enumeration
+            if (uom.unit is not None and self.unitRegistry.get(uom.unit) is uom):
+                del self.unitRegistry[uom.unit] 
+                
+            # remove by symbol and base symbol
+            if (self.symbolRegistry.get(uom.symbol) is uom):
+                del self.symbolRegistry[uom.symbol]
+
+                # parsed expressions, constants and prefixed units that refer to it
+                self.unregisterReferences(uom)
+                
+            key = uom.getBaseSymbol()
+            if (self.baseRegistry.get(key) is uom):
+                del self.baseRegistry[key]
+    
+                # interned products and quotients may have been converted to it
+                self.unregisterDependentUOMs(uom)
 
     ##
     # Cache this unit of measure
@@ -113,13 +332,37 @@ class CacheManager:
         if (uom is None):
             return
         
-        # get first by symbol
-        current = self.getUOMBySymbol(uom.symbol)
+        with self.lock:
+            # get first by symbol
+            current = self.getUOMBySymbol(uom.symbol)
+    
+            if (current is not None):
+                # already cached
+                return
+    
+            self.addUOM(uom)
 
-        if (current is not None):
-            # already cached
+    ##
+    # Cache this unit of measure again after its definition has changed. The
+    # entries are replaced in place, so that concurrent readers never find the
+    # symbol missing.
+    # 
+    # @param uom {@link UnitOfMeasure} to cache
+    # @param oldBaseSymbol Base symbol before the change
+    def reregisterUOM(self, uom, oldBaseSymbol):
+        if (uom is None):
             return
 
+        with self.lock:
+            if (oldBaseSymbol != uom.getBaseSymbol() and self.baseRegistry.get(oldBaseSymbol) is uom):
+                del self.baseRegistry[oldBaseSymbol]
+
+                # interned products and quotients may have been converted to it
+                self.unregisterDependentUOMs(uom)
+
+            self.addUOM(uom)
+
+    def addUOM(self, uom):
         # cache it by symbol
         self.symbolRegistry[uom.symbol] = uom
 
@@ -133,6 +376,366 @@ class CacheManager:
         if (key not in self.baseRegistry):
             self.baseRegistry[key] = uom
 
+            # interned products and quotients with this base symbol could now be converted to it
+            for derivedKey in self.derivedKeys.pop(key, ()):
+                del self.derivedBaseSymbols[derivedKey]
+                derived = self.derivedRegistry.remove(derivedKey)
+
+                if (derived is not None):
+                    derived.internKey = None
+
+    ##
+    # Remove the parsed expressions, constants and prefixed units of measure
+    # that refer to a unit of measure or to a unit that depends on it
+    # 
+    # @param uom {@link UnitOfMeasure}
+    def unregisterReferences(self, uom):
+        # the unit of measure and its dependents
+        referring = set()
+        pending = [uom]
+
+        while (len(pending) > 0):
+            current = pending.pop()
+
+            if (id(current) in referring):
+                continue
+
+            referring.add(id(current))
+
+            if (current.dependents is not None):
+                pending.extend(current.dependents.values())
+
+        self.expressionRegistry.removeIf(lambda parsed: id(parsed) in referring)
+        self.prefixedRegistry.removeIf(lambda entry: id(entry[0]) in referring or id(entry[1]) in referring)
+
+        for constant, quantity in list(self.constantRegistry.items()):
+            if (id(quantity.uom) in referring):
+                del self.constantRegistry[constant]
+
+    ##
+    # Remove the interned units of measure that are converted to this one
+    # 
+    # @param uom Base {@link UnitOfMeasure}
+    def unregisterDependentUOMs(self, uom):
+        if (uom.dependents is None):
+            return
+
+        for dependent in list(uom.dependents.values()):
+            if (dependent.internKey is not None):
+                self.unregisterDerivedUOM(dependent.internKey, dependent)
+                dependent.internKey = None
+
+    ##
+    # Get the interned product or quotient of two units of measure
+    # 
+    # @param key Tuple of operand identities and the operation
+    # @return {@link UnitOfMeasure} or None
+    def getDerivedUOM(self, key):
+        return self.derivedRegistry.get(key)
+
+    ##
+    # Intern the product or quotient of two units of measure
+    # 
+    # @param key Tuple of operand identities and the operation
+    # @param uom Derived {@link UnitOfMeasure}
+    def registerDerivedUOM(self, key, uom):
+        baseSymbol = uom.getBaseSymbol()
+
+        with self.lock:
+            self.forgetDerivedKey(key)
+            self.derivedRegistry.put(key, uom)
+            self.derivedKeys.setdefault(baseSymbol, set()).add(key)
+            self.derivedBaseSymbols[key] = baseSymbol
+
+    ##
+    # Remove an interned unit of measure if it is still the one cached for its key
+    # 
+    # @param key Tuple of operand identities and the operation
+    # @param uom Derived {@link UnitOfMeasure}
+    def unregisterDerivedUOM(self, key, uom):
+        with self.lock:
+            if (self.derivedRegistry.get(key) is uom):
+                self.derivedRegistry.remove(key)
+                self.forgetDerivedKey(key)
+
+    ##
+    # Forget the base symbol of an evicted interned unit of measure
+    # 
+    # @param key Tuple of operand identities and the operation
+    # @param uom Derived {@link UnitOfMeasure}
+    def forgetDerivedUOM(self, key, uom):
+        self.forgetDerivedKey(key)
+
+    ##
+    # Remove the key of an interned unit of measure from the index by base symbol
+    # 
+    # @param key Tuple of operand identities and the operation
+    def forgetDerivedKey(self, key):
+        baseSymbol = self.derivedBaseSymbols.pop(key, None)
+
+        if (baseSymbol is not None):
+            keys = self.derivedKeys[baseSymbol]
+            keys.discard(key)
+
+            if (len(keys) == 0):
+                del self.derivedKeys[baseSymbol]
+
+    ##
+    # Get the unit of measure parsed from an expression
+    # 
+    # @param expression Unit of measure expression
+    # @return {@link UnitOfMeasure} or None if not cached
+    def getParsedUOM(self, expression):
+        return self.expressionRegistry.get(expression)
+
+    ##
+    # Cache the unit of measure parsed from an expression
+    # 
+    # @param expression Unit of measure expression
+    # @param uom {@link UnitOfMeasure}
+    def registerParsedUOM(self, expression, uom):
+        self.expressionRegistry.put(expression, uom)
+
+    ##
+    # Get a cached named constant
+    # 
+    # @param constant {@link Constant}
+    # @return {@link FrozenQuantity} or None if not cached
+    def getConstant(self, constant):
+        return self.constantRegistry.get(constant)
+
+    ##
+    # Cache a named constant
+    # 
+    # @param constant {@link Constant}
+    # @param quantity {@link FrozenQuantity}
+    def registerConstant(self, constant, quantity):
+        self.constantRegistry[constant] = quantity
+
+    ##
+    # Get the unit of measure created with a prefix for a base unit of measure
+    # 
+    # @param prefix {@link Prefix}
+    # @param uom Base {@link UnitOfMeasure}
+    # @return Prefixed {@link UnitOfMeasure} or None if not cached
+    def getPrefixedUOM(self, prefix, uom):
+        entry = self.prefixedRegistry.get((prefix.symbol, id(uom)))
+
+        if (entry is None):
+            return None
+
+        return entry[1]
+
+    ##
+    # Cache the unit of measure created with a prefix for a base unit of measure
+    # 
+    # @param prefix {@link Prefix}
+    # @param uom Base {@link UnitOfMeasure}
+    # @param scaled Prefixed {@link UnitOfMeasure}
+    def registerPrefixedUOM(self, prefix, uom, scaled):
+        # the entry references the base unit of measure, so its id is not reused
+        self.prefixedRegistry.put((prefix.symbol, id(uom)), (uom, scaled))
+
+    ##
+    # Get the cached conversion factor from one unit of measure to another.
+    # The key includes the revision of each unit of measure, so a factor
+    # cached before either one was redefined is never returned.
+    # 
+    # @param fromUOM Source {@link UnitOfMeasure}
+    # @param toUOM Target {@link UnitOfMeasure}
+    # @return Conversion factor or None if not cached
+    def getConversionFactor(self, fromUOM, toUOM):
+        entry = self.conversionRegistry.get((id(fromUOM), fromUOM.revision, id(toUOM), toUOM.revision))
+
+        if (entry is None):
+            return None
+
+        return entry[0]
+
+    ##
+    # Cache the conversion factor from one unit of measure to another
+    # 
+    # @param fromUOM Source {@link UnitOfMeasure}
+    # @param toUOM Target {@link UnitOfMeasure}
+    # @param factor Conversion factor
+    def registerConversionFactor(self, fromUOM, toUOM, factor):
+        # the entry references both units of measure, so their ids are not reused
+        key = (id(fromUOM), fromUOM.revision, id(toUOM), toUOM.revision)
+        self.conversionRegistry.put(key, (factor, fromUOM, toUOM))
+
+    ##
+    # Get the hit, miss and eviction counters of the conversion factor cache
+    # 
+    # @return Dictionary of size, maximum size, hits, misses and evictions
+    def getConversionStatistics(self):
+        return self.conversionRegistry.getStatistics()
+
+    ##
+    # Reset the counters of the conversion factor cache
+    def resetConversionStatistics(self):
+        self.conversionRegistry.resetStatistics()
+
+    ##
+    # Set the maximum number of cached conversion factors
+    # 
+    # @param maxSize Maximum number of entries
+    def setConversionCacheSize(self, maxSize):
+        self.conversionRegistry.resize(maxSize)
+
+    ##
+    # Get all of the units of measure in the registries and the conversion
+    # cache, and the units of measure that they refer to
+    # 
+    # @return List of {@link UnitOfMeasure}
+    def getReachableUOMs(self):
+        with self.lock:
+            uoms = []
+            visited = set()
+            pending = list(self.symbolRegistry.values())
+            pending.extend(self.unitRegistry.values())
+            pending.extend(self.baseRegistry.values())
+
+            for entry in list(self.conversionRegistry.entries.values()):
+                pending.append(entry[1])
+                pending.append(entry[2])
+
+            while (len(pending) > 0):
+                uom = pending.pop()
+
+                if (id(uom) in visited):
+                    continue
+
+                visited.add(id(uom))
+                uoms.append(uom)
+                pending.extend(uom.getReferencedUOMs())
+
+            return uoms
+
+    ##
+    # Freeze all of the cached units of measure so that they cannot be changed.
+    # Units of measure created afterwards are not frozen. The bounded caches
+    # serve lookups from copies of their entries, without LRU ordering or
+    # statistics.
+    def freeze(self):
+        with self.lock:
+            for uom in self.getReachableUOMs():
+                uom.freeze()
+
+            self.derivedRegistry.freeze()
+            self.conversionRegistry.freeze()
+            self.expressionRegistry.freeze()
+            self.prefixedRegistry.freeze()
+
+    ##
+    # Allow the cached units of measure to be changed again
+    def unfreeze(self):
+        with self.lock:
+            for uom in self.getReachableUOMs():
+                uom.frozen = False
+
+            self.derivedRegistry.unfreeze()
+            self.conversionRegistry.unfreeze()
+            self.expressionRegistry.unfreeze()
+            self.prefixedRegistry.unfreeze()
+
+    ##
+    # Write the cached units of measure, including their conversions, bridges
+    # and base symbols, and the cached conversion factors to a versioned
+    # snapshot file
+    # 
+    # @param fileName Path of the snapshot file
+    def saveSnapshot(self, fileName):
+        with self.lock:
+            conversions = list(self.conversionRegistry.entries.values())
+            uoms = self.getReachableUOMs()
+
+            payload = {
+                "uoms": uoms,
+                "symbols": self.symbolRegistry,
+                "bases": self.baseRegistry,
+                "units": self.unitRegistry,
+                "conversions": conversions
+            }
+
+            data = pickle.dumps(payload, pickle.HIGHEST_PROTOCOL)
+
+        with open(fileName, "wb") as f:
+            f.write(CacheManager.SNAPSHOT_HEADER.pack(CacheManager.SNAPSHOT_MAGIC, CacheManager.SNAPSHOT_VERSION))
+            f.write(data)
+
+    ##
+    # Replace the cached units of measure and conversion factors with those in
+    # a snapshot file written by {@link #saveSnapshot}. No units of measure are
+    # created from their definitions.
+    # <p>
+    # A snapshot is a pickle, and unpickling can run arbitrary code. Only load
+    # snapshot files that this application wrote itself or that come from a
+    # trusted source, never files supplied by users.
+    # 
+    # @param fileName Path of the snapshot file
+    def loadSnapshot(self, fileName):
+        header = CacheManager.SNAPSHOT_HEADER
+
+        with open(fileName, "rb") as f:
+            data = f.read()
+
+        if (len(data) < header.size):
+            msg = Localizer.instance().messageStr("snapshot.invalid").format(fileName)
+            raise PyCaliperException(msg)
+
+        magic, version = header.unpack_from(data)
+
+        if (magic != CacheManager.SNAPSHOT_MAGIC):
+            msg = Localizer.instance().messageStr("snapshot.invalid").format(fileName)
+            raise PyCaliperException(msg)
+
+        if (version != CacheManager.SNAPSHOT_VERSION):
+            msg = Localizer.instance().messageStr("snapshot.version").format(fileName, version,
+                                                                             CacheManager.SNAPSHOT_VERSION)
+            raise PyCaliperException(msg)
+
+        payload = pickle.loads(memoryview(data)[header.size:])
+
+        for uom in payload["uoms"]:
+            uom.linkDependencies()
+
+        with self.lock:
+            self.symbolRegistry = payload["symbols"]
+            self.baseRegistry = payload["bases"]
+            self.unitRegistry = payload["units"]
+            self.derivedRegistry.clear()
+            self.derivedKeys.clear()
+            self.derivedBaseSymbols.clear()
+            self.conversionRegistry.clear()
+            self.expressionRegistry.clear()
+            self.constantRegistry.clear()
+            self.prefixedRegistry.clear()
+
+            for factor, fromUOM, toUOM in payload["conversions"]:
+                self.registerConversionFactor(fromUOM, toUOM, factor)
+
+    ##
+    # Get the unit type with these dimension exponents
+    # 
+    # @param exponents Tuple of exponents
+    # @return {@link UnitType}, UNCLASSIFIED if there is none
+    def getDimensionType(self, exponents):
+        return self.dimensionTypeRegistry.get(exponents, UnitType.UNCLASSIFIED)
+
+    ##
+    # Get the dimension exponents of a unit type
+    # 
+    # @param unitType {@link UnitType}
+    # @return Tuple of exponents
+    def getTypeDimension(self, unitType):
+        exponents = self.typeDimensionRegistry.get(unitType)
+
+        if (exponents is None):
+            exponents = Dimension.exponentsFromTypes(self.getTypeMap(unitType))
+            self.typeDimensionRegistry[unitType] = exponents
+
+        return exponents
+
     def getTypeMap(self, unitType):            
         if (unitType in self.unitTypeRegistry):
             return self.unitTypeRegistry[unitType]
@@ -0,0 +1,143 @@
+import math
+from PyCaliper.uom.enums import UnitType
+
+##
+# A Dimension is the canonical form of a unit of measure: a fixed-length tuple
+# of exponents over the unit types that units of measure reduce to, together
+# with the cumulative scaling factor to those base units of measure. For
+# example, a Newton has the exponents (1, 1, -2, 0, ...) over (LENGTH, MASS,
+# TIME, ...). Comparing dimensions is a tuple comparison instead of a walk of
+# the unit of measure graph.
+#
+class Dimension:
+    # unit types of the base units of measure, in exponent order
+    TYPES = (UnitType.LENGTH, UnitType.MASS, UnitType.TIME, UnitType.ELECTRIC_CURRENT, UnitType.TEMPERATURE,
+             UnitType.SUBSTANCE_AMOUNT, UnitType.LUMINOSITY, UnitType.INTENSITY, UnitType.COMPUTER_SCIENCE,
+             UnitType.CURRENCY)
+
+    # position of each unit type in the exponents
+    INDEX = {unitType: i for i, unitType in enumerate(TYPES)}
+
+    # exponents of a dimension-less unit of measure
+    NONE = (0,) * len(TYPES)
+
+    ##
+    # Construct a dimension
+    #
+    # @param exponents
+    #            Tuple of exponents or None if the unit of measure reduces to a
+    #            unit type that is not a base type
+    # @param scalingFactor
+    #            Cumulative scaling factor to the base units of measure
+    #
+    def __init__(self, exponents, scalingFactor=1.0):
+        self.exponents = exponents
+        self.scalingFactor = scalingFactor
+
+    def __eq__(self, other):
+        if not isinstance(other, Dimension):
+            return False
+        return self.exponents == other.exponents
+
+    def __hash__(self):
+        return hash(self.exponents)
+
+    def __str__(self):
+        return str(self.exponents) + ", " + str(self.scalingFactor)
+
+    ##
+    # Get the dimension of the product of units of measure of this dimension
+    # and the other one
+    #
+    # @param other
+    #            {@link Dimension}
+    # @return {@link Dimension}
+    #
+    def multiply(self, other):
+        exponents = None
+
+        if (self.exponents is not None and other.exponents is not None):
+            exponents = tuple(a + b for a, b in zip(self.exponents, other.exponents))
+
+        return Dimension(exponents, self.scalingFactor * other.scalingFactor)
+
+    ##
+    # Get the dimension of a power of a unit of measure of this dimension
+    #
+    # @param exponent
+    #            Integer exponent
+    # @return {@link Dimension}
+    #
+    def power(self, exponent):
+        exponents = None
+
+        if (self.exponents is not None):
+            exponents = tuple(a * exponent for a in self.exponents)
+
+        return Dimension(exponents, math.pow(self.scalingFactor, exponent))
+
+    ##
+    # Create the exponents from a map of unit types and exponents
+    #
+    # @param typeMap
+    #            Dictionary of {@link UnitType} and exponent
+    # @return Tuple of exponents or None
+    #
+    @staticmethod
+    def exponentsFromTypes(typeMap):
+        exponents = list(Dimension.NONE)
+
+        for unitType, power in typeMap.items():
+            index = Dimension.INDEX.get(unitType)
+
+            if (index is None):
+                return None
+
+            exponents[index] = exponents[index] + power
+
+        return tuple(exponents)
+
+    ##
+    # Create a dimension from the reduced terms of a unit of measure
+    #
+    # @param terms
+    #            Dictionary of base {@link UnitOfMeasure} and exponent
+    # @param scalingFactor
+    #            Cumulative scaling factor
+    # @return {@link Dimension}
+    #
+    @staticmethod
+    def fromTerms(terms, scalingFactor):
+        exponents = list(Dimension.NONE)
+
+        for uom, power in terms.items():
+            index = Dimension.INDEX.get(uom.unitType)
+
+            if (index is None):
+                # not expressible in the base types
+                return Dimension(None, scalingFactor)
+
+            exponents[index] = exponents[index] + power
+
+        return Dimension(tuple(exponents), scalingFactor)
+
+    ##
+    # Check if this dimension is known, i.e. it is expressed in the base types
+    #
+    # @return True if known
+    #
+    def isKnown(self):
+        return self.exponents is not None
+
+    ##
+    # Check to see if a unit of measure of this dimension could be converted to
+    # one of the other dimension. An unknown dimension is not rejected.
+    #
+    # @param other
+    #            {@link Dimension}
+    # @return False if the exponents are known to be different
+    #
+    def isCompatible(self, other):
+        if (self.exponents is None or other.exponents is None):
+            return True
+        return self.exponents == other.exponents
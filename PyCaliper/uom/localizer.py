@@ -4,7 +4,9 @@
 import locale
 import gettext
 import threading
+import contextvars
 import os
+from contextlib import contextmanager
 from pathlib import Path
 from functools import lru_cache
 
@@ -13,6 +15,12 @@ class Localizer:
     
     _instance = None
     _lock = threading.Lock()
+
+    # maximum number of locales with loaded catalogs
+    CATALOG_CACHE_SIZE = 16
+
+    # locale of the current context, or None for the process locale
+    currentLocale = contextvars.ContextVar("PyCaliperLocale", default=None)
     
     def __new__(cls):
         if cls._instance is None:
@@ -26,14 +34,15 @@ class Localizer:
         if self._initialized:
             return
         self._initialized = True
-        self.messages = None
-        self.units = None
         self.localePath = Path(__file__).parent / "locales"
-        self._language_code = None  # Cache the language code
     
     @staticmethod
     def instance():
-        return Localizer()
+        instance = Localizer._instance
+
+        if instance is None or not instance._initialized:
+            instance = Localizer()
+        return instance
     
     @staticmethod
     @lru_cache(maxsize=1)
@@ -53,40 +62,113 @@ class Localizer:
         
         return 'en_US'
     
-    def messageStr(self, msgId):
+    ##
+    # Get the locale of the current context
+    #
+    # @return Language code, by default the process locale
+    @staticmethod
+    def getLocale():
+        lc = Localizer.currentLocale.get()
+        return Localizer.getLC() if lc is None else lc
+
+    ##
+    # Set the locale of the current context, e.g. of a request. Threads and
+    # asyncio tasks each have their own context.
+    #
+    # @param lc Language code such as "de_DE", or None for the process locale
+    # @return Token to restore the previous locale with {@link #resetLocale}
+    @staticmethod
+    def setLocale(lc):
+        return Localizer.currentLocale.set(lc)
+
+    ##
+    # Restore the locale of the current context
+    #
+    # @param token Token returned by {@link #setLocale}
+    @staticmethod
+    def resetLocale(token):
+        Localizer.currentLocale.reset(token)
+
+    ##
+    # Use a locale in the current context for the duration of a with block
+    #
+    # @param lc Language code
+    @staticmethod
+    @contextmanager
+    def useLocale(lc):
+        token = Localizer.currentLocale.set(lc)
+        try:
+            yield
+        finally:
+            Localizer.currentLocale.reset(token)
+
+    ##
+    # Get the catalogs of a locale. The catalogs of the most recently used
+    # locales stay loaded, together with the strings already looked up in them.
+    #
+    # @param lc Language code, by default the locale of the current context
+    # @return {@link Catalog}
+    def getCatalog(self, lc=None):
+        if (lc is None):
+            lc = Localizer.currentLocale.get()
+
+            if (lc is None):
+                lc = Localizer.getLC()
+
+        return Localizer.loadCatalog(lc)
+
+    @staticmethod
+    @lru_cache(maxsize=CATALOG_CACHE_SIZE)
+    def loadCatalog(lc):
+        localizer = Localizer.instance()
+        return Catalog(localizer.loadTranslation("messages", lc), localizer.loadTranslation("units", lc))
+
+    def loadTranslation(self, domain, lc):
+        try:
+            return gettext.translation(
+                domain,
+                localedir=str(self.localePath),
+                languages=[lc, 'en_US'],
+                fallback=True
+            )
+        except Exception as e:
+            print(f"Warning: Could not load {domain} translations: {e}")
+            return gettext.NullTranslations()
+
+    def messageStr(self, msgId, lc=None):
         """Get translated error message."""
-        if self.messages is None:
-            try:
-                self.messages = gettext.translation(
-                    "messages",
-                    localedir=str(self.localePath),
-                    languages=[self.getLC(), 'en_US'],
-                    fallback=True
-                )
-            except Exception as e:
-                print(f"Warning: Could not load message translations: {e}")
-                self.messages = gettext.NullTranslations()
-        
+        return self.getCatalog(lc).messageStr(msgId)
+
+    def langStr(self, msgId, lc=None):
+        """Get translated unit text."""
+        return self.getCatalog(lc).langStr(msgId)
+
+##
+# The gettext catalogs of one locale and the unit strings looked up in them
+#
+class Catalog:
+    def __init__(self, messages, units):
+        self.messages = messages
+        self.units = units
+
+        # translated unit strings by message id
+        self.unitTexts = {}
+
+    def messageStr(self, msgId):
         try:
             return self.messages.gettext(msgId)
         except Exception:
             return msgId
-    
+
     def langStr(self, msgId):
-        """Get translated unit text."""
-        if self.units is None:
+        text = self.unitTexts.get(msgId)
+
+        if (text is None):
             try:
-                self.units = gettext.translation(
-                    "units",
-                    localedir=str(self.localePath),
-                    languages=[self.getLC(), 'en_US'],
-                    fallback=True
-                )
-            except Exception as e:
-                print(f"Warning: Could not load unit translations: {e}")
-                self.units = gettext.NullTranslations()
-        
-        try:
-            return self.units.gettext(msgId)
-        except Exception:
-            return msgId
\ No newline at end of file
+                text = self.units.gettext(msgId)
+            except Exception:
+                text = msgId
+
+            self.unitTexts[msgId] = text
+
+        return text
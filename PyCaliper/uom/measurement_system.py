@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import gc
 import math
+import threading
+import time
 from builtins import staticmethod
 from PyCaliper.uom.cache_manager import CacheManager
 from PyCaliper.uom.enums import Constant
@@ -9,7 +12,12 @@ from PyCaliper.uom.prefix import Prefix
 from PyCaliper.uom.quantity import Quantity
 from PyCaliper.uom.enums import Unit
 from PyCaliper.uom.unit_of_measure import UnitOfMeasure
+from PyCaliper.uom.unit_converter import UnitConverter
+from PyCaliper.uom.symbol_parser import SymbolParser
+from PyCaliper.uom.quantity_batch import QuantityBatch
+from PyCaliper.uom.unit_definition import UnitDefinition, STANDARD_DEFINITIONS
 from PyCaliper.uom.enums import UnitType
+from PyCaliper.uom.enums import MeasurementType
 from PyCaliper.uom.localizer import Localizer
 from PyCaliper.uom.caliper_exception import PyCaliperException
 
@@ -49,18 +57,38 @@ from PyCaliper.uom.caliper_exception import PyCaliperException
 # systems</li>
 # <li>any number of custom units of measure</li>
 # </ul>
+# Units of measure are created under a lock, so concurrent threads share a
+# single instance of each. Cached units are looked up without locking, except
+# for one that is still being created.
 class MeasurementSystem:   
     # single instance
     unifiedSystem = None
+
+    # guards creation of the single instance
+    instanceLock = threading.Lock()
     
     def __init__(self):
-        MeasurementSystem.unifiedSystem = self
+        # serializes creation of units of measure
+        self.lock = threading.RLock()
+
+        # units of measure being created
+        self.pending = set()
+
+        # definitions of the units of measure by Unit
+        self.definitions = dict(STANDARD_DEFINITIONS)
+
+        # symbols of the definitions by Unit and Units by symbol, built on first use
+        self.definedSymbols = None
+        self.unitSymbols = None
+
         self.primeUomCache()
         
     @staticmethod
     def instance():
         if (MeasurementSystem.unifiedSystem is None):
-            MeasurementSystem()
+            with MeasurementSystem.instanceLock:
+                if (MeasurementSystem.unifiedSystem is None):
+                    MeasurementSystem.unifiedSystem = MeasurementSystem()
         return MeasurementSystem.unifiedSystem 
     
     def primeUomCache(self):
@@ -76,8 +104,19 @@ class MeasurementSystem:
     def getUOM(self, unit):
         uom = CacheManager.instance().getUOMByUnit(unit)
 
-        if (uom is None):
-            uom = self.createUOMForUnit(unit) 
+        # a unit of measure is cached before its conversion is set
+        if (uom is not None and (not self.pending or unit not in self.pending)):
+            return uom
+
+        with self.lock:
+            uom = CacheManager.instance().getUOMByUnit(unit)
+
+            if (uom is None):
+                self.pending.add(unit)
+                try:
+                    uom = self.createUOMForUnit(unit)
+                finally:
+                    self.pending.discard(unit)
         return uom
         
     def getOne(self):
@@ -93,915 +132,256 @@ class MeasurementSystem:
     # @param description Description of unit of measure
     # @return {@link UnitOfMeasure}
     def createScalarUOM(self, unitType, unit, name, symbol, description):
-        uom = self.createUOM(unitType, unit, name, symbol, description)
-        CacheManager.instance().registerUOM(uom)
+        with self.lock:
+            uom = self.createUOM(unitType, unit, name, symbol, description)
+            CacheManager.instance().registerUOM(uom)
         return uom
     
-    def createBaseSIUnit(self, unit):
-        uom = None
-        
-        if (unit == Unit.ONE):
-            # unity
-            uom = self.createScalarUOM(UnitType.UNITY, unit,
-                    Localizer.instance().langStr("one.name"), Localizer.instance().langStr("one.symbol"), 
-                    Localizer.instance().langStr("one.desc"))
-        
-        elif (unit == Unit.SECOND):
-            # second
-            uom = self.createScalarUOM(UnitType.TIME, unit, Localizer.instance().langStr("sec.name"),
-                    Localizer.instance().langStr("sec.symbol"), Localizer.instance().langStr("sec.desc"))
-
-        elif (unit == Unit.MINUTE):
-            # minute
-            uom = self.createScalarUOM(UnitType.TIME, unit, Localizer.instance().langStr("min.name"),
-                    Localizer.instance().langStr("min.symbol"), Localizer.instance().langStr("min.desc"))
-            uom.setConversion(60.0, self.getUOM(Unit.SECOND))
-
-        elif (unit == Unit.HOUR):
-            # hour
-            uom = self.createScalarUOM(UnitType.TIME, unit, Localizer.instance().langStr("hr.name"), Localizer.instance().langStr("hr.symbol"),
-                    Localizer.instance().langStr("hr.desc"))
-            uom.setConversion(3600.0, self.getUOM(Unit.SECOND))
-        
-        elif (unit == Unit.DAY):
-            # day
-            uom = self.createScalarUOM(UnitType.TIME, unit, Localizer.instance().langStr("day.name"), Localizer.instance().langStr("day.symbol"),
-                    Localizer.instance().langStr("day.desc"))
-            uom.setConversion(86400.0, self.getUOM(Unit.SECOND))
-
-        elif (unit == Unit.WEEK):
-            # week
-            uom = self.createScalarUOM(UnitType.TIME, unit, Localizer.instance().langStr("week.name"),
-                    Localizer.instance().langStr("week.symbol"), Localizer.instance().langStr("week.desc"))
-            uom.setConversion(604800.0, self.getUOM(Unit.SECOND))
-
-        elif (unit == Unit.JULIAN_YEAR):
-            # Julian year
-            uom = self.createScalarUOM(UnitType.TIME, unit, Localizer.instance().langStr("jyear.name"),
-                    Localizer.instance().langStr("jyear.symbol"), Localizer.instance().langStr("jyear.desc"))
-            uom.setConversion(3.1557600E+07, self.getUOM(Unit.SECOND))
-        
-        elif (unit == Unit.METRE):
-            # fundamental length
-            uom = self.createScalarUOM(UnitType.LENGTH, unit, Localizer.instance().langStr("m.name"), Localizer.instance().langStr("m.symbol"),
-                    Localizer.instance().langStr("m.desc"))
-
-        elif (unit == Unit.SQUARE_METRE):
-            # square metre
-            uom = self.createPowerUOM(UnitType.AREA, unit, Localizer.instance().langStr("m2.name"),
-                    Localizer.instance().langStr("m2.symbol"), Localizer.instance().langStr("m2.desc"), self.getUOM(Unit.METRE), 2)
+    ##
+    # Add or replace the definition of the unit of measure for a {@link Unit}.
+    # A unit of measure already created from the previous definition is removed
+    # from the cache, so that the next {@link #getUOM} creates it from this
+    # definition. Units of measure that were created from the previous one are
+    # not changed.
+    # 
+    # @param unit {@link Unit}
+    # @param definition {@link UnitDefinition}
+    def defineUnit(self, unit, definition):
+        with self.lock:
+            cacheManager = CacheManager.instance()
+            uom = cacheManager.getUOMByUnit(unit)
             
-        elif (unit == Unit.CUBIC_METRE):
-            # cubic metre
-            uom = self.createPowerUOM(UnitType.VOLUME, unit, Localizer.instance().langStr("m3.name"),
-                    Localizer.instance().langStr("m3.symbol"), Localizer.instance().langStr("m3.desc"), self.getUOM(Unit.METRE), 3)            
-                    
-        elif (unit == Unit.KILOGRAM):
-            # fundamental mass
-            uom = self.createScalarUOM(UnitType.MASS, unit, Localizer.instance().langStr("kg.name"),
-                    Localizer.instance().langStr("kg.symbol"), Localizer.instance().langStr("kg.desc"))    
-                
-        elif (unit == Unit.GRAM):
-            uom = self.createScalarUOM(UnitType.MASS, unit, Localizer.instance().langStr("gram.name"),
-                    Localizer.instance().langStr("gram.symbol"), Localizer.instance().langStr("gram.desc"))
-            uom.setConversion(Prefix.milli().factor, self.getUOM(Unit.KILOGRAM))
-
-        elif (unit == Unit.LITRE):
-            # litre
-            uom = self.createScalarUOM(UnitType.VOLUME, unit, Localizer.instance().langStr("litre.name"),
-                    Localizer.instance().langStr("litre.symbol"), Localizer.instance().langStr("litre.desc"))
-            uom.setConversion(Prefix.milli().factor, self.getUOM(Unit.CUBIC_METRE))        
-        
-        elif (unit == Unit.KELVIN):
-            # fundamental temperature
-            uom = self.createScalarUOM(UnitType.TEMPERATURE, unit, Localizer.instance().langStr("kelvin.name"),
-                    Localizer.instance().langStr("kelvin.symbol"), Localizer.instance().langStr("kelvin.desc"))
-
-        elif (unit == Unit.CELSIUS):
-            # �C = �K - 273.15
-            uom = self.createScalarUOM(UnitType.TEMPERATURE, unit, Localizer.instance().langStr("celsius.name"),
-                    Localizer.instance().langStr("celsius.symbol"), Localizer.instance().langStr("celsius.desc"))
-            uom.setConversion(1.0, self.getUOM(Unit.KELVIN), 273.15)
+            if (uom is not None):
+                uom.checkMutable()
             
-        elif (unit == Unit.AMPERE):
-            # electric current
-            uom = self.createScalarUOM(UnitType.ELECTRIC_CURRENT, unit, Localizer.instance().langStr("amp.name"),
-                    Localizer.instance().langStr("amp.symbol"), Localizer.instance().langStr("amp.desc"))
-        return uom
-    
-    def createSIUnit(self, unit):
-        uom = None
-        
-        if (unit == Unit.PERCENT):
-            uom = self.createScalarUOM(UnitType.UNITY, unit, Localizer.instance().langStr("percent.name"),
-                    Localizer.instance().langStr("percent.symbol"), Localizer.instance().langStr("percent.desc"))
-            uom.setConversion(0.01, self.getOne())
-
-        elif (unit == Unit.SQUARE_SECOND):
-            # square second
-            uom = self.createPowerUOM(UnitType.TIME_SQUARED, unit, Localizer.instance().langStr("s2.name"),
-                    Localizer.instance().langStr("s2.symbol"), Localizer.instance().langStr("s2.desc"), self.getUOM(Unit.SECOND), 2)
-
-        elif (unit == Unit.MOLE):
-            # substance amount
-            uom = self.createScalarUOM(UnitType.SUBSTANCE_AMOUNT, unit, Localizer.instance().langStr("mole.name"),
-                    Localizer.instance().langStr("mole.symbol"), Localizer.instance().langStr("mole.desc"))
-
-        elif (unit == Unit.EQUIVALENT):
-            # substance amount
-            uom = self.createScalarUOM(UnitType.SUBSTANCE_AMOUNT, unit, Localizer.instance().langStr("equivalent.name"),
-                    Localizer.instance().langStr("equivalent.symbol"), Localizer.instance().langStr("equivalent.desc"))
-
-        elif (unit == Unit.DECIBEL):
-            # decibel
-            uom = self.createScalarUOM(UnitType.INTENSITY, unit, Localizer.instance().langStr("db.name"),
-                    Localizer.instance().langStr("db.symbol"), Localizer.instance().langStr("db.desc"))
-
-        elif (unit == Unit.RADIAN):
-            # plane angle radian (rad)
-            uom = self.createScalarUOM(UnitType.PLANE_ANGLE, unit, Localizer.instance().langStr("radian.name"),
-                    Localizer.instance().langStr("radian.symbol"), Localizer.instance().langStr("radian.desc"))
-            uom.setConversion(1.0, self.getOne())
-
-        elif (unit == Unit.STERADIAN):
-            # solid angle steradian (sr)
-            uom = self.createScalarUOM(UnitType.SOLID_ANGLE, unit, Localizer.instance().langStr("steradian.name"),
-                    Localizer.instance().langStr("steradian.symbol"), Localizer.instance().langStr("steradian.desc"))
-            uom.setConversion(1.0, self.getOne())
-
-        elif (unit == Unit.DEGREE):
-            # degree of arc
-            uom = self.createScalarUOM(UnitType.PLANE_ANGLE, unit, Localizer.instance().langStr("degree.name"),
-                    Localizer.instance().langStr("degree.symbol"), Localizer.instance().langStr("degree.desc"))
-            uom.setConversion(math.pi / 180.0, self.getUOM(Unit.RADIAN))
-
-        elif (unit == Unit.ARC_SECOND):
-            # degree of arc
-            uom = self.createScalarUOM(UnitType.PLANE_ANGLE, unit, Localizer.instance().langStr("arcsec.name"),
-                    Localizer.instance().langStr("arcsec.symbol"), Localizer.instance().langStr("arcsec.desc"))
-            uom.setConversion(math.pi / 648000.0, self.getUOM(Unit.RADIAN))
-
-        elif (unit == Unit.DIOPTER):
-            # per metre
-            uom = self.createQuotientUOM(UnitType.RECIPROCAL_LENGTH, unit, Localizer.instance().langStr("diopter.name"),
-                    Localizer.instance().langStr("diopter.symbol"), Localizer.instance().langStr("diopter.desc"), self.getOne(), self.getUOM(Unit.METRE))
-
-        elif (unit == Unit.TONNE):
-            # mass
-            uom = self.createScalarUOM(UnitType.MASS, unit, Localizer.instance().langStr("tonne.name"),
-                    Localizer.instance().langStr("tonne.symbol"), Localizer.instance().langStr("tonne.desc"))
-            uom.setConversion(Prefix.kilo().factor, self.getUOM(Unit.KILOGRAM))
-
-        elif (unit == Unit.CANDELA):
-            # luminosity
-            uom = self.createScalarUOM(UnitType.LUMINOSITY, unit, Localizer.instance().langStr("cd.name"),
-                    Localizer.instance().langStr("cd.symbol"), Localizer.instance().langStr("cd.desc"))
-
-        elif (unit == Unit.MOLARITY):
-            # molar concentration
-            uom = self.createQuotientUOM(UnitType.MOLAR_CONCENTRATION, unit, Localizer.instance().langStr("molarity.name"),
-                    Localizer.instance().langStr("molarity.symbol"), Localizer.instance().langStr("molarity.desc"), self.getUOM(Unit.MOLE),
-                    self.getUOM(Unit.LITRE))
-
-        elif (unit == Unit.CARAT):
-            # carat
-            uom = self.createScalarUOM(UnitType.MASS, unit, Localizer.instance().langStr("carat.name"),
-                    Localizer.instance().langStr("carat.symbol"), Localizer.instance().langStr("carat.desc"))
-            uom.setConversion(0.2, self.getUOM(Unit.GRAM))
-
-        elif (unit == Unit.HECTARE):
-            # hectare
-            uom = self.createScalarUOM(UnitType.AREA, unit, Localizer.instance().langStr("hectare.name"),
-                    Localizer.instance().langStr("hectare.symbol"), Localizer.instance().langStr("hectare.desc"))
-            uom.setConversion(10000.0, self.getUOM(Unit.SQUARE_METRE))
-
-        elif (unit == Unit.METRE_PER_SEC):
-            # velocity
-            uom = self.createQuotientUOM(UnitType.VELOCITY, unit, Localizer.instance().langStr("mps.name"),
-                    Localizer.instance().langStr("mps.symbol"), Localizer.instance().langStr("mps.desc"), self.getUOM(Unit.METRE), self.getSecond())
-
-        elif (unit == Unit.METRE_PER_SEC_SQUARED):
-            # acceleration
-            uom = self.createQuotientUOM(UnitType.ACCELERATION, unit, Localizer.instance().langStr("mps2.name"),
-                    Localizer.instance().langStr("mps2.symbol"), Localizer.instance().langStr("mps2.desc"), self.getUOM(Unit.METRE),
-                    self.getUOM(Unit.SQUARE_SECOND))
-
-        elif (unit == Unit.CUBIC_METRE_PER_SEC):
-            # flow (volume)
-            uom = self.createQuotientUOM(UnitType.VOLUMETRIC_FLOW, unit,
-                    Localizer.instance().langStr("m3PerSec.name"), Localizer.instance().langStr("m3PerSec.symbol"),
-                    Localizer.instance().langStr("m3PerSec.desc"), self.getUOM(Unit.CUBIC_METRE), self.getSecond())
-
-        elif (unit == Unit.KILOGRAM_PER_SEC):
-            # flow (mass)
-            uom = self.createQuotientUOM(UnitType.MASS_FLOW, unit, Localizer.instance().langStr("kgPerSec.name"),
-                    Localizer.instance().langStr("kgPerSec.symbol"), Localizer.instance().langStr("kgPerSec.desc"), self.getUOM(Unit.KILOGRAM),
-                    self.getSecond())
-
-        elif (unit == Unit.KILOGRAM_PER_CU_METRE):
-            # kg/m^3
-            uom = self.createQuotientUOM(UnitType.DENSITY, unit, Localizer.instance().langStr("kg_m3.name"),
-                    Localizer.instance().langStr("kg_m3.symbol"), Localizer.instance().langStr("kg_m3.desc"), self.getUOM(Unit.KILOGRAM),
-                    self.getUOM(Unit.CUBIC_METRE))
-
-        elif (unit == Unit.PASCAL_SECOND):
-            # dynamic viscosity
-            uom = self.createProductUOM(UnitType.DYNAMIC_VISCOSITY, unit, Localizer.instance().langStr("pascal_sec.name"),
-                    Localizer.instance().langStr("pascal_sec.symbol"), Localizer.instance().langStr("pascal_sec.desc"), self.getUOM(Unit.PASCAL),
-                    self.getSecond())
-
-        elif (unit == Unit.SQUARE_METRE_PER_SEC):
-            # kinematic viscosity
-            uom = self.createQuotientUOM(UnitType.KINEMATIC_VISCOSITY, unit,
-                    Localizer.instance().langStr("m2PerSec.name"), Localizer.instance().langStr("m2PerSec.symbol"),
-                    Localizer.instance().langStr("m2PerSec.desc"), self.getUOM(Unit.SQUARE_METRE), self.getSecond())
-
-        elif (unit == Unit.CALORIE):
-            # thermodynamic calorie
-            uom = self.createScalarUOM(UnitType.ENERGY, unit, Localizer.instance().langStr("calorie.name"),
-                    Localizer.instance().langStr("calorie.symbol"), Localizer.instance().langStr("calorie.desc"))
-            uom.setConversion(4.184, self.getUOM(Unit.JOULE))
-
-        elif (unit == Unit.NEWTON):
-            # force F = m�A (newton)
-            uom = self.createProductUOM(UnitType.FORCE, unit, Localizer.instance().langStr("newton.name"),
-                    Localizer.instance().langStr("newton.symbol"), Localizer.instance().langStr("newton.desc"), self.getUOM(Unit.KILOGRAM),
-                    self.getUOM(Unit.METRE_PER_SEC_SQUARED))
-
-        elif (unit == Unit.NEWTON_METRE):
-            # newton-metre
-            uom = self.createProductUOM(UnitType.ENERGY, unit, Localizer.instance().langStr("n_m.name"),
-                    Localizer.instance().langStr("n_m.symbol"), Localizer.instance().langStr("n_m.desc"), self.getUOM(Unit.NEWTON),
-                    self.getUOM(Unit.METRE))
-
-        elif (unit == Unit.JOULE):
-            # energy (joule)
-            uom = self.createProductUOM(UnitType.ENERGY, unit, Localizer.instance().langStr("joule.name"),
-                    Localizer.instance().langStr("joule.symbol"), Localizer.instance().langStr("joule.desc"), self.getUOM(Unit.NEWTON),
-                    self.getUOM(Unit.METRE))
-
-        elif (unit == Unit.ELECTRON_VOLT):
-            # ev
-            e = self.getQuantity(Constant.ELEMENTARY_CHARGE)
-            uom = self.createProductUOM(UnitType.ENERGY, unit, Localizer.instance().langStr("ev.name"),
-                    Localizer.instance().langStr("ev.symbol"), Localizer.instance().langStr("ev.desc"), e.uom, self.getUOM(Unit.VOLT))
-            uom.scalingFactor = e.amount
-
-        elif (unit == Unit.WATT_HOUR):
-            # watt-hour
-            uom = self.createProductUOM(UnitType.ENERGY, unit, Localizer.instance().langStr("wh.name"),
-                    Localizer.instance().langStr("wh.symbol"), Localizer.instance().langStr("wh.desc"), self.getUOM(Unit.WATT), self.getHour())
-
-        elif (unit == Unit.WATT):
-            # power (watt)
-            uom = self.createQuotientUOM(UnitType.POWER, unit, Localizer.instance().langStr("watt.name"),
-                    Localizer.instance().langStr("watt.symbol"), Localizer.instance().langStr("watt.desc"), self.getUOM(Unit.JOULE), self.getSecond())
-
-        elif (unit == Unit.HERTZ):
-            # frequency (hertz)
-            uom = self.createQuotientUOM(UnitType.FREQUENCY, unit, Localizer.instance().langStr("hertz.name"),
-                    Localizer.instance().langStr("hertz.symbol"), Localizer.instance().langStr("hertz.desc"), self.getOne(), self.getSecond())
-
-        elif (unit == Unit.RAD_PER_SEC):
-            # angular frequency
-            uom = self.createQuotientUOM(UnitType.FREQUENCY, unit, Localizer.instance().langStr("radpers.name"),
-                    Localizer.instance().langStr("radpers.symbol"), Localizer.instance().langStr("radpers.desc"), self.getUOM(Unit.RADIAN),
-                    self.getSecond())
-            uom.setConversion(1.0 / (2.0 * math.pi), self.getUOM(Unit.HERTZ))
-
-        elif (unit == Unit.PASCAL):
-            # pressure
-            uom = self.createQuotientUOM(UnitType.PRESSURE, unit, Localizer.instance().langStr("pascal.name"),
-                    Localizer.instance().langStr("pascal.symbol"), Localizer.instance().langStr("pascal.desc"), self.getUOM(Unit.NEWTON),
-                    self.getUOM(Unit.SQUARE_METRE))
-
-        elif (unit == Unit.ATMOSPHERE):
-            # pressure
-            uom = self.createScalarUOM(UnitType.PRESSURE, unit, Localizer.instance().langStr("atm.name"),
-                    Localizer.instance().langStr("atm.symbol"), Localizer.instance().langStr("atm.desc"))
-            uom.setConversion(101325.0, self.getUOM(Unit.PASCAL))
-
-        elif (unit == Unit.BAR):
-            # pressure
-            uom = self.createScalarUOM(UnitType.PRESSURE, unit, Localizer.instance().langStr("bar.name"),
-                    Localizer.instance().langStr("bar.symbol"), Localizer.instance().langStr("bar.desc"))
-            uom.setConversion(1.0, self.getUOM(Unit.PASCAL), 1.0E+05)
-
-        elif (unit == Unit.COULOMB):
-            # charge (coulomb)
-            uom = self.createProductUOM(UnitType.ELECTRIC_CHARGE, unit, Localizer.instance().langStr("coulomb.name"),
-                    Localizer.instance().langStr("coulomb.symbol"), Localizer.instance().langStr("coulomb.desc"), self.getUOM(Unit.AMPERE),
-                    self.getSecond())
-
-        elif (unit == Unit.VOLT):
-            # voltage (volt)
-            uom = self.createQuotientUOM(UnitType.ELECTROMOTIVE_FORCE, unit, Localizer.instance().langStr("volt.name"),
-                    Localizer.instance().langStr("volt.symbol"), Localizer.instance().langStr("volt.desc"), self.getUOM(Unit.WATT),
-                    self.getUOM(Unit.AMPERE))
-
-        elif (unit == Unit.OHM):
-            # resistance (ohm)
-            uom = self.createQuotientUOM(UnitType.ELECTRIC_RESISTANCE, unit, Localizer.instance().langStr("ohm.name"),
-                    Localizer.instance().langStr("ohm.symbol"), Localizer.instance().langStr("ohm.desc"), self.getUOM(Unit.VOLT), self.getUOM(Unit.AMPERE))
-
-        elif (unit == Unit.FARAD):
-            # capacitance (farad)
-            uom = self.createQuotientUOM(UnitType.ELECTRIC_CAPACITANCE, unit, Localizer.instance().langStr("farad.name"),
-                    Localizer.instance().langStr("farad.symbol"), Localizer.instance().langStr("farad.desc"), self.getUOM(Unit.COULOMB),
-                    self.getUOM(Unit.VOLT))
-
-        elif (unit == Unit.FARAD_PER_METRE):
-            # electric permittivity (farad/metre)
-            uom = self.createQuotientUOM(UnitType.ELECTRIC_PERMITTIVITY, unit, Localizer.instance().langStr("fperm.name"),
-                    Localizer.instance().langStr("fperm.symbol"), Localizer.instance().langStr("fperm.desc"), self.getUOM(Unit.FARAD),
-                    self.getUOM(Unit.METRE))
-
-        elif (unit == Unit.AMPERE_PER_METRE):
-            # electric field strength(ampere/metre)
-            uom = self.createQuotientUOM(UnitType.ELECTRIC_FIELD_STRENGTH, unit,
-                    Localizer.instance().langStr("aperm.name"), Localizer.instance().langStr("aperm.symbol"), Localizer.instance().langStr("aperm.desc"),
-                    self.getUOM(Unit.AMPERE), self.getUOM(Unit.METRE))
-
-        elif (unit == Unit.WEBER):
-            # magnetic flux (weber)
-            uom = self.createProductUOM(UnitType.MAGNETIC_FLUX, unit, Localizer.instance().langStr("weber.name"),
-                    Localizer.instance().langStr("weber.symbol"), Localizer.instance().langStr("weber.desc"), self.getUOM(Unit.VOLT), self.getSecond())
-
-        elif (unit == Unit.TESLA):
-            # magnetic flux density (tesla)
-            uom = self.createQuotientUOM(UnitType.MAGNETIC_FLUX_DENSITY, unit, Localizer.instance().langStr("tesla.name"),
-                    Localizer.instance().langStr("tesla.symbol"), Localizer.instance().langStr("tesla.desc"), self.getUOM(Unit.WEBER),
-                    self.getUOM(Unit.SQUARE_METRE))
-
-        elif (unit == Unit.HENRY):
-            # inductance (henry)
-            uom = self.createQuotientUOM(UnitType.ELECTRIC_INDUCTANCE, unit, Localizer.instance().langStr("henry.name"),
-                    Localizer.instance().langStr("henry.symbol"), Localizer.instance().langStr("henry.desc"), self.getUOM(Unit.WEBER),
-                    self.getUOM(Unit.AMPERE))
-
-        elif (unit == Unit.SIEMENS):
-            # electrical conductance (siemens)
-            uom = self.createQuotientUOM(UnitType.ELECTRIC_CONDUCTANCE, unit, Localizer.instance().langStr("siemens.name"),
-                    Localizer.instance().langStr("siemens.symbol"), Localizer.instance().langStr("siemens.desc"), self.getUOM(Unit.AMPERE),
-                    self.getUOM(Unit.VOLT))
-
-        elif (unit == Unit.LUMEN):
-            # luminous flux (lumen)
-            uom = self.createProductUOM(UnitType.LUMINOUS_FLUX, unit, Localizer.instance().langStr("lumen.name"),
-                    Localizer.instance().langStr("lumen.symbol"), Localizer.instance().langStr("lumen.desc"), self.getUOM(Unit.CANDELA),
-                    self.getUOM(Unit.STERADIAN))
-
-        elif (unit == Unit.LUX):
-            # illuminance (lux)
-            uom = self.createQuotientUOM(UnitType.ILLUMINANCE, unit, Localizer.instance().langStr("lux.name"),
-                    Localizer.instance().langStr("lux.symbol"), Localizer.instance().langStr("lux.desc"), self.getUOM(Unit.LUMEN),
-                    self.getUOM(Unit.SQUARE_METRE))
-
-        elif (unit == Unit.BECQUEREL):
-            # radioactivity (becquerel). Same definition as Hertz 1/s)
-            uom = self.createQuotientUOM(UnitType.RADIOACTIVITY, unit, Localizer.instance().langStr("becquerel.name"),
-                    Localizer.instance().langStr("becquerel.symbol"), Localizer.instance().langStr("becquerel.desc"), self.getOne(), self.getSecond())
-
-        elif (unit == Unit.GRAY):
-            # gray (Gy)
-            uom = self.createQuotientUOM(UnitType.RADIATION_DOSE_ABSORBED, unit, Localizer.instance().langStr("gray.name"),
-                    Localizer.instance().langStr("gray.symbol"), Localizer.instance().langStr("gray.desc"), self.getUOM(Unit.JOULE),
-                    self.getUOM(Unit.KILOGRAM))
-
-        elif (unit == Unit.SIEVERT):
-            # sievert (Sv)
-            uom = self.createQuotientUOM(UnitType.RADIATION_DOSE_EFFECTIVE, unit, Localizer.instance().langStr("sievert.name"),
-                    Localizer.instance().langStr("sievert.symbol"), Localizer.instance().langStr("sievert.desc"), self.getUOM(Unit.JOULE),
-                    self.getUOM(Unit.KILOGRAM))
-
-        elif (unit == Unit.SIEVERTS_PER_HOUR):
-            uom = self.createQuotientUOM(UnitType.RADIATION_DOSE_RATE, unit, Localizer.instance().langStr("sph.name"),
-                    Localizer.instance().langStr("sph.symbol"), Localizer.instance().langStr("sph.desc"), self.getUOM(Unit.SIEVERT), self.getHour())
-
-        elif (unit == Unit.KATAL):
-            # katal (kat)
-            uom = self.createQuotientUOM(UnitType.CATALYTIC_ACTIVITY, unit, Localizer.instance().langStr("katal.name"),
-                    Localizer.instance().langStr("katal.symbol"), Localizer.instance().langStr("katal.desc"), self.getUOM(Unit.MOLE), self.getSecond())
-
-        elif (unit == Unit.UNIT):
-            # Unit (U)
-            uom = self.createScalarUOM(UnitType.CATALYTIC_ACTIVITY, unit, Localizer.instance().langStr("unit.name"),
-                    Localizer.instance().langStr("unit.symbol"), Localizer.instance().langStr("unit.desc"))
-            uom.setConversion(1.0E-06 / 60.0, self.getUOM(Unit.KATAL))
-
-        elif (unit == Unit.INTERNATIONAL_UNIT):
-            uom = self.createScalarUOM(UnitType.SUBSTANCE_AMOUNT, unit, Localizer.instance().langStr("iu.name"),
-                    Localizer.instance().langStr("iu.symbol"), Localizer.instance().langStr("iu.desc"))
-
-        elif (unit == Unit.ANGSTROM):
-            # length
-            uom = self.createScalarUOM(UnitType.LENGTH, unit, Localizer.instance().langStr("angstrom.name"),
-                    Localizer.instance().langStr("angstrom.symbol"), Localizer.instance().langStr("angstrom.desc"))
-            uom.setConversion(0.1, self.createPrefixedUOM(Prefix.nano(), self.getUOM(Unit.METRE)))
-
-        elif (unit == Unit.BIT):
-            # computer bit
-            uom = self.createScalarUOM(UnitType.COMPUTER_SCIENCE, unit, Localizer.instance().langStr("bit.name"),
-                    Localizer.instance().langStr("bit.symbol"), Localizer.instance().langStr("bit.desc"))
-
-        elif (unit == Unit.BYTE):
-            # computer byte
-            uom = self.createScalarUOM(UnitType.COMPUTER_SCIENCE, unit, Localizer.instance().langStr("byte.name"),
-                    Localizer.instance().langStr("byte.symbol"), Localizer.instance().langStr("byte.desc"))
-            uom.setConversion(8.0, self.getUOM(Unit.BIT))
-
-        elif (unit == Unit.WATTS_PER_SQ_METRE):
-            uom = self.createQuotientUOM(UnitType.IRRADIANCE, unit, Localizer.instance().langStr("wsm.name"),
-                    Localizer.instance().langStr("wsm.symbol"), Localizer.instance().langStr("wsm.desc"), self.getUOM(Unit.WATT),
-                    self.getUOM(Unit.SQUARE_METRE))
-
-        elif (unit == Unit.PARSEC):
-            uom = self.createScalarUOM(UnitType.LENGTH, unit, Localizer.instance().langStr("parsec.name"),
-                    Localizer.instance().langStr("parsec.symbol"), Localizer.instance().langStr("parsec.desc")) 
-            uom.setConversion(3.08567758149137E+16, self.getUOM(Unit.METRE))
-
-        elif (unit == Unit.ASTRONOMICAL_UNIT):
-            uom = self.createScalarUOM(UnitType.LENGTH, unit, Localizer.instance().langStr("au.name"),
-                    Localizer.instance().langStr("au.symbol"), Localizer.instance().langStr("au.desc"))
-            uom.setConversion(1.49597870700E+11, self.getUOM(Unit.METRE))
-        
-        return uom
+            self.definitions[unit] = definition
+            self.definedSymbols = None
+            self.unitSymbols = None
+            cacheManager.unregisterUOM(uom)
 
-    def createCustomaryUnit(self, unit):
-        uom = None
-        
-        if (unit == Unit.RANKINE): 
-            uom = self.createScalarUOM(UnitType.TEMPERATURE, unit,
-                Localizer.instance().langStr("rankine.name"), Localizer.instance().langStr("rankine.symbol"), Localizer.instance().langStr("rankine.desc"))
-                
-            # create bridge to SI
-            uom.setBridgeConversion(5.0 / 9.0, self.getUOM(Unit.KELVIN), 0.0)
-                
-        elif (unit == Unit.FAHRENHEIT):
-            uom = self.createScalarUOM(UnitType.TEMPERATURE, unit, Localizer.instance().langStr("fahrenheit.name"),
-                Localizer.instance().langStr("fahrenheit.symbol"), Localizer.instance().langStr("fahrenheit.desc"))
-            uom.setConversion(1.0, self.getUOM(Unit.RANKINE), 459.67)
-                
-        elif (unit == Unit.POUND_MASS):
-            uom = self.createScalarUOM(UnitType.MASS, unit, Localizer.instance().langStr("lbm.name"),
-                Localizer.instance().langStr("lbm.symbol"), Localizer.instance().langStr("lbm.desc"))
-    
-            # create bridge to SI
-            uom.setBridgeConversion(0.45359237, self.getUOM(Unit.KILOGRAM), 0.0)  
-        
-        elif (unit == Unit.OUNCE):
-            uom = self.createScalarUOM(UnitType.MASS, unit, Localizer.instance().langStr("ounce.name"),
-                Localizer.instance().langStr("ounce.symbol"), Localizer.instance().langStr("ounce.desc"))
-            uom.setConversion(0.0625, self.getUOM(Unit.POUND_MASS))
-                
-        elif (unit == Unit.TROY_OUNCE):
-            uom = self.createScalarUOM(UnitType.MASS, unit, Localizer.instance().langStr("troy_oz.name"),
-                Localizer.instance().langStr("troy_oz.symbol"), Localizer.instance().langStr("troy_oz.desc"))
-            uom.setConversion(31.1034768, self.getUOM(Unit.GRAM))
-            
-        elif (unit == Unit.SLUG):
-            uom = self.createScalarUOM(UnitType.MASS, unit, Localizer.instance().langStr("slug.name"),
-                Localizer.instance().langStr("slug.symbol"), Localizer.instance().langStr("slug.desc"))
-            g = self.getQuantity(Constant.GRAVITY).convert(self.getUOM(Unit.FEET_PER_SEC_SQUARED))
-            uom.setConversion(g.amount, self.getUOM(Unit.POUND_MASS))
-                
-        elif (unit == Unit.FOOT):
-            uom = self.createScalarUOM(UnitType.LENGTH, unit, Localizer.instance().langStr("foot.name"),
-                Localizer.instance().langStr("foot.symbol"), Localizer.instance().langStr("foot.desc"))
-    
-            # bridge to SI
-            uom.setBridgeConversion(0.3048, self.getUOM(Unit.METRE), 0.0)
-    
-        elif (unit == Unit.INCH):
-            uom = self.createScalarUOM(UnitType.LENGTH, unit, Localizer.instance().langStr("inch.name"),
-                Localizer.instance().langStr("inch.symbol"), Localizer.instance().langStr("inch.desc"))
-            uom.setConversion(1.0 / 12.0, self.getUOM(Unit.FOOT))
-                
-        elif (unit == Unit.MIL):
-            uom = self.createScalarUOM(UnitType.LENGTH, unit, Localizer.instance().langStr("mil.name"), Localizer.instance().langStr("mil.symbol"),
-                Localizer.instance().langStr("mil.desc"))
-            uom.setConversion(Prefix.milli().factor, self.getUOM(Unit.INCH))
-                
-        elif (unit == Unit.POINT):
-            uom = self.createScalarUOM(UnitType.LENGTH, unit, Localizer.instance().langStr("point.name"),
-                Localizer.instance().langStr("point.symbol"), Localizer.instance().langStr("point.desc"))
-            uom.setConversion(1.0 / 72.0, self.getUOM(Unit.INCH))
-            
-        elif (unit == Unit.YARD):
-            uom = self.createScalarUOM(UnitType.LENGTH, unit, Localizer.instance().langStr("yard.name"),
-                Localizer.instance().langStr("yard.symbol"), Localizer.instance().langStr("yard.desc"))
-            uom.setConversion(3.0, self.getUOM(Unit.FOOT))
-                
-        elif (unit == Unit.MILE):
-            uom = self.createScalarUOM(UnitType.LENGTH, unit, Localizer.instance().langStr("mile.name"),
-                Localizer.instance().langStr("mile.symbol"), Localizer.instance().langStr("mile.desc"))
-            uom.setConversion(5280.0, self.getUOM(Unit.FOOT))
-                
-        elif (unit == Unit.NAUTICAL_MILE):
-            uom = self.createScalarUOM(UnitType.LENGTH, unit, Localizer.instance().langStr("NM.name"),
-                Localizer.instance().langStr("NM.symbol"), Localizer.instance().langStr("NM.desc"))
-            uom.setConversion(6080.0, self.getUOM(Unit.FOOT))
-                
-        elif (unit == Unit.FATHOM):
-            uom = self.createScalarUOM(UnitType.LENGTH, unit, Localizer.instance().langStr("fth.name"),
-                Localizer.instance().langStr("fth.symbol"), Localizer.instance().langStr("fth.desc"))
-            uom.setConversion(6.0, self.getUOM(Unit.FOOT))
-    
-        elif (unit == Unit.PSI):
-            uom = self.createQuotientUOM(UnitType.PRESSURE, unit, Localizer.instance().langStr("psi.name"),
-                Localizer.instance().langStr("psi.symbol"), Localizer.instance().langStr("psi.desc"), self.getUOM(Unit.POUND_FORCE),
-                self.getUOM(Unit.SQUARE_INCH))
-            
-        elif (unit == Unit.IN_HG):
-            uom = self.createScalarUOM(UnitType.PRESSURE, unit, Localizer.instance().langStr("inhg.name"),
-                Localizer.instance().langStr("inhg.symbol"), Localizer.instance().langStr("inhg.desc"))
-            u1 = self.createUnclassifiedProductUOM(self.getUOM(Unit.FOOT), self.getUOM(Unit.SQUARE_SECOND))
-            u2 = self.createUnclassifiedQuotientUOM(self.getUOM(Unit.POUND_MASS), u1)
-            uom.setConversion(2275.520677, u2)
-    
-        elif (unit == Unit.SQUARE_INCH):
-            uom = self.createPowerUOM(UnitType.AREA, unit, Localizer.instance().langStr("in2.name"),
-                Localizer.instance().langStr("in2.symbol"), Localizer.instance().langStr("in2.desc"), self.getUOM(Unit.INCH), 2)
-            uom.setConversion(1.0 / 144.0, self.getUOM(Unit.SQUARE_FOOT))
-                
-        elif (unit == Unit.SQUARE_FOOT):
-            uom = self.createPowerUOM(UnitType.AREA, unit, Localizer.instance().langStr("ft2.name"),
-                Localizer.instance().langStr("ft2.symbol"), Localizer.instance().langStr("ft2.desc"), self.getUOM(Unit.FOOT), 2)
-                
-        elif (unit == Unit.SQUARE_YARD):
-            uom = self.createPowerUOM(UnitType.AREA, unit, Localizer.instance().langStr("yd2.name"),
-                Localizer.instance().langStr("yd2.symbol"), Localizer.instance().langStr("yd2.desc"), self.getUOM(Unit.YARD), 2)    
-                
-        elif (unit == Unit.ACRE):
-            uom = self.createScalarUOM(UnitType.AREA, unit, Localizer.instance().langStr("acre.name"),
-                Localizer.instance().langStr("acre.symbol"), Localizer.instance().langStr("acre.desc"))
-            uom.setConversion(43560.0, self.getUOM(Unit.SQUARE_FOOT))
-                
-        elif (unit == Unit.CUBIC_INCH):
-            uom = self.createPowerUOM(UnitType.VOLUME, unit, Localizer.instance().langStr("in3.name"),
-                Localizer.instance().langStr("in3.symbol"), Localizer.instance().langStr("in3.desc"), self.getUOM(Unit.INCH), 3)
-            uom.setConversion(1.0 / 1728.0, self.getUOM(Unit.CUBIC_FOOT))
-            
-        elif (unit == Unit.CUBIC_FOOT):
-            uom = self.createPowerUOM(UnitType.VOLUME, unit, Localizer.instance().langStr("ft3.name"),
-                Localizer.instance().langStr("ft3.symbol"), Localizer.instance().langStr("ft3.desc"), self.getUOM(Unit.FOOT), 3)
-                
-        elif (unit == Unit.CUBIC_FEET_PER_SEC):
-            uom = self.createQuotientUOM(UnitType.VOLUMETRIC_FLOW, unit,
-                Localizer.instance().langStr("ft3PerSec.name"), Localizer.instance().langStr("ft3PerSec.symbol"),
-                Localizer.instance().langStr("ft3PerSec.desc"), self.getUOM(Unit.CUBIC_FOOT), self.getSecond())
-            
-        elif (unit == Unit.CORD):
-            uom = self.createScalarUOM(UnitType.VOLUME, unit, Localizer.instance().langStr("cord.name"),
-                Localizer.instance().langStr("cord.symbol"), Localizer.instance().langStr("cord.desc"))
-            uom.setConversion(128.0, self.getUOM(Unit.CUBIC_FOOT))
-                
-        elif (unit == Unit.CUBIC_YARD):
-            uom = self.createPowerUOM(UnitType.VOLUME, unit, Localizer.instance().langStr("yd3.name"),
-                Localizer.instance().langStr("yd3.symbol"), Localizer.instance().langStr("yd3.desc"), self.getUOM(Unit.YARD), 3)
-                
-        elif (unit == Unit.FEET_PER_SEC):
-            uom = self.createQuotientUOM(UnitType.VELOCITY, unit, Localizer.instance().langStr("fps.name"),
-                Localizer.instance().langStr("fps.symbol"), Localizer.instance().langStr("fps.desc"), self.getUOM(Unit.FOOT), self.getSecond())
-                
-        elif (unit == Unit.KNOT):
-            uom = self.createScalarUOM(UnitType.VELOCITY, unit, Localizer.instance().langStr("knot.name"),
-                Localizer.instance().langStr("knot.symbol"), Localizer.instance().langStr("knot.desc"))
-            uom.setConversion(6080.0 / 3600.0, self.getUOM(Unit.FEET_PER_SEC))
-                
-        elif (unit == Unit.FEET_PER_SEC_SQUARED):
-            uom = self.createQuotientUOM(UnitType.ACCELERATION, Unit.FEET_PER_SEC_SQUARED, Localizer.instance().langStr("ftps2.name"),
-                    Localizer.instance().langStr("ftps2.symbol"), Localizer.instance().langStr("ftps2.desc"), self.getUOM(Unit.FOOT),
-                    self.getUOM(Unit.SQUARE_SECOND))
-    
-        elif (unit == Unit.HP):
-            uom = self.createProductUOM(UnitType.POWER, unit, Localizer.instance().langStr("hp.name"), Localizer.instance().langStr("hp.symbol"),
-                Localizer.instance().langStr("hp.desc"), self.getUOM(Unit.POUND_FORCE), self.getUOM(Unit.FEET_PER_SEC))
-            uom.scalingFactor = 550.0
-            
-        elif (unit == Unit.BTU):
-            uom = self.createScalarUOM(UnitType.ENERGY, Unit.BTU, Localizer.instance().langStr("btu.name"), Localizer.instance().langStr("btu.symbol"),
-                Localizer.instance().langStr("btu.desc"))
-            uom.setConversion(778.1692622659652, self.getUOM(Unit.FOOT_POUND_FORCE))          
-    
-        elif (unit == Unit.FOOT_POUND_FORCE):
-            uom = self.createProductUOM(UnitType.ENERGY, unit, Localizer.instance().langStr("ft_lbf.name"),
-                Localizer.instance().langStr("ft_lbf.symbol"), Localizer.instance().langStr("ft_lbf.desc"), self.getUOM(Unit.FOOT),
-                self.getUOM(Unit.POUND_FORCE))
-            
-        elif (unit == Unit.POUND_FORCE):
-            uom = self.createProductUOM(UnitType.FORCE, unit, Localizer.instance().langStr("lbf.name"),
-                Localizer.instance().langStr("lbf.symbol"), Localizer.instance().langStr("lbf.desc"), self.getUOM(Unit.POUND_MASS),
-                self.getUOM(Unit.FEET_PER_SEC_SQUARED))
-    
-            # factor is acceleration of gravity
-            gravity = self.getQuantity(Constant.GRAVITY).convert(self.getUOM(Unit.FEET_PER_SEC_SQUARED))
-            uom.scalingFactor = gravity.amount
-                
-        elif (unit == Unit.GRAIN):
-            uom = self.createScalarUOM(UnitType.MASS, unit, Localizer.instance().langStr("grain.name"),
-                Localizer.instance().langStr("grain.symbol"), Localizer.instance().langStr("grain.desc"))
-            uom.setConversion(1.0 / 7000.0, self.getUOM(Unit.POUND_MASS))
-                
-        elif (unit == Unit.MILES_PER_HOUR):
-            uom = self.createScalarUOM(UnitType.VELOCITY, unit, Localizer.instance().langStr("mph.name"),
-                    Localizer.instance().langStr("mph.symbol"), Localizer.instance().langStr("mph.desc"))
-            uom.setConversion(5280.0 / 3600.0, self.getUOM(Unit.FEET_PER_SEC))
-                
-        elif (unit == Unit.REV_PER_MIN):
-            return self.createQuotientUOM(UnitType.FREQUENCY, unit, Localizer.instance().langStr("rpm.name"),
-                Localizer.instance().langStr("rpm.symbol"), Localizer.instance().langStr("rpm.desc"), self.getOne(), self.getMinute())       
-            
-        return uom   
+    ##
+    # Add or replace unit definitions from data, e.g. loaded from JSON
+    # 
+    # @param data Dictionary of {@link Unit} name and dictionary of {@link UnitDefinition} arguments
+    def defineUnits(self, data):
+        for name, values in data.items():
+            self.defineUnit(Unit[name], UnitDefinition.fromDict(values))
 
-    def createUSUnit(self, unit):
-        uom = None
-        
-        if (unit == Unit.US_GALLON):
-            uom = self.createScalarUOM(UnitType.VOLUME, unit,
-                Localizer.instance().langStr("us_gallon.name"), Localizer.instance().langStr("us_gallon.symbol"), Localizer.instance().langStr("us_gallon.desc"))
-            uom.setConversion(231.0, self.getUOM(Unit.CUBIC_INCH), 0.0)
-        
-        elif (unit == Unit.US_BARREL):        
-            uom = self.createScalarUOM(UnitType.VOLUME, unit, Localizer.instance().langStr("us_bbl.name"),
-                    Localizer.instance().langStr("us_bbl.symbol"), Localizer.instance().langStr("us_bbl.desc"))
-            uom.setConversion(42.0, self.getUOM(Unit.US_GALLON))
-        
-        elif (unit == Unit.US_BUSHEL):        
-            uom = self.createScalarUOM(UnitType.VOLUME, unit, Localizer.instance().langStr("us_bu.name"),
-                    Localizer.instance().langStr("us_bu.symbol"), Localizer.instance().langStr("us_bu.desc"))
-            uom.setConversion(2150.42058, self.getUOM(Unit.CUBIC_INCH))   
-    
-        elif (unit == Unit.US_FLUID_OUNCE):        
-            uom = self.createScalarUOM(UnitType.VOLUME, unit, Localizer.instance().langStr("us_fl_oz.name"),
-                    Localizer.instance().langStr("us_fl_oz.symbol"), Localizer.instance().langStr("us_fl_oz.desc"))
-            uom.setConversion(0.0078125, self.getUOM(Unit.US_GALLON))
-           
-        elif (unit == Unit.US_CUP):
-            uom = self.createScalarUOM(UnitType.VOLUME, unit, Localizer.instance().langStr("us_cup.name"),
-                    Localizer.instance().langStr("us_cup.symbol"), Localizer.instance().langStr("us_cup.desc"))
-            uom.setConversion(8.0, self.getUOM(Unit.US_FLUID_OUNCE))
-    
-        elif (unit == Unit.US_PINT):
-            uom = self.createScalarUOM(UnitType.VOLUME, unit, Localizer.instance().langStr("us_pint.name"),
-                    Localizer.instance().langStr("us_pint.symbol"), Localizer.instance().langStr("us_pint.desc"))
-            uom.setConversion(16.0, self.getUOM(Unit.US_FLUID_OUNCE))
-    
-        elif (unit == Unit.US_QUART):        
-            uom = self.createScalarUOM(UnitType.VOLUME, unit, Localizer.instance().langStr("us_quart.name"),
-                    Localizer.instance().langStr("us_quart.symbol"), Localizer.instance().langStr("us_quart.desc"))
-            uom.setConversion(32.0, self.getUOM(Unit.US_FLUID_OUNCE))
+    ##
+    # Get the definition of the unit of measure for a {@link Unit}
+    # 
+    # @param unit {@link Unit}
+    # @return {@link UnitDefinition} or None if not defined
+    def getUnitDefinition(self, unit):
+        return self.definitions.get(unit)
+
+    ##
+    # Get the unit of measure for a reference in a {@link UnitDefinition}
+    # 
+    # @param reference {@link Unit}, symbol, {@link UnitOfMeasure} or function of this measurement system
+    # @return {@link UnitOfMeasure}
+    def resolveReference(self, reference):
+        if (reference is None or isinstance(reference, UnitOfMeasure)):
+            return reference
         
-        elif (unit == Unit.US_TABLESPOON):
-            uom = self.createScalarUOM(UnitType.VOLUME, unit, Localizer.instance().langStr("us_tbsp.name"),
-                    Localizer.instance().langStr("us_tbsp.symbol"), Localizer.instance().langStr("us_tbsp.desc"))
-            uom.setConversion(0.5, self.getUOM(Unit.US_FLUID_OUNCE))
+        if (isinstance(reference, Unit)):
+            return self.getUOM(reference)
         
-        elif (unit == Unit.US_TEASPOON):        
-            uom = self.createScalarUOM(UnitType.VOLUME, Unit.US_TEASPOON, Localizer.instance().langStr("us_tsp.name"),
-                    Localizer.instance().langStr("us_tsp.symbol"), Localizer.instance().langStr("us_tsp.desc"))
-            uom.setConversion(1.0 / 6.0, self.getUOM(Unit.US_FLUID_OUNCE))       
+        if (isinstance(reference, str)):
+            uom = self.getUOMBySymbol(reference)
+            
+            if (uom is None):
+                msg = Localizer.instance().messageStr("unit.not.defined").format(reference)
+                raise PyCaliperException(msg)
+            return uom
         
-        elif (unit == Unit.US_TON):
-            uom = self.createScalarUOM(UnitType.MASS, unit, Localizer.instance().langStr("us_ton.name"),
-                Localizer.instance().langStr("us_ton.symbol"), Localizer.instance().langStr("us_ton.desc"))
-            uom.setConversion(2000.0, self.getUOM(Unit.POUND_MASS)) 
-               
-        return uom
-    
-    def createBRUnit(self, unit):
-        uom = None
+        return reference(self)
+
+    ##
+    # Get the value of a scaling factor in a {@link UnitDefinition}
+    # 
+    # @param value Number or function of this measurement system
+    # @return Number
+    def resolveFactor(self, value):
+        if (value is None or isinstance(value, (int, float))):
+            return value
         
-        if (unit == Unit.BR_GALLON):
-            uom = self.createScalarUOM(UnitType.VOLUME, unit,
-                    Localizer.instance().langStr("br_gallon.name"), Localizer.instance().langStr("br_gallon.symbol"), Localizer.instance().langStr("br_gallon.desc"))
-            uom.setConversion(277.4194327916215, self.getUOM(Unit.CUBIC_INCH), 0.0) 
-    
-        elif (unit == Unit.BR_BUSHEL):
-            uom = self.createScalarUOM(UnitType.VOLUME, unit, Localizer.instance().langStr("br_bu.name"),
-                Localizer.instance().langStr("br_bu.symbol"), Localizer.instance().langStr("br_bu.desc"))
-            uom.setConversion(8.0, self.getUOM(Unit.BR_GALLON))
+        return value(self)
+
+    ##
+    # Create the unit of measure for a {@link Unit} from its definition
+    # 
+    # @param unit {@link Unit}
+    # @return {@link UnitOfMeasure} or None if not defined
+    def createUOMForUnit(self, unit):
+        definition = self.definitions.get(unit)
         
-        elif (unit == Unit.BR_FLUID_OUNCE):
-            uom = self.createScalarUOM(UnitType.VOLUME, unit, Localizer.instance().langStr("br_fl_oz.name"),
-                Localizer.instance().langStr("br_fl_oz.symbol"), Localizer.instance().langStr("br_fl_oz.desc"))
-            uom.setConversion(0.00625, self.getUOM(Unit.BR_GALLON))
+        if (definition is None):
+            return None
         
-        elif (unit == Unit.BR_CUP):
-            uom = self.createScalarUOM(UnitType.VOLUME, unit, Localizer.instance().langStr("br_cup.name"),
-                Localizer.instance().langStr("br_cup.symbol"), Localizer.instance().langStr("br_cup.desc"))
-            uom.setConversion(8.0, self.getUOM(Unit.BR_FLUID_OUNCE))
+        # a localized name and description are looked up when they are read
+        name = definition.name
+        symbol = self.getDefinedSymbols().get(unit)
+        description = definition.description
         
-        elif (unit == Unit.BR_PINT):
-            uom = self.createScalarUOM(UnitType.VOLUME, unit, Localizer.instance().langStr("br_pint.name"),
-                Localizer.instance().langStr("br_pint.symbol"), Localizer.instance().langStr("br_pint.desc"))
-            uom.setConversion(20.0, self.getUOM(Unit.BR_FLUID_OUNCE))
-    
-        elif (unit == Unit.BR_QUART):
-            uom = self.createScalarUOM(UnitType.VOLUME, unit, Localizer.instance().langStr("br_quart.name"),
-                Localizer.instance().langStr("br_quart.symbol"), Localizer.instance().langStr("br_quart.desc"))
-            uom.setConversion(40.0, self.getUOM(Unit.BR_FLUID_OUNCE))
+        measurementType = definition.measurementType
         
-        elif (unit == Unit.BR_TABLESPOON):
-            uom = self.createScalarUOM(UnitType.VOLUME, unit, Localizer.instance().langStr("br_tbsp.name"),
-               Localizer.instance().langStr("br_tbsp.symbol"), Localizer.instance().langStr("br_tbsp.desc"))
-            uom.setConversion(0.625, self.getUOM(Unit.BR_FLUID_OUNCE))  
-
-        elif (unit == Unit.BR_TEASPOON):
-            uom = self.createScalarUOM(UnitType.VOLUME, unit, Localizer.instance().langStr("br_tsp.name"),
-                Localizer.instance().langStr("br_tsp.symbol"), Localizer.instance().langStr("br_tsp.desc"))
-            uom.setConversion(5.0 / 24.0, self.getUOM(Unit.BR_FLUID_OUNCE))
+        if (measurementType == MeasurementType.POWER):
+            uom = self.createPowerUOM(definition.unitType, unit, name, symbol, description,
+                    self.resolveReference(definition.uom1), definition.exponent)
+            
+        elif (measurementType == MeasurementType.PRODUCT):
+            uom = self.createProductUOM(definition.unitType, unit, name, symbol, description,
+                    self.resolveReference(definition.uom1), self.resolveReference(definition.uom2))
+            
+        elif (measurementType == MeasurementType.QUOTIENT):
+            uom = self.createQuotientUOM(definition.unitType, unit, name, symbol, description,
+                    self.resolveReference(definition.uom1), self.resolveReference(definition.uom2))
+            
+        else:
+            uom = self.createScalarUOM(definition.unitType, unit, name, symbol, description)
+
+        if (definition.key is not None):
+            uom.textKey = definition.key
         
-        elif (unit == Unit.BR_TON):
-            uom = self.createScalarUOM(UnitType.MASS, unit, Localizer.instance().langStr("br_ton.name"),
-                Localizer.instance().langStr("br_ton.symbol"), Localizer.instance().langStr("br_ton.desc"))
-            uom.setConversion(2240.0, self.getUOM(Unit.POUND_MASS))    
-                
-        return uom     
-    
-    def createFinancialUnit(self, unit):
-        uom = None 
+        # conversion
+        scalingFactor = self.resolveFactor(definition.scalingFactor)
         
-        if (unit == Unit.US_DOLLAR):
-            uom = self.createScalarUOM(UnitType.CURRENCY, unit,
-            Localizer.instance().langStr("us_dollar.name"), Localizer.instance().langStr("us_dollar.symbol"), Localizer.instance().langStr("us_dollar.desc"))
+        if (definition.abscissaUnit is not None):
+            uom.setConversion(scalingFactor, self.resolveReference(definition.abscissaUnit), definition.offset)
+            
+        elif (scalingFactor is not None):
+            # scaled product, quotient or power
+            uom.scalingFactor = scalingFactor
         
-        elif (unit == Unit.EURO):
-            uom = self.createScalarUOM(UnitType.CURRENCY, unit, Localizer.instance().langStr("euro.name"),
-            Localizer.instance().langStr("euro.symbol"), Localizer.instance().langStr("euro.desc"))
+        # bridge to another measurement system
+        if (definition.bridgeAbscissaUnit is not None):
+            uom.setBridgeConversion(self.resolveFactor(definition.bridgeScalingFactor),
+                    self.resolveReference(definition.bridgeAbscissaUnit), definition.bridgeOffset)
         
-        elif (unit == Unit.YUAN):
-            uom = self.createScalarUOM(UnitType.CURRENCY, unit, Localizer.instance().langStr("yuan.name"),
-            Localizer.instance().langStr("yuan.symbol"), Localizer.instance().langStr("yuan.desc"))
-    
         return uom
     
-    def createUOMForUnit(self, unit):
-        # SI
-        uom = self.createBaseSIUnit(unit)
-
-        if (uom is not None):
-            return uom
-                
-        # SI other
-        uom = self.createSIUnit(unit)
-
-        if (uom is not None):
-            return uom
-
-        # Customary
-        uom = self.createCustomaryUnit(unit)
-
-        if (uom is not None):
-            return uom
+    ##
+    # Get the quantity defined as a constant value. The quantity is created
+    # once and cached, so it is immutable.
+    # 
+    # @param constant {@link Constant}
+    # @return {@link FrozenQuantity}
+    def getQuantity(self, constant):
+        cacheManager = CacheManager.instance()
+        named = cacheManager.getConstant(constant)
 
-        # US
-        uom = self.createUSUnit(unit)
+        if (named is not None):
+            return named
 
-        if (uom is not None):
-            return uom
+        with self.lock:
+            named = cacheManager.getConstant(constant)
 
-        # British
-        uom = self.createBRUnit(unit)
+            if (named is None):
+                named = self.createQuantity(constant)
 
-        if (uom is not None):
-            return uom
+                if (named is not None):
+                    named = named.freeze()
+                    cacheManager.registerConstant(constant, named)
 
-        # currency
-        uom = self.createFinancialUnit(unit)
+        return named
 
-        return uom
-    
     ##
-    # Get the quantity defined as a constant value
+    # Create the quantity defined as a constant value
     # 
     # @param constant {@link Constant}
     # @return {@link Quantity}
-    def getQuantity(self, constant):
+    def createQuantity(self, constant):
         named = None
 
         if (constant == Constant.LIGHT_VELOCITY):
             named = Quantity(299792458.0, self.getUOM(Unit.METRE_PER_SEC))
-            named.name = Localizer.instance().langStr("light.name")
-            named.symbol = Localizer.instance().langStr("light.symbol")
-            named.description = Localizer.instance().langStr("light.desc")
+            named.setTextKey("light")
             
         elif (constant == Constant.LIGHT_YEAR):
             year = Quantity(1.0, self.getUOM(Unit.JULIAN_YEAR))
             named = self.getQuantity(Constant.LIGHT_VELOCITY).multiply(year)
-            named.name = Localizer.instance().langStr("ly.name")
-            named.symbol = Localizer.instance().langStr("ly.symbol")
-            named.description = Localizer.instance().langStr("ly.desc")
+            named.setTextKey("ly")
             
         elif (constant == Constant.GRAVITY):
             named = Quantity(9.80665, self.getUOM(Unit.METRE_PER_SEC_SQUARED))
-            named.name = Localizer.instance().langStr("gravity.name")
-            named.symbol = Localizer.instance().langStr("gravity.symbol")
-            named.description = Localizer.instance().langStr("gravity.desc")
+            named.setTextKey("gravity")
             
         elif (constant == Constant.PLANCK_CONSTANT):
             js = self.createUnclassifiedProductUOM(self.getUOM(Unit.JOULE), self.getSecond())
             named = Quantity(6.62607015E-34, js)
-            named.name = Localizer.instance().langStr("planck.name")
-            named.symbol = Localizer.instance().langStr("planck.symbol")
-            named.description = Localizer.instance().langStr("planck.desc")
+            named.setTextKey("planck")
             
         elif (constant == Constant.BOLTZMANN_CONSTANT):
             jk = self.createUnclassifiedQuotientUOM(self.getUOM(Unit.JOULE), self.getUOM(Unit.KELVIN))
             named = Quantity(1.380649E-23, jk)
-            named.name = Localizer.instance().langStr("boltzmann.name")
-            named.symbol = Localizer.instance().langStr("boltzmann.symbol")
-            named.description = Localizer.instance().langStr("boltzmann.desc")    
+            named.setTextKey("boltzmann")
 
         elif (constant == Constant.AVOGADRO_CONSTANT):
             # NA
             named = Quantity(6.02214076E+23, self.getOne())
-            named.name = Localizer.instance().langStr("avo.name")
-            named.symbol = Localizer.instance().langStr("avo.symbol")
-            named.description = Localizer.instance().langStr("avo.desc")
+            named.setTextKey("avo")
             
         elif (constant == Constant.GAS_CONSTANT):
             # R
             named = self.getQuantity(Constant.BOLTZMANN_CONSTANT).multiply(self.getQuantity(Constant.AVOGADRO_CONSTANT))
-            named.name = Localizer.instance().langStr("gas.name")
-            named.symbol = Localizer.instance().langStr("gas.symbol")
-            named.description = Localizer.instance().langStr("gas.desc")
+            named.setTextKey("gas")
             
         elif (constant == Constant.ELEMENTARY_CHARGE):
             # e
             named = Quantity(1.602176634E-19, self.getUOM(Unit.COULOMB))
-            named.name = Localizer.instance().langStr("e.name")
-            named.symbol = Localizer.instance().langStr("e.symbol")
-            named.description = Localizer.instance().langStr("e.desc")
+            named.setTextKey("e")
             
         elif (constant == Constant.FARADAY_CONSTANT):
             # F = e.NA
             qe = self.getQuantity(Constant.ELEMENTARY_CHARGE)
             named = qe.multiply(self.getQuantity(Constant.AVOGADRO_CONSTANT))
-            named.name = Localizer.instance().langStr("faraday.name")
-            named.symbol = Localizer.instance().langStr("faraday.symbol")
-            named.description = Localizer.instance().langStr("faraday.desc")
+            named.setTextKey("faraday")
             
         elif (constant == Constant.ELECTRIC_PERMITTIVITY):
             # epsilon0 = 1/(mu0*c^2)
             vc = self.getQuantity(Constant.LIGHT_VELOCITY)
             named = self.getQuantity(Constant.MAGNETIC_PERMEABILITY).multiply(vc).multiply(vc).invert()
-            named.name = Localizer.instance().langStr("eps0.name")
-            named.symbol = Localizer.instance().langStr("eps0.symbol")
-            named.description = Localizer.instance().langStr("eps0.desc")
+            named.setTextKey("eps0")
             
         elif (constant == Constant.MAGNETIC_PERMEABILITY):
             # mu0
             hm = self.createUnclassifiedQuotientUOM(self.getUOM(Unit.HENRY), self.getUOM(Unit.METRE))
             fourPi = 4.0 * math.pi * 1.0E-07
             named = Quantity(fourPi, hm)
-            named.name = Localizer.instance().langStr("mu0.name")
-            named.symbol = Localizer.instance().langStr("mu0.symbol")
-            named.description = Localizer.instance().langStr("mu0.desc")
+            named.setTextKey("mu0")
             
         elif (constant == Constant.ELECTRON_MASS):
             # me
             named = Quantity(9.1093835611E-28, self.getUOM(Unit.GRAM))
-            named.name = Localizer.instance().langStr("me.name")
-            named.symbol = Localizer.instance().langStr("me.symbol")
-            named.description = Localizer.instance().langStr("me.desc")
+            named.setTextKey("me")
             
         elif (constant == Constant.PROTON_MASS):
             # mp
             named = Quantity(1.67262189821E-24, self.getUOM(Unit.GRAM))
-            named.name = Localizer.instance().langStr("mp.name")
-            named.symbol = Localizer.instance().langStr("mp.symbol")
-            named.description = Localizer.instance().langStr("mp.desc")
+            named.setTextKey("mp")
             
         elif (constant == Constant.STEFAN_BOLTZMANN):
             k4 = self.createUnclassifiedPowerUOM(self.getUOM(Unit.KELVIN), 4)
             sb = self.createUnclassifiedQuotientUOM(self.getUOM(Unit.WATTS_PER_SQ_METRE), k4)
             named = Quantity(5.67036713E-08, sb)
-            named.name = Localizer.instance().langStr("sb.name")
-            named.symbol = Localizer.instance().langStr("sb.symbol")
-            named.description = Localizer.instance().langStr("sb.desc")
+            named.setTextKey("sb")
             
         elif (constant == Constant.HUBBLE_CONSTANT):
             kps = self.createPrefixedUOM(Prefix.kilo(), self.getUOM(Unit.METRE_PER_SEC))
             mpc = self.createPrefixedUOM(Prefix.mega(), self.getUOM(Unit.PARSEC))
             hubble = self.createUnclassifiedQuotientUOM(kps, mpc)
             named = Quantity(71.9, hubble)
-            named.name = Localizer.instance().langStr("hubble.name")
-            named.symbol = Localizer.instance().langStr("hubble.symbol")
-            named.description = Localizer.instance().langStr("hubble.desc")
+            named.setTextKey("hubble")
                  
         elif (constant == Constant.CAESIUM_FREQUENCY):
             named = Quantity(9192631770.0, self.getUOM(Unit.HERTZ))
-            named.name = Localizer.instance().langStr("caesium.name")
-            named.symbol = Localizer.instance().langStr("caesium.symbol")
-            named.description = Localizer.instance().langStr("caesium.desc")
+            named.setTextKey("caesium")
                       
         elif (constant == Constant.LUMINOUS_EFFICACY):
             kcd = self.createUnclassifiedQuotientUOM(self.getUOM(Unit.LUMEN), self.getUOM(Unit.WATT))
             named = Quantity(683.0, kcd)
-            named.name = Localizer.instance().langStr("kcd.name")
-            named.symbol = Localizer.instance().langStr("kcd.symbol")
-            named.description = Localizer.instance().langStr("kcd.desc")
+            named.setTextKey("kcd")
 
         return named
 
@@ -1017,9 +397,10 @@ class MeasurementSystem:
     # @param exponent    Exponent
     # @return {@link UnitOfMeasure}    
     def createPowerUOM(self, unitType, unit, name, symbol, description, base, exponent):
-        uom = self.createUOM(unitType, unit, name, symbol, description)
-        uom.setPowerUnit(base, exponent)
-        CacheManager.instance().registerUOM(uom)
+        with self.lock:
+            uom = self.createUOM(unitType, unit, name, symbol, description)
+            uom.setPowerUnit(base, exponent)
+            CacheManager.instance().registerUOM(uom)
         return uom
 
     ##
@@ -1049,9 +430,10 @@ class MeasurementSystem:
     # @param multiplicand {@link UnitOfMeasure} multiplicand
     # @return {@link UnitOfMeasure}   
     def createProductUOM(self, unitType, unit, name, symbol, description, multiplier, multiplicand):
-        uom = self.createUOM(unitType, unit, name, symbol, description)
-        uom.setProductUnits(multiplier, multiplicand)
-        CacheManager.instance().registerUOM(uom)
+        with self.lock:
+            uom = self.createUOM(unitType, unit, name, symbol, description)
+            uom.setProductUnits(multiplier, multiplicand)
+            CacheManager.instance().registerUOM(uom)
         return uom
 
     ##
@@ -1102,9 +484,10 @@ class MeasurementSystem:
     # @param divisor     {@link UnitOfMeasure}
     # @return {@link UnitOfMeasure}    
     def createQuotientUOM(self, unitType, unit, name, symbol, description, dividend, divisor):
-        uom = self.createUOM(unitType, unit, name, symbol, description)
-        uom.setQuotientUnits(dividend, divisor)
-        CacheManager.instance().registerUOM(uom)
+        with self.lock:
+            uom = self.createUOM(unitType, unit, name, symbol, description)
+            uom.setQuotientUnits(dividend, divisor)
+            CacheManager.instance().registerUOM(uom)
         return uom
 
     def createUOM(self, unitType, unit, name, symbol, description):
@@ -1142,6 +525,70 @@ class MeasurementSystem:
     def getUOMKey(uom):
         return uom.symbol
     
+    ##
+    # Create the units of measure for all of the {@link Unit} enumerations
+    # together with their base symbols and reductions, and cache the
+    # conversion factors between the units of measure of each {@link UnitType}.
+    # This moves the cost of lazy creation to start-up, for example before
+    # worker processes are forked.
+    # 
+    # @return Elapsed time in seconds
+    def preload(self):
+        start = time.perf_counter()
+        unitsByType = {}
+
+        with self.lock:
+            for unit in Unit:
+                uom = self.getUOM(unit)
+
+                # base symbol, reduction and dimension
+                uom.getBaseSymbol()
+                uom.getDimension()
+
+                unitsByType.setdefault(uom.unitType, []).append(uom)
+
+            # conversion factors within each unit type
+            for uoms in unitsByType.values():
+                for fromUOM in uoms:
+                    for toUOM in uoms:
+                        try:
+                            fromUOM.getConversionFactor(toUOM)
+                        except PyCaliperException:
+                            # not convertible
+                            pass
+
+        return time.perf_counter() - start
+
+    ##
+    # Preload all of the units of measure, then freeze them for sharing with
+    # forked worker processes. Frozen units of measure refuse to be changed,
+    # so reads never write to them. The garbage collector is told to ignore all
+    # existing objects, so that a collection in a worker does not touch, and
+    # thus copy, the memory pages inherited from the parent process.
+    # 
+    # @return Elapsed time of the preload in seconds
+    def freeze(self):
+        elapsed = self.preload()
+
+        with self.lock:
+            CacheManager.instance().freeze()
+
+        # not available on every Python implementation
+        if (hasattr(gc, "freeze")):
+            gc.collect()
+            gc.freeze()
+
+        return elapsed
+
+    ##
+    # Allow the units of measure to be changed again after {@link #freeze}
+    def unfreeze(self):
+        if (hasattr(gc, "unfreeze")):
+            gc.unfreeze()
+
+        with self.lock:
+            CacheManager.instance().unfreeze()
+
     ##
     # Get all units currently cached by this measurement system
     # 
@@ -1421,8 +868,96 @@ class MeasurementSystem:
             
         return units
             
+    ##
+    # Get the cached unit of measure with this symbol. A unit of measure that
+    # another thread is still creating is returned once it is complete.
+    # 
+    # @param symbol Symbol
+    # @return {@link UnitOfMeasure} or None if not cached
     def getUOMBySymbol(self, symbol):
-        return CacheManager.instance().getUOMBySymbol(symbol)
+        uom = CacheManager.instance().getUOMBySymbol(symbol)
+
+        # a unit of measure is cached before its conversion is set
+        if (uom is None or not self.pending or uom.unit not in self.pending):
+            return uom
+
+        with self.lock:
+            return CacheManager.instance().getUOMBySymbol(symbol)
+
+    ##
+    # Classify units of measure, e.g. the anonymous products and quotients
+    # created by arithmetic, by finding the unit type of each one's dimension
+    # 
+    # @param uoms Iterable of {@link UnitOfMeasure}
+    # @return List of the classified {@link UnitOfMeasure}
+    def classifyMany(self, uoms):
+        return [uom.classify() for uom in uoms]
+
+    ##
+    # Get the symbols of the unit definitions. Localized symbols are looked up
+    # in the message catalog once for all of the units, so that creating a
+    # unit of measure does not need the catalog.
+    # 
+    # @return Dictionary of symbol by {@link Unit}
+    def getDefinedSymbols(self):
+        definedSymbols = self.definedSymbols
+
+        if (definedSymbols is None):
+            definedSymbols = {}
+            localizer = Localizer.instance()
+
+            for unit, definition in list(self.definitions.items()):
+                if (definition.key is not None):
+                    definedSymbols[unit] = localizer.langStr(definition.key + ".symbol")
+                elif (definition.symbol is not None):
+                    definedSymbols[unit] = definition.symbol
+
+            self.definedSymbols = definedSymbols
+
+        return definedSymbols
+
+    ##
+    # Find a unit of measure by symbol. If it is not cached, the {@link Unit}
+    # defined with this symbol is created.
+    # 
+    # @param symbol Symbol
+    # @return {@link UnitOfMeasure} or None if not found
+    def findUOMBySymbol(self, symbol):
+        uom = self.getUOMBySymbol(symbol)
+
+        if (uom is not None):
+            return uom
+
+        unitSymbols = self.unitSymbols
+
+        if (unitSymbols is None):
+            unitSymbols = {symbol: unit for unit, symbol in self.getDefinedSymbols().items()}
+            self.unitSymbols = unitSymbols
+
+        unit = unitSymbols.get(symbol)
+
+        if (unit is None):
+            return None
+
+        return self.getUOM(unit)
+
+    ##
+    # Create a unit of measure from an expression of unit symbols, for example
+    # "kg·m/s²", "kW·h", "m3/h", "lbf/in^2" or "kg/(m·s)". Symbols may have a
+    # {@link Prefix} symbol and are combined with the '·', '*', '.' and '/'
+    # operators, '^' or superscript exponents and parentheses. The result is
+    # cached by expression.
+    # 
+    # @param expression Unit of measure expression
+    # @return {@link UnitOfMeasure}
+    def parseUOM(self, expression):
+        uom = CacheManager.instance().getParsedUOM(expression)
+
+        if (uom is None):
+            uom = SymbolParser(self, expression).parse()
+            CacheManager.instance().registerParsedUOM(expression, uom)
+
+        return uom
 
     ##
     # Create a unit of measure linearly scaled by the {@link Prefix}
@@ -1432,27 +967,204 @@ class MeasurementSystem:
     # @param uom abscissa {@link UnitOfMeasure}
     # @return {@link UnitOfMeasure}  
     def createPrefixedUOM(self, prefix, uom):
+        cacheManager = CacheManager.instance()
+        scaled = cacheManager.getPrefixedUOM(prefix, uom)
+
+        if (scaled is not None):
+            return scaled
+
+        with self.lock:
+            scaled = self.definePrefixedUOM(prefix, uom)
+
+        return scaled
+
+    ##
+    # Create the units of measure for a list of prefixes and base units of
+    # measure at once, e.g. to prepare the units of measure that records
+    # will be read in
+    # 
+    # @param uoms List of base {@link UnitOfMeasure} or {@link Unit}
+    # @param prefixes List of {@link Prefix}, by default the SI prefixes
+    # @return List with a dictionary of the prefixed {@link UnitOfMeasure} by
+    # {@link Prefix} for each base unit of measure
+    def createPrefixedUOMs(self, uoms, prefixes=None):
+        if (prefixes is None):
+            prefixes = Prefix.getSIPrefixes()
+
+        bases = [uom if isinstance(uom, UnitOfMeasure) else self.getUOM(uom) for uom in uoms]
+
+        with self.lock:
+            return [{prefix: self.definePrefixedUOM(prefix, uom) for prefix in prefixes} for uom in bases]
+
+    def definePrefixedUOM(self, prefix, uom):
+        cacheManager = CacheManager.instance()
+        scaled = cacheManager.getPrefixedUOM(prefix, uom)
+
+        if (scaled is not None):
+            return scaled
+
+        # a unit of measure may already be defined with this symbol
         symbol = prefix.symbol + uom.symbol
-        scaled = self.getUOMBySymbol(symbol)
+        scaled = cacheManager.getUOMBySymbol(symbol)
 
         # if not found, create it
         if (scaled is None):
-            # generate a name and description
-            name = prefix.name + uom.name
-            description = str(prefix.factor) + " " + uom.name
+            if (uom.nameText is None and uom.textKey is not None and uom.prefix is None):
+                # localized when the name is read
+                scaled = UnitOfMeasure(uom.unitType, None, symbol, None)
+                scaled.textKey = uom.textKey
+                scaled.prefix = prefix
+            else:
+                # generate a name and description
+                name = prefix.name + uom.name
+                description = str(prefix.factor) + " " + uom.name
+                scaled = UnitOfMeasure(uom.unitType, name, symbol, description)
+                scaled.prefix = prefix
+
+            # set the conversion before caching it, so that it is only cached once
+            scaled.scalingFactor = uom.scalingFactor * prefix.factor
+            scaled.abscissaUnit = uom.abscissaUnit
+            cacheManager.registerUOM(scaled)
+
+        cacheManager.registerPrefixedUOM(prefix, uom, scaled)
+        return scaled
+    
+    ##
+    # Resolve the conversion between two units of measure once into a reusable
+    # converter. The converter can be called on an amount or a collection of
+    # amounts without creating any quantities.
+    #
+    # @param fromUOM Source {@link UnitOfMeasure}
+    # @param toUOM   Target {@link UnitOfMeasure}
+    # @return {@link UnitConverter}
+    def compileConversion(self, fromUOM, toUOM):
+        return UnitConverter(fromUOM, toUOM)
 
-            # scaling factor
-            scalingFactor = uom.scalingFactor * prefix.factor
+    ##
+    # Convert amounts lazily from one unit of measure to another. The
+    # conversion is resolved once, before the first amount is read.
+    #
+    # @param amounts Iterable of amounts in the source unit of measure
+    # @param fromUOM Source {@link UnitOfMeasure}
+    # @param toUOM   Target {@link UnitOfMeasure}
+    # @return Generator of amounts in the target unit of measure
+    def convertStream(self, amounts, fromUOM, toUOM):
+        return self.compileConversion(fromUOM, toUOM).convertStream(amounts)
 
-            # create the unit of measure and set conversion
-            scaled = self.createScalarUOM(uom.unitType, None, name, symbol, description)
-            scaled.setConversion(scalingFactor, uom.abscissaUnit)
+    ##
+    # Convert the amounts in lines of text lazily from one unit of measure to
+    # another, e.g. a column of a CSV file. The conversion is resolved once,
+    # before the first line is read.
+    #
+    # @param lines     Iterable of lines, e.g. an open file
+    # @param fromUOM   Source {@link UnitOfMeasure}
+    # @param toUOM     Target {@link UnitOfMeasure}
+    # @param column    Index of the amount in a delimited line, or None if a line is only an amount
+    # @param delimiter Field delimiter of a delimited line
+    # @return Generator of amounts in the target unit of measure
+    def convertLines(self, lines, fromUOM, toUOM, column=None, delimiter=","):
+        return self.compileConversion(fromUOM, toUOM).convertLines(lines, column, delimiter)
+
+    ##
+    # Convert the amounts in a buffer of doubles from one unit of measure to
+    # another without copying them, in place or into an output buffer
+    #
+    # @param source  Buffer of amounts, e.g. an array.array('d'), mmap or NumPy array
+    # @param fromUOM Source {@link UnitOfMeasure}
+    # @param toUOM   Target {@link UnitOfMeasure}
+    # @param target  Writable output buffer, or None to convert in place
+    # @return Number of amounts converted
+    def convertBuffer(self, source, fromUOM, toUOM, target=None):
+        return self.compileConversion(fromUOM, toUOM).convertBuffer(source, target)
+
+    ##
+    # Convert a file of doubles in native byte order from one unit of measure
+    # to another in chunks
+    #
+    # @param fileName    Name of the file of amounts
+    # @param fromUOM     Source {@link UnitOfMeasure}
+    # @param toUOM       Target {@link UnitOfMeasure}
+    # @param outFileName Name of the output file, or None to convert in place
+    # @param chunkSize   Number of amounts converted at a time
+    # @return Number of amounts converted
+    def convertFile(self, fileName, fromUOM, toUOM, outFileName=None, chunkSize=None):
+        return self.compileConversion(fromUOM, toUOM).convertFile(fileName, outFileName, chunkSize)
+
+    ##
+    # Express a quantity with the {@link Prefix} that gives it an amount of at
+    # least 1 and less than 1000 (or 1024), e.g. 1.5E+07 m as 15 Mm or
+    # 3221225472 bytes as 3 GiB. A quantity in a prefixed unit of measure is
+    # scaled from its unprefixed unit, e.g. 1500 kB as 1.5 MB.
+    #
+    # @param quantity {@link Quantity}
+    # @param binary True for the binary prefixes of computer science
+    # @return {@link Quantity}, the same quantity if no prefix is needed
+    def autoScale(self, quantity, binary=False):
+        factor, uom = self.removePrefix(quantity.uom)
+        amount = quantity.amount * factor
+        prefix = Prefix.bestPrefix(abs(amount), binary)
+
+        if (prefix is None):
+            return quantity if uom is quantity.uom else Quantity(amount, uom)
+
+        return Quantity(amount / prefix.factor, self.createPrefixedUOM(prefix, uom))
+
+    ##
+    # Express amounts with the one {@link Prefix} that suits the largest of
+    # them, e.g. for a column of a table. NumPy arrays are scaled in one
+    # vectorized operation.
+    #
+    # @param amounts Sequence or NumPy array of amounts
+    # @param uom {@link UnitOfMeasure} of the amounts, scaled from its
+    # unprefixed unit if it is prefixed
+    # @param binary True for the binary prefixes of computer science
+    # @return Tuple of the scaled amounts and their {@link UnitOfMeasure}
+    def autoScaleAmounts(self, amounts, uom, binary=False):
+        unprefixedFactor, unprefixed = self.removePrefix(uom)
+
+        try:
+            # NumPy array
+            magnitude = float(abs(amounts).max()) if len(amounts) > 0 else 0.0
+        except (TypeError, AttributeError):
+            magnitude = max((abs(amount) for amount in amounts), default=0.0)
+
+        prefix = Prefix.bestPrefix(magnitude * unprefixedFactor, binary)
+
+        if (prefix is None and unprefixed is uom):
+            return amounts, uom
+
+        # from the prefix of the amounts to the best one
+        scaledUOM = unprefixed if prefix is None else self.createPrefixedUOM(prefix, unprefixed)
+        factor = (1.0 if prefix is None else prefix.factor) / unprefixedFactor
+
+        try:
+            scaled = amounts / factor
+        except TypeError:
+            scaled = [amount / factor for amount in amounts]
+
+        return scaled, scaledUOM
+
+    ##
+    # Get the unit of measure that a prefixed unit of measure was created from
+    # by {@link #createPrefixedUOM}
+    #
+    # @param uom {@link UnitOfMeasure}
+    # @return Tuple of the prefix factor and the unprefixed {@link UnitOfMeasure},
+    # or 1 and the unit of measure itself if it is not prefixed
+    def removePrefix(self, uom):
+        if (uom.prefix is None):
+            return 1.0, uom
+
+        unprefixed = self.getUOMBySymbol(uom.symbol[len(uom.prefix.symbol):])
+
+        if (unprefixed is None):
+            msg = Localizer.instance().messageStr("prefix.base.not.found").format(uom.symbol)
+            raise PyCaliperException(msg)
+
+        return uom.prefix.factor, unprefixed
 
-        return scaled
-    
     def quantityFromPrefixedUnit(self, amount, prefix, unit):
-        uom = self.createPrefixedUOM(prefix, MeasurementSystem.instance().getUOM(unit))
-        return Quantity(amount, uom)
+        return Quantity(amount, self.createPrefixedUOM(prefix, self.getUOM(unit)))
     
     def quantityFromUnit(self, amount, unit): 
         uom = MeasurementSystem.instance().getUOM(unit)
@@ -1463,6 +1175,18 @@ class MeasurementSystem:
         uom = MeasurementSystem.instance().getUOM(unit)
         return Quantity(amount, uom)
 
+    ##
+    # Parse amount strings in one pass into arrays of amounts grouped by unit
+    # of measure. Malformed rows are reported by index in the batch's errors
+    # instead of raising an exception.
+    # 
+    # @param strAmounts Sequence of amount strings
+    # @param units Sequence with a {@link Unit}, {@link UnitOfMeasure} or symbol 
+    # expression for each amount, or one of them for all of the amounts
+    # @return {@link QuantityBatch}
+    def quantitiesFromStrings(self, strAmounts, units):
+        return QuantityBatch(self).parse(strAmounts, units)
+
     ##
     # Convert this quantity to the target unit
     # 
@@ -1485,7 +1209,7 @@ class MeasurementSystem:
     #            {@link Unit}
     # @return {@link Quantity}  
     def convertQuantityToPrefixUnit(self, quantity, prefix, unit):
-        return quantity.convert(MeasurementSystem.instance().createPrefixedUOM(prefix, unit))
+        return quantity.convert(self.createPrefixedUOM(prefix, self.getUOM(unit)))
 
     ##
     # Raise this quantity to the specified power
@@ -1,3 +1,5 @@
+import math
+
 ##
 # The Prefix class defines SI unit of measure prefixes as well as those found in computer science.
 #
@@ -7,6 +9,14 @@ class Prefix:
     
     # list of cached prefixes  
     prefixes = []
+
+    # cached prefixes by name, symbol and rounded log10 of the factor
+    prefixesByName = {}
+    prefixesBySymbol = {}
+    prefixesByExponent = {}
+
+    # true when every prefix has been created
+    allCreated = False
     
     # Cached prefix instances
     _cached_prefixes = {}
@@ -188,8 +198,47 @@ class Prefix:
         self.symbol = symbol
         self.factor = factor
 
-        if self not in Prefix.prefixes:
+        if name not in Prefix.prefixesByName:
             Prefix.prefixes.append(self)
+            Prefix.prefixesByName[name] = self
+            Prefix.prefixesBySymbol[symbol] = self
+            Prefix.prefixesByExponent[Prefix.exponentKey(factor)] = self
+
+    ##
+    # Get all of the prefixes, creating those that have not been used yet
+    # 
+    # @return List of {@link Prefix}
+    #
+    @classmethod
+    def getPrefixes(cls):
+        if (not cls.allCreated):
+            for create in (cls.yotta, cls.zetta, cls.exa, cls.peta, cls.tera, cls.giga, cls.mega, cls.kilo,
+                           cls.hecto, cls.deka, cls.deci, cls.centi, cls.milli, cls.micro, cls.nano, cls.pico,
+                           cls.femto, cls.atto, cls.zepto, cls.yocto, cls.kibi, cls.mebi, cls.gibi):
+                create()
+            cls.allCreated = True
+
+        return cls.prefixes
+
+    ##
+    # Get the SI prefixes, from yotta to yocto
+    # 
+    # @return List of {@link Prefix}
+    #
+    @classmethod
+    def getSIPrefixes(cls):
+        return [prefix for prefix in cls.getPrefixes() if prefix.factor not in (1024, 1024**2, 1024**3)]
+
+    ##
+    # Get the key of a factor in the index of prefixes by factor
+    # 
+    # @param factor
+    #            Scaling factor
+    # @return log10 of the factor, rounded
+    #
+    @staticmethod
+    def exponentKey(factor):
+        return round(math.log10(factor), 6)
     
     ##
     # Find the prefix with the specified name
@@ -200,11 +249,20 @@ class Prefix:
     # 
     @classmethod    
     def fromName(cls, name):
-        for p in cls.prefixes:
-            if p.name == name:
-                return p
+        cls.getPrefixes()
+        return cls.prefixesByName.get(name)
 
-        return None
+    ##
+    # Find the prefix with the specified symbol
+    # 
+    # @param symbol
+    #            Symbol of prefix
+    # @return {@link Prefix}  
+    # 
+    @classmethod    
+    def fromSymbol(cls, symbol):
+        cls.getPrefixes()
+        return cls.prefixesBySymbol.get(symbol)
     
     ##
     # Find the prefix with the specified scaling factor
@@ -215,11 +273,35 @@ class Prefix:
     #    
     @classmethod
     def fromFactor(cls, factor):
-        for p in cls.prefixes:
-            if abs(p.factor - factor) < cls.EPSILON:
-                return p
+        if (factor is None or factor <= 0.0):
+            return None
+
+        cls.getPrefixes()
+        return cls.prefixesByExponent.get(Prefix.exponentKey(factor))
+
+    ##
+    # Find the prefix that scales an amount of this magnitude to an amount of
+    # at least 1 and less than 1000, or less than 1024 for the binary prefixes
+    # 
+    # @param magnitude
+    #            Absolute value of the amount
+    # @param binary
+    #            True for the binary prefixes (kibi, mebi, gibi)
+    # @return {@link Prefix} or None if the amount does not need a prefix
+    #    
+    @classmethod
+    def bestPrefix(cls, magnitude, binary=False):
+        if (magnitude == 0.0 or not math.isfinite(magnitude)):
+            return None
+
+        if (binary):
+            # powers of 1024 up to gibi
+            exponent = min(max(math.floor(math.log2(magnitude) / 10), 0), 3) * 10
+            return None if exponent == 0 else cls.fromFactor(2 ** exponent)
 
-        return None
+        # powers of 1000 from yocto to yotta
+        exponent = min(max(math.floor(math.log10(magnitude) / 3), -8), 8) * 3
+        return None if exponent == 0 else cls.fromFactor(10.0 ** exponent)
     
     def __str__(self):
         return self.name + ", " + self.symbol + ", " + str(self.factor)
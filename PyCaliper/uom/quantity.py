@@ -1,6 +1,7 @@
 import math
 from PyCaliper.uom.symbolic import Symbolic
 from PyCaliper.uom.localizer import Localizer
+from PyCaliper.uom.quantity_formatter import QuantityFormatter
 from PyCaliper.uom.caliper_exception import PyCaliperException
 
 ##
@@ -8,6 +9,14 @@ from PyCaliper.uom.caliper_exception import PyCaliperException
 # quantity can be named and given a symbol, e.g. the speed of light.
 # 
 class Quantity(Symbolic):
+    # the name, symbol and description of a named constant are kept in a
+    # separate tuple that other quantities do not have, or are localized from
+    # the message id in names when read
+    __slots__ = ("amount", "uom", "names")
+
+    # message id suffixes of the name, symbol and description
+    TEXT_SUFFIXES = (".name", ".symbol", ".desc")
+
     ##
     # Create a quantity with an amount and unit of measure
     # 
@@ -17,10 +26,63 @@ class Quantity(Symbolic):
     #            {@link UnitOfMeasure}
     #
     def __init__(self, amount, uom):
-        super().__init__(None, None, None)
-        
         self.amount = amount
         self.uom = uom
+        self.names = None
+
+    @property
+    def name(self):
+        return self.getText(0)
+
+    @name.setter
+    def name(self, value):
+        self.setNames(0, value)
+
+    @property
+    def symbol(self):
+        return self.getText(1)
+
+    @symbol.setter
+    def symbol(self, value):
+        self.setNames(1, value)
+
+    @property
+    def description(self):
+        return self.getText(2)
+
+    @description.setter
+    def description(self, value):
+        self.setNames(2, value)
+
+    def getText(self, index):
+        names = self.names
+
+        if (names is None):
+            return None
+
+        if (isinstance(names, str)):
+            return Localizer.instance().langStr(names + Quantity.TEXT_SUFFIXES[index])
+
+        return names[index]
+
+    def setNames(self, index, value):
+        if (self.names is None and value is None):
+            return
+
+        # replaced rather than changed, since copies share it
+        names = [self.getText(i) for i in range(3)]
+        names[index] = value
+        self.names = tuple(names)
+
+    ##
+    # Localize the name, symbol and description of this quantity from the
+    # message catalog when they are read
+    # 
+    # @param key
+    #            Message id without the ".name", ".symbol" or ".desc" suffix
+    #
+    def setTextKey(self, key):
+        self.names = key
         
     def __hash__(self):
         return hash((round(self.amount, 10), self.uom.symbol))
@@ -37,6 +99,9 @@ class Quantity(Symbolic):
     def __str__(self):
         return str(self.amount) + ", [" + str(self.uom) + "] " + super().__str__()
 
+    def __format__(self, spec):
+        return QuantityFormatter.forSpec(spec).format(self)
+
     ##
     # Create an amount of a quantity that adheres to precision and rounding
     # settings from a Number
@@ -220,4 +285,88 @@ class Quantity(Symbolic):
     #
     def classify(self):
         self.uom.classify()
-        return self    
+        return self
+
+    ##
+    # Create an immutable, hashable copy of this quantity
+    # 
+    # @return {@link FrozenQuantity}
+    #
+    def freeze(self):
+        return FrozenQuantity(self.amount, self.uom, self.names)
+
+##
+# A FrozenQuantity is an immutable Quantity with value semantics. A frozen
+# quantity is equal to another quantity, frozen or not, only if both have
+# exactly the same amount and the same unit of measure object. Unlike the
+# approximate equality of two quantities that are not frozen, this equality is
+# transitive, so frozen and plain quantities can be mixed as keys of one dict
+# or set. The hash is computed once when the quantity is created.
+# The canonical key is the amount in base units of measure, so that frozen
+# quantities in different units of measure can be de-duplicated.
+#
+class FrozenQuantity(Quantity):
+    __slots__ = ("hashValue", "canonicalKey")
+
+    # significant digits of the amount in a canonical key
+    KEY_DIGITS = 12
+
+    ##
+    # Create a frozen quantity
+    # 
+    # @param amount
+    #            Amount
+    # @param uom
+    #            {@link UnitOfMeasure}
+    # @param names
+    #            Optional tuple of name, symbol and description, or their message id
+    #
+    def __init__(self, amount, uom, names=None):
+        object.__setattr__(self, "amount", amount)
+        object.__setattr__(self, "uom", uom)
+        object.__setattr__(self, "names", names)
+        # the same hash as an equal quantity that is not frozen
+        object.__setattr__(self, "hashValue", Quantity.__hash__(self))
+        object.__setattr__(self, "canonicalKey", None)
+
+    def __setattr__(self, name, value):
+        msg = Localizer.instance().messageStr("quantity.frozen").format(self.amount, self.uom.symbol)
+        raise PyCaliperException(msg)
+
+    def __hash__(self):
+        return self.hashValue
+
+    def __eq__(self, other):
+        # exact in both directions, since this method is also used for a plain quantity on the left
+        if (isinstance(other, Quantity)):
+            return self.uom is other.uom and self.amount == other.amount
+        return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __reduce__(self):
+        return (FrozenQuantity, (self.amount, self.uom, self.names))
+
+    def freeze(self):
+        return self
+
+    ##
+    # Get the canonical key of this quantity: the base units of measure and
+    # the amount converted to them, rounded to {@link #KEY_DIGITS} significant
+    # digits. Quantities of the same value have the same key, e.g. 1 ft and
+    # 0.3048 m.
+    # 
+    # @return Tuple of the canonical terms and amount
+    #
+    def getCanonicalKey(self):
+        if (self.canonicalKey is None):
+            terms, factor, offset = self.uom.getCanonicalForm()
+            amount = self.amount * factor + offset
+
+            if (amount != 0.0 and math.isfinite(amount)):
+                amount = round(amount, FrozenQuantity.KEY_DIGITS - 1 - math.floor(math.log10(abs(amount))))
+
+            object.__setattr__(self, "canonicalKey", (terms, amount))
+
+        return self.canonicalKey    
@@ -0,0 +1,176 @@
+import numpy
+from PyCaliper.uom.quantity import Quantity
+from PyCaliper.uom.localizer import Localizer
+from PyCaliper.uom.caliper_exception import PyCaliperException
+
+##
+# The QuantityArray class represents an array of amounts with a single
+# UnitOfMeasure. It mirrors the arithmetic of {@link Quantity}, but the
+# conversion factor and offsets are resolved once and then applied to all of
+# the amounts in one vectorized NumPy operation.
+#
+class QuantityArray:
+    ##
+    # Create a quantity array with amounts and a unit of measure
+    #
+    # @param amounts
+    #            Sequence or NumPy array of amounts
+    # @param uom
+    #            {@link UnitOfMeasure}
+    #
+    def __init__(self, amounts, uom):
+        if (amounts is None):
+            msg = Localizer.instance().messageStr("amount.cannot.be.null")
+            raise PyCaliperException(msg)
+
+        self.amounts = numpy.asarray(amounts, dtype=numpy.float64)
+        self.uom = uom
+
+    def __len__(self):
+        return len(self.amounts)
+
+    def __getitem__(self, index):
+        return Quantity(float(self.amounts[index]), self.uom)
+
+    def __str__(self):
+        return str(self.amounts) + ", [" + str(self.uom) + "]"
+
+    ##
+    # Create a quantity array from a list of quantities. The quantities are
+    # converted to the unit of measure of the first quantity.
+    #
+    # @param quantities
+    #            List of {@link Quantity}
+    # @return {@link QuantityArray}
+    #
+    @staticmethod
+    def fromQuantities(quantities):
+        if (len(quantities) == 0):
+            msg = Localizer.instance().messageStr("quantities.empty")
+            raise PyCaliperException(msg)
+
+        uom = quantities[0].uom
+        amounts = [q.amount if q.uom is uom else q.convert(uom).amount for q in quantities]
+        return QuantityArray(amounts, uom)
+
+    ##
+    # Create a list of quantities from the amounts in this array
+    #
+    # @return List of {@link Quantity}
+    #
+    def toQuantities(self):
+        return [Quantity(amount, self.uom) for amount in self.amounts.tolist()]
+
+    ##
+    # Get the amounts of the other operand, converted to this unit of measure
+    #
+    # @param other
+    #            {@link QuantityArray} or {@link Quantity}
+    # @return Amounts
+    #
+    def convertedAmounts(self, other):
+        if (isinstance(other, Quantity)):
+            return other.convert(self.uom).amount
+
+        return other.convert(self.uom).amounts
+
+    ##
+    # Get the amounts of the other operand without any conversion
+    #
+    # @param other
+    #            {@link QuantityArray} or {@link Quantity}
+    # @return Amounts
+    #
+    @staticmethod
+    def otherAmounts(other):
+        if (isinstance(other, Quantity)):
+            return other.amount
+        return other.amounts
+
+    ##
+    # Convert the amounts in this array to the target UOM
+    #
+    # @param toUOM
+    #            {@link UnitOfMeasure}
+    # @return Converted quantity array
+    #
+    def convert(self, toUOM):
+        if (toUOM is self.uom):
+            return QuantityArray(self.amounts.copy(), toUOM)
+
+        multiplier = self.uom.getConversionFactor(toUOM)
+        thisOffset = self.uom.offset
+        targetOffset = toUOM.offset
+
+        # (x + offset) * factor - target offset for all amounts
+        newAmounts = self.amounts + thisOffset
+        newAmounts *= multiplier
+
+        if (targetOffset != 0.0):
+            newAmounts -= targetOffset
+
+        return QuantityArray(newAmounts, toUOM)
+
+    ##
+    # Add a quantity array or quantity to this quantity array
+    #
+    # @param other
+    #            {@link QuantityArray} or {@link Quantity}
+    # @return Sum {@link QuantityArray}
+    #
+    def add(self, other):
+        return QuantityArray(self.amounts + self.convertedAmounts(other), self.uom)
+
+    ##
+    # Subtract a quantity array or quantity from this quantity array
+    #
+    # @param other
+    #            {@link QuantityArray} or {@link Quantity}
+    # @return Difference {@link QuantityArray}
+    #
+    def subtract(self, other):
+        return QuantityArray(self.amounts - self.convertedAmounts(other), self.uom)
+
+    ##
+    # Multiply this quantity array by a quantity array or quantity
+    #
+    # @param other
+    #            {@link QuantityArray} or {@link Quantity}
+    # @return Product {@link QuantityArray}
+    #
+    def multiply(self, other):
+        amounts = self.amounts * QuantityArray.otherAmounts(other)
+        newUOM = self.uom.multiply(other.uom)
+        return QuantityArray(amounts, newUOM)
+
+    ##
+    # Divide this quantity array by a quantity array or quantity
+    #
+    # @param other
+    #            {@link QuantityArray} or {@link Quantity}
+    # @return Quotient {@link QuantityArray}
+    #
+    def divide(self, other):
+        divisors = QuantityArray.otherAmounts(other)
+
+        if (numpy.any(numpy.asarray(divisors) == 0.0)):
+            msg = Localizer.instance().messageStr("divisor.cannot.be.zero")
+            raise PyCaliperException(msg)
+
+        amounts = self.amounts / divisors
+        newUOM = self.uom.divide(other.uom)
+        return QuantityArray(amounts, newUOM)
+
+    ##
+    # Invert this quantity array, i.e. 1 divided by each amount
+    #
+    # @return {@link QuantityArray}
+    #
+    def invert(self):
+        if (numpy.any(self.amounts == 0.0)):
+            msg = Localizer.instance().messageStr("divisor.cannot.be.zero")
+            raise PyCaliperException(msg)
+
+        amounts = 1.0 / self.amounts
+        uom = self.uom.invert()
+        return QuantityArray(amounts, uom)
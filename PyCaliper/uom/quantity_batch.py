@@ -0,0 +1,207 @@
+from array import array
+from PyCaliper.uom.enums import Unit
+from PyCaliper.uom.unit_of_measure import UnitOfMeasure
+from PyCaliper.uom.localizer import Localizer
+from PyCaliper.uom.caliper_exception import PyCaliperException
+
+##
+# A QuantityBatch holds the amounts parsed from sequences of amount strings,
+# grouped by unit of measure. The amounts of each unit of measure are kept in
+# a compact array of doubles together with the row index of each amount.
+# Malformed rows are recorded with their index and an error message instead
+# of raising an exception, so one bad row does not stop the batch.
+#
+class QuantityBatch:
+    ##
+    # Construct an empty batch
+    #
+    # @param msys
+    #            {@link MeasurementSystem} to find units of measure in
+    #
+    def __init__(self, msys):
+        self.msys = msys
+
+        # (unit of measure, amounts, row indexes) by identity of the unit of measure
+        self.groups = {}
+
+        # list of (row index, error message)
+        self.errors = []
+
+        # number of rows parsed
+        self.rows = 0
+
+    def __len__(self):
+        return self.rows
+
+    def __str__(self):
+        groups = [uom.symbol + ": " + str(len(amounts)) for uom, amounts, _ in self.groups.values()]
+        return "rows: " + str(self.rows) + ", [" + ", ".join(groups) + "], errors: " + str(len(self.errors))
+
+    ##
+    # Parse the amounts. The units are either a sequence with a unit for each
+    # amount or a single unit for all of them. A unit is a {@link Unit}, a
+    # {@link UnitOfMeasure} or a unit of measure expression.
+    #
+    # @param strAmounts
+    #            Sequence of amount strings
+    # @param units
+    #            Sequence of units or a single unit
+    # @return This batch
+    #
+    def parse(self, strAmounts, units):
+        if (units is None or isinstance(units, (str, Unit, UnitOfMeasure))):
+            self.parseColumn(strAmounts, units)
+        else:
+            self.parseRows(strAmounts, units)
+
+        return self
+
+    ##
+    # Get the units of measure of the parsed amounts
+    #
+    # @return List of {@link UnitOfMeasure}
+    #
+    def getUOMs(self):
+        return [group[0] for group in self.groups.values()]
+
+    ##
+    # Get the amounts parsed for a unit of measure
+    #
+    # @param uom
+    #            {@link UnitOfMeasure}
+    # @return Array of doubles
+    #
+    def getAmounts(self, uom):
+        group = self.groups.get(id(uom))
+        return group[1] if group is not None else array('d')
+
+    ##
+    # Get the row indexes of the amounts parsed for a unit of measure
+    #
+    # @param uom
+    #            {@link UnitOfMeasure}
+    # @return Array of row indexes
+    #
+    def getIndexes(self, uom):
+        group = self.groups.get(id(uom))
+        return group[2] if group is not None else array('q')
+
+    ##
+    # Check if every row was parsed
+    #
+    # @return True if there are no errors
+    #
+    def isValid(self):
+        return len(self.errors) == 0
+
+    ##
+    # Parse amounts that all have the same unit
+    #
+    # @param strAmounts
+    #            Sequence of amount strings
+    # @param unit
+    #            {@link Unit}, {@link UnitOfMeasure} or expression
+    #
+    def parseColumn(self, strAmounts, unit):
+        strAmounts = list(strAmounts)
+        start = self.rows
+        self.rows = self.rows + len(strAmounts)
+
+        try:
+            uom = self.resolveUOM(unit)
+        except PyCaliperException as e:
+            self.errors.extend((start + i, str(e)) for i in range(len(strAmounts)))
+            return
+
+        amounts, indexes = self.getGroup(uom)
+
+        try:
+            # all well-formed
+            parsed = array('d', map(float, strAmounts))
+        except (TypeError, ValueError):
+            parsed = None
+
+        if (parsed is not None):
+            amounts.extend(parsed)
+            indexes.extend(range(start, self.rows))
+            return
+
+        for i, strAmount in enumerate(strAmounts, start):
+            try:
+                amounts.append(float(strAmount))
+                indexes.append(i)
+            except (TypeError, ValueError):
+                self.errors.append((i, self.amountError(strAmount)))
+
+    ##
+    # Parse amounts with a unit for each amount
+    #
+    # @param strAmounts
+    #            Sequence of amount strings
+    # @param units
+    #            Sequence of {@link Unit}, {@link UnitOfMeasure} or expression
+    #
+    def parseRows(self, strAmounts, units):
+        strAmounts = list(strAmounts)
+        units = list(units)
+
+        if (len(strAmounts) != len(units)):
+            msg = Localizer.instance().messageStr("batch.length").format(len(strAmounts), len(units))
+            raise PyCaliperException(msg)
+
+        # amounts and indexes (or the error) by unit, resolved once per unit
+        groups = {}
+
+        for i, (strAmount, unit) in enumerate(zip(strAmounts, units), self.rows):
+            # units of measure by identity, symbols and Units by value
+            key = unit if isinstance(unit, (str, Unit)) else id(unit)
+            group = groups.get(key)
+
+            if (group is None):
+                try:
+                    group = self.getGroup(self.resolveUOM(unit))
+                except PyCaliperException as e:
+                    group = str(e)
+
+                groups[key] = group
+
+            if (isinstance(group, str)):
+                self.errors.append((i, group))
+                continue
+
+            try:
+                group[0].append(float(strAmount))
+                group[1].append(i)
+            except (TypeError, ValueError):
+                self.errors.append((i, self.amountError(strAmount)))
+
+        self.rows = self.rows + len(strAmounts)
+
+    def resolveUOM(self, unit):
+        if (isinstance(unit, UnitOfMeasure)):
+            return unit
+
+        if (isinstance(unit, Unit)):
+            return self.msys.getUOM(unit)
+
+        if (isinstance(unit, str)):
+            return self.msys.parseUOM(unit)
+
+        msg = Localizer.instance().messageStr("unit.not.defined").format(unit)
+        raise PyCaliperException(msg)
+
+    def getGroup(self, uom):
+        # by identity, not the value equality of units of measure
+        group = self.groups.get(id(uom))
+
+        if (group is None):
+            group = (uom, array('d'), array('q'))
+            self.groups[id(uom)] = group
+
+        return group[1], group[2]
+
+    def amountError(self, strAmount):
+        if (strAmount is None):
+            return Localizer.instance().messageStr("amount.cannot.be.null")
+
+        return Localizer.instance().messageStr("amount.invalid").format(strAmount)
@@ -0,0 +1,101 @@
+from functools import lru_cache
+from PyCaliper.uom.symbolic import Symbolic
+from PyCaliper.uom.localizer import Localizer
+from PyCaliper.uom.caliper_exception import PyCaliperException
+
+##
+# A QuantityFormatter renders quantities as text for reports. A format spec has
+# an optional number format followed by an optional style, separated by a
+# colon, e.g. ".3f", ".3f:name", "name" or ",.1f:symbol". The number format is
+# that of the built-in format() function for floats. The style is one of:
+# <ul>
+# <li>"symbol": the amount and the unit's symbol, e.g. "1.500 kW"</li>
+# <li>"name": the amount and the unit's name, e.g. "1.500 kilowatt"</li>
+# <li>"full": the same text as str(), with the amount formatted</li>
+# </ul>
+# The style is "symbol" if only a number format is given, and "full" for an
+# empty spec. The unit's part of the text is rendered once per unit of measure
+# and locale, so formatting a quantity costs one float format.
+#
+class QuantityFormatter:
+    # styles
+    SYMBOL = "symbol"
+    NAME = "name"
+    FULL = "full"
+
+    STYLES = frozenset([SYMBOL, NAME, FULL])
+
+    # maximum number of cached formatters by spec
+    FORMATTER_CACHE_SIZE = 256
+
+    ##
+    # Construct a formatter
+    #
+    # @param numberSpec
+    #            Format spec of the amount
+    # @param style
+    #            SYMBOL, NAME or FULL
+    #
+    def __init__(self, numberSpec="", style=SYMBOL):
+        if (style not in QuantityFormatter.STYLES):
+            msg = Localizer.instance().messageStr("format.style.invalid").format(style)
+            raise PyCaliperException(msg)
+
+        self.numberSpec = numberSpec
+        self.style = style
+
+        # the amount is followed by a space, or by a comma in the full text
+        self.separator = ", [" if style == QuantityFormatter.FULL else " "
+        self.terminator = "]" if style == QuantityFormatter.FULL else ""
+
+    ##
+    # Get the formatter for a format spec. Formatters are cached by spec.
+    #
+    # @param spec
+    #            Format spec such as ".3f:name"
+    # @return {@link QuantityFormatter}
+    #
+    @staticmethod
+    @lru_cache(maxsize=FORMATTER_CACHE_SIZE)
+    def forSpec(spec):
+        numberSpec, colon, style = spec.rpartition(":")
+
+        if (len(colon) == 0):
+            # a style or a number format alone
+            if (spec in QuantityFormatter.STYLES):
+                return QuantityFormatter("", spec)
+
+            return QuantityFormatter(spec, QuantityFormatter.SYMBOL if len(spec) > 0 else QuantityFormatter.FULL)
+
+        return QuantityFormatter(numberSpec, style)
+
+    ##
+    # Format a quantity
+    #
+    # @param quantity
+    #            {@link Quantity}
+    # @return Text
+    #
+    def format(self, quantity):
+        text = format(quantity.amount, self.numberSpec) + self.separator + quantity.uom.getText(self.style)
+
+        if (self.style == QuantityFormatter.FULL):
+            # a named constant
+            text = text + self.terminator + " " + Symbolic.__str__(quantity)
+
+        return text
+
+    ##
+    # Format amounts of one unit of measure, e.g. a column of a report. The
+    # unit's text is looked up once for all of the amounts.
+    #
+    # @param amounts
+    #            Iterable of amounts
+    # @param uom
+    #            {@link UnitOfMeasure}
+    # @return List of text
+    #
+    def formatAmounts(self, amounts, uom):
+        numberSpec = self.numberSpec
+        suffix = self.separator + uom.getText(self.style) + self.terminator
+        return [format(amount, numberSpec) + suffix for amount in amounts]
@@ -0,0 +1,278 @@
+from PyCaliper.uom.cache_manager import CacheManager
+from PyCaliper.uom.unit_of_measure import Reducer, UnitOfMeasure
+from PyCaliper.uom.prefix import Prefix
+from PyCaliper.uom.localizer import Localizer
+from PyCaliper.uom.caliper_exception import PyCaliperException
+
+##
+# The SymbolParser class creates a unit of measure from an expression of unit
+# symbols such as "kg·m/s²", "kW·h", "m3/h", "lbf/in^2" or "kg/(m·s)".
+# <p>
+# A symbol is the symbol of a unit of measure, optionally with a {@link Prefix}
+# symbol in front of it ("kW") and an exponent after it ("m3"). Symbols are
+# combined with the multiplication operators '·', '*' and '.', the division
+# operator '/', exponents written with '^' or superscript digits, and
+# parentheses. Multiplication and division have the same precedence and are
+# evaluated from left to right.
+# </p>
+#
+class SymbolParser:
+    # multiplication operators
+    MULTIPLY = frozenset([Reducer.MULT, '*', '.', '⋅'])
+
+    # superscript exponent characters
+    SUPERSCRIPTS = {'⁰': '0', '\xB9': '1', Reducer.SQ: '2', Reducer.CUBED: '3', '⁴': '4', '⁵': '5',
+                    '⁶': '6', '⁷': '7', '⁸': '8', '⁹': '9', '⁻': '-'}
+
+    # largest magnitude of an exponent, the reduction of a power is linear in its exponent
+    MAX_EXPONENT = 64
+
+    # characters that end a symbol
+    DELIMITERS = frozenset([Reducer.DIV, Reducer.POW, Reducer.LP, Reducer.RP]) | MULTIPLY | frozenset(SUPERSCRIPTS)
+
+    ##
+    # Construct a parser for an expression
+    #
+    # @param msys
+    #            {@link MeasurementSystem}
+    # @param expression
+    #            Unit of measure expression
+    #
+    def __init__(self, msys, expression):
+        self.msys = msys
+        self.expression = expression
+        self.position = 0
+
+    ##
+    # Parse the expression
+    #
+    # @return {@link UnitOfMeasure}
+    #
+    def parse(self):
+        if (self.expression is None or len(self.expression.strip()) == 0):
+            msg = Localizer.instance().messageStr("symbol.cannot.be.null")
+            raise PyCaliperException(msg)
+
+        # a cached symbol, e.g. "m/s" or "us fl oz"
+        uom = self.msys.findUOMBySymbol(self.expression.strip())
+
+        if (uom is not None):
+            return uom
+
+        uom = self.parseExpression()
+        self.skipSpaces()
+
+        if (self.position < len(self.expression)):
+            self.raiseInvalid()
+
+        return uom.classify()
+
+    def raiseInvalid(self):
+        msg = Localizer.instance().messageStr("expression.invalid").format(self.expression, self.position)
+        raise PyCaliperException(msg)
+
+    def skipSpaces(self):
+        while (self.position < len(self.expression) and self.expression[self.position].isspace()):
+            self.position = self.position + 1
+
+    def peek(self):
+        self.skipSpaces()
+
+        if (self.position < len(self.expression)):
+            return self.expression[self.position]
+        return None
+
+    # expression := term (operator term)*
+    def parseExpression(self):
+        uom = self.parseTerm()
+
+        while (True):
+            operator = self.peek()
+
+            if (operator in SymbolParser.MULTIPLY):
+                self.position = self.position + 1
+                uom = self.product(uom, self.parseTerm())
+            elif (operator == Reducer.DIV):
+                self.position = self.position + 1
+                uom = self.quotient(uom, self.parseTerm())
+            else:
+                return uom
+
+    # term := primary exponent?
+    def parseTerm(self):
+        uom = self.parsePrimary()
+        exponent = self.parseExponent()
+
+        if (exponent is not None):
+            uom = self.power(uom, exponent)
+
+        return uom
+
+    # primary := '(' expression ')' | symbol
+    def parsePrimary(self):
+        if (self.peek() == Reducer.LP):
+            self.position = self.position + 1
+            uom = self.parseExpression()
+
+            if (self.peek() != Reducer.RP):
+                self.raiseInvalid()
+
+            self.position = self.position + 1
+            return uom
+
+        start = self.position
+
+        while (self.position < len(self.expression) and self.expression[self.position] not in SymbolParser.DELIMITERS):
+            self.position = self.position + 1
+
+        symbol = self.expression[start:self.position].strip()
+
+        if (len(symbol) == 0):
+            self.raiseInvalid()
+
+        return self.resolveSymbol(symbol)
+
+    # exponent := '^' integer | superscript digits
+    def parseExponent(self):
+        if (self.peek() == Reducer.POW):
+            self.position = self.position + 1
+            self.skipSpaces()
+            start = self.position
+
+            if (self.position < len(self.expression) and self.expression[self.position] in "+-"):
+                self.position = self.position + 1
+
+            while (self.position < len(self.expression) and self.expression[self.position].isdigit()):
+                self.position = self.position + 1
+
+            digits = self.expression[start:self.position]
+        else:
+            digits = ""
+
+            while (self.position < len(self.expression) and self.expression[self.position] in SymbolParser.SUPERSCRIPTS):
+                digits = digits + SymbolParser.SUPERSCRIPTS[self.expression[self.position]]
+                self.position = self.position + 1
+
+            if (len(digits) == 0):
+                return None
+
+        try:
+            return int(digits)
+        except ValueError:
+            self.raiseInvalid()
+
+    ##
+    # Find the unit of measure for a symbol, trying in order a cached symbol, a
+    # symbol followed by an exponent ("cm2") and a prefixed symbol ("kW")
+    #
+    # @param symbol
+    #            Symbol
+    # @return {@link UnitOfMeasure}
+    #
+    def resolveSymbol(self, symbol):
+        uom = self.resolvePrefixed(symbol)
+
+        if (uom is not None):
+            return uom
+
+        # trailing exponent digits
+        end = len(symbol)
+
+        while (end > 0 and symbol[end - 1].isdigit()):
+            end = end - 1
+
+        if (0 < end < len(symbol)):
+            base = self.resolvePrefixed(symbol[:end].strip())
+
+            if (base is not None):
+                return self.power(base, int(symbol[end:]))
+
+        msg = Localizer.instance().messageStr("unit.not.defined").format(symbol)
+        raise PyCaliperException(msg)
+
+    def resolvePrefixed(self, symbol):
+        uom = self.msys.findUOMBySymbol(symbol)
+
+        if (uom is not None):
+            return uom
+
+        for prefix in SymbolParser.getPrefixes():
+            if (symbol.startswith(prefix.symbol) and len(symbol) > len(prefix.symbol)):
+                uom = self.msys.findUOMBySymbol(symbol[len(prefix.symbol):])
+
+                if (uom is not None):
+                    return self.msys.createPrefixedUOM(prefix, uom)
+
+        return None
+
+    # The operations are interned by the identity of their operands. Generated
+    # symbols are not unique, e.g. "kg/m·s" for both kg/(m·s) and (kg/m)·s, so
+    # they are not used to find a previous result.
+    def product(self, multiplier, multiplicand):
+        return SymbolParser.derive(multiplier, multiplicand, Reducer.MULT)
+
+    def quotient(self, dividend, divisor):
+        return SymbolParser.derive(dividend, divisor, Reducer.DIV)
+
+    def power(self, base, exponent):
+        if (abs(exponent) > SymbolParser.MAX_EXPONENT):
+            msg = Localizer.instance().messageStr("exponent.invalid").format(exponent, self.expression,
+                                                                             SymbolParser.MAX_EXPONENT)
+            raise PyCaliperException(msg)
+
+        if (exponent == 1):
+            return base
+
+        return SymbolParser.derive(base, exponent, Reducer.POW)
+
+    ##
+    # Get the interned product, quotient or power of operands, creating it if
+    # necessary. The result references its operands, so their ids are not reused.
+    #
+    # @param operand
+    #            {@link UnitOfMeasure}
+    # @param other
+    #            {@link UnitOfMeasure}, or the exponent of a power
+    # @param operator
+    #            Reducer.MULT, Reducer.DIV or Reducer.POW
+    # @return {@link UnitOfMeasure}
+    #
+    @staticmethod
+    def derive(operand, other, operator):
+        key = (id(operand), other if operator == Reducer.POW else id(other), operator)
+        cacheManager = CacheManager.instance()
+        uom = cacheManager.getDerivedUOM(key)
+
+        if (uom is not None):
+            return uom
+
+        uom = UnitOfMeasure()
+
+        if (operator == Reducer.MULT):
+            uom.symbol = UnitOfMeasure.generateProductSymbol(operand, other)
+            uom.setProductUnits(operand, other)
+        elif (operator == Reducer.DIV):
+            uom.symbol = UnitOfMeasure.generateQuotientSymbol(operand, other)
+            uom.setQuotientUnits(operand, other)
+        else:
+            uom.symbol = UnitOfMeasure.generatePowerSymbol(operand, other)
+            uom.setPowerUnit(operand, other)
+
+        uom.internKey = key
+        cacheManager.registerDerivedUOM(key, uom)
+        return uom
+
+    ##
+    # Get all of the prefixes, longest symbols first
+    #
+    # @return List of {@link Prefix}
+    #
+    @staticmethod
+    def getPrefixes():
+        if (SymbolParser.prefixes is None):
+            SymbolParser.prefixes = sorted(Prefix.getPrefixes(), key=lambda prefix: -len(prefix.symbol))
+
+        return SymbolParser.prefixes
+
+    # prefixes by decreasing symbol length
+    prefixes = None
@@ -3,6 +3,9 @@
 # a description. Units of measure are such objects.
 #
 class Symbolic():
+    # the name, symbol and description are stored by the subclasses
+    __slots__ = ()
+
     def __init__(self, name, symbol, description):
         self.name = name
         self.symbol = symbol
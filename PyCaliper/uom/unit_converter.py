@@ -0,0 +1,258 @@
+import csv
+import os
+from PyCaliper.uom.localizer import Localizer
+from PyCaliper.uom.caliper_exception import PyCaliperException
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+##
+# A UnitConverter is a conversion between two units of measure that has been
+# resolved once. It holds the scaling factor, source offset and target offset
+# that {@link Quantity#convert} computes, so that amounts can be converted
+# repeatedly without looking up the conversion or creating a Quantity.
+#
+class UnitConverter:
+    # number of amounts converted at a time in a file
+    CHUNK_SIZE = 1 << 20
+
+    # buffer formats of doubles and of raw bytes that are reinterpreted as doubles
+    BUFFER_FORMATS = frozenset(['d', 'B', 'b', 'c'])
+
+    ##
+    # Create a converter from one unit of measure to another
+    #
+    # @param fromUOM
+    #            Source {@link UnitOfMeasure}
+    # @param toUOM
+    #            Target {@link UnitOfMeasure}
+    #
+    def __init__(self, fromUOM, toUOM):
+        if (fromUOM is None or toUOM is None):
+            msg = Localizer.instance().messageStr("unit.cannot.be.null")
+            raise PyCaliperException(msg)
+
+        self.fromUOM = fromUOM
+        self.toUOM = toUOM
+        self.scalingFactor = fromUOM.getConversionFactor(toUOM)
+        self.offset = fromUOM.offset
+        self.targetOffset = toUOM.offset
+
+        # y = (x + offset) * factor - targetOffset = x * factor + intercept
+        self.intercept = self.offset * self.scalingFactor - self.targetOffset
+
+    def __str__(self):
+        return self.fromUOM.symbol + " -> " + self.toUOM.symbol + ": " + str(self.scalingFactor) + ", " + str(self.intercept)
+
+    ##
+    # Convert an amount
+    #
+    # @param amount
+    #            Amount in the source unit of measure
+    # @return Amount in the target unit of measure
+    #
+    def __call__(self, amount):
+        return amount * self.scalingFactor + self.intercept
+
+    ##
+    # Convert all of the amounts
+    #
+    # @param amounts
+    #            Iterable of amounts in the source unit of measure
+    # @return List of amounts in the target unit of measure
+    #
+    def convertAll(self, amounts):
+        factor = self.scalingFactor
+        intercept = self.intercept
+
+        if (intercept == 0.0):
+            return [x * factor for x in amounts]
+
+        return [x * factor + intercept for x in amounts]
+
+    ##
+    # Convert amounts lazily. Each converted amount is produced as the source
+    # is read, so any number of amounts are converted in constant memory.
+    #
+    # @param amounts
+    #            Iterable of amounts in the source unit of measure
+    # @return Generator of amounts in the target unit of measure
+    #
+    def convertStream(self, amounts):
+        factor = self.scalingFactor
+        intercept = self.intercept
+
+        for x in amounts:
+            yield x * factor + intercept
+
+    ##
+    # Convert the amounts in lines of text lazily, e.g. the lines of a file.
+    # Blank lines are skipped.
+    #
+    # @param lines
+    #            Iterable of lines, e.g. an open file
+    # @param column
+    #            Index of the amount in a delimited line, or None if a line is
+    #            only an amount
+    # @param delimiter
+    #            Field delimiter of a delimited line
+    # @return Generator of amounts in the target unit of measure
+    #
+    def convertLines(self, lines, column=None, delimiter=","):
+        factor = self.scalingFactor
+        intercept = self.intercept
+
+        if (column is None):
+            values = (line for line in lines if not line.isspace() and len(line) > 0)
+        else:
+            values = (UnitConverter.getField(row, column, delimiter) for row in csv.reader(lines, delimiter=delimiter) if len(row) > 0)
+
+        for value in values:
+            try:
+                x = float(value)
+            except ValueError:
+                msg = Localizer.instance().messageStr("amount.invalid").format(value.strip())
+                raise PyCaliperException(msg)
+
+            yield x * factor + intercept
+
+    @staticmethod
+    def getField(row, column, delimiter):
+        try:
+            return row[column]
+        except IndexError:
+            # a short row has no amount
+            msg = Localizer.instance().messageStr("amount.invalid").format(delimiter.join(row))
+            raise PyCaliperException(msg)
+
+    ##
+    # Convert the amounts in a buffer of doubles without copying them, e.g. an
+    # array.array('d'), a memoryview, an mmap or a NumPy array. The amounts are
+    # converted in place or written to an output buffer of the same length.
+    #
+    # @param source
+    #            Buffer of amounts in the source unit of measure
+    # @param target
+    #            Writable buffer for the amounts in the target unit of measure,
+    #            or None to convert the source in place
+    # @return Number of amounts converted
+    #
+    def convertBuffer(self, source, target=None):
+        source = UnitConverter.viewDoubles(source)
+        target = source if target is None else UnitConverter.viewDoubles(target)
+
+        if (target.readonly):
+            msg = Localizer.instance().messageStr("buffer.readonly")
+            raise PyCaliperException(msg)
+
+        if (len(target) != len(source)):
+            msg = Localizer.instance().messageStr("buffer.length").format(len(target), len(source))
+            raise PyCaliperException(msg)
+
+        factor = self.scalingFactor
+        intercept = self.intercept
+
+        if (numpy is not None):
+            # vectorized over the same memory
+            amounts = numpy.frombuffer(source, dtype=numpy.float64)
+            converted = numpy.frombuffer(target, dtype=numpy.float64)
+            numpy.multiply(amounts, factor, out=converted)
+
+            if (intercept != 0.0):
+                numpy.add(converted, intercept, out=converted)
+        else:
+            for i in range(len(source)):
+                target[i] = source[i] * factor + intercept
+
+        return len(source)
+
+    ##
+    # Convert a file of doubles in native byte order in chunks, so that the
+    # file can be much larger than memory
+    #
+    # @param fileName
+    #            Name of the file of amounts in the source unit of measure
+    # @param outFileName
+    #            Name of the file for the amounts in the target unit of
+    #            measure, or None to convert the file in place
+    # @param chunkSize
+    #            Number of amounts converted at a time
+    # @return Number of amounts converted
+    #
+    def convertFile(self, fileName, outFileName=None, chunkSize=None):
+        if (chunkSize is None):
+            chunkSize = UnitConverter.CHUNK_SIZE
+
+        chunk = bytearray(chunkSize * 8)
+        count = 0
+
+        with open(fileName, "r+b" if outFileName is None else "rb") as inFile:
+            # checked first, so that a file is not partly converted
+            size = os.fstat(inFile.fileno()).st_size
+
+            if (size % 8 != 0):
+                msg = Localizer.instance().messageStr("file.length").format(fileName, size)
+                raise PyCaliperException(msg)
+
+            outFile = inFile if outFileName is None else open(outFileName, "wb")
+
+            try:
+                while (True):
+                    position = inFile.tell()
+                    size = inFile.readinto(chunk)
+
+                    if (size == 0):
+                        break
+
+                    view = memoryview(chunk)[:size]
+                    count = count + self.convertBuffer(view)
+
+                    if (outFile is inFile):
+                        inFile.seek(position)
+
+                    outFile.write(view)
+            finally:
+                if (outFile is not inFile):
+                    outFile.close()
+
+        return count
+
+    ##
+    # View a buffer as a one-dimensional array of doubles without copying it.
+    # A buffer of raw bytes (e.g. a bytearray or an mmap) is reinterpreted as
+    # doubles, but a buffer of other typed items (e.g. float32 or int64) is not.
+    #
+    # @param buffer
+    #            Object supporting the buffer protocol
+    # @return memoryview of doubles
+    #
+    @staticmethod
+    def viewDoubles(buffer):
+        try:
+            view = memoryview(buffer)
+        except TypeError:
+            msg = Localizer.instance().messageStr("buffer.invalid")
+            raise PyCaliperException(msg)
+
+        if (view.format not in UnitConverter.BUFFER_FORMATS):
+            msg = Localizer.instance().messageStr("buffer.format").format(view.format)
+            raise PyCaliperException(msg)
+
+        try:
+            if (view.format != 'd' or view.ndim != 1):
+                view = view.cast('B').cast('d')
+        except TypeError:
+            msg = Localizer.instance().messageStr("buffer.invalid")
+            raise PyCaliperException(msg)
+
+        return view
+
+    ##
+    # Get the converter for the reverse conversion
+    #
+    # @return {@link UnitConverter}
+    #
+    def inverse(self):
+        return UnitConverter(self.toUOM, self.fromUOM)
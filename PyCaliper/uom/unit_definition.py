@@ -0,0 +1,361 @@
+import math
+from PyCaliper.uom.enums import Unit, UnitType, MeasurementType, Constant
+from PyCaliper.uom.prefix import Prefix
+
+##
+# A UnitDefinition describes how the {@link MeasurementSystem} creates the unit
+# of measure for a {@link Unit}: its type, localization key, operands and
+# conversion. A reference to another unit of measure can be a {@link Unit}, the
+# symbol of a cached unit of measure or a function of the measurement system.
+# A scaling factor can be a number or a function of the measurement system.
+# <p>
+# The standard definitions are in a table keyed by {@link Unit}.
+# {@link MeasurementSystem#defineUnit} adds or replaces entries in it.
+# </p>
+#
+class UnitDefinition:
+    ##
+    # Construct a definition
+    #
+    # @param unitType
+    #            {@link UnitType}
+    # @param key
+    #            Localization key of the name, symbol and description, or None
+    # @param measurementType
+    #            {@link MeasurementType}
+    # @param uom1
+    #            Reference to the base, multiplier or dividend
+    # @param uom2
+    #            Reference to the multiplicand or divisor
+    # @param exponent
+    #            Exponent of a power
+    # @param scalingFactor
+    #            Scaling factor to the abscissa unit. If there is no abscissa
+    #            unit, the scaling factor of the product, quotient or power.
+    # @param abscissaUnit
+    #            Reference to the abscissa unit
+    # @param offset
+    #            Offset
+    # @param bridgeScalingFactor
+    #            Scaling factor to the unit in another measurement system
+    # @param bridgeAbscissaUnit
+    #            Reference to the unit in another measurement system
+    # @param bridgeOffset
+    #            Offset to the unit in another measurement system
+    # @param name
+    #            Name if there is no localization key
+    # @param symbol
+    #            Symbol if there is no localization key
+    # @param description
+    #            Description if there is no localization key
+    #
+    def __init__(self, unitType, key=None, measurementType=MeasurementType.SCALAR, uom1=None, uom2=None, exponent=None,
+                 scalingFactor=None, abscissaUnit=None, offset=0.0, bridgeScalingFactor=None, bridgeAbscissaUnit=None,
+                 bridgeOffset=0.0, name=None, symbol=None, description=None):
+        self.unitType = unitType
+        self.key = key
+        self.measurementType = measurementType
+        self.uom1 = uom1
+        self.uom2 = uom2
+        self.exponent = exponent
+        self.scalingFactor = scalingFactor
+        self.abscissaUnit = abscissaUnit
+        self.offset = offset
+        self.bridgeScalingFactor = bridgeScalingFactor
+        self.bridgeAbscissaUnit = bridgeAbscissaUnit
+        self.bridgeOffset = bridgeOffset
+        self.name = name
+        self.symbol = symbol
+        self.description = description
+
+    ##
+    # Create a definition from a dictionary, e.g. one loaded from JSON. Enumerated
+    # values are given by name. A reference to another unit of measure is the
+    # name of a {@link Unit} or the symbol of a cached unit of measure.
+    #
+    # @param data
+    #            Dictionary of the constructor arguments
+    # @return {@link UnitDefinition}
+    #
+    @staticmethod
+    def fromDict(data):
+        values = dict(data)
+
+        values["unitType"] = UnitType[values["unitType"]]
+
+        if ("measurementType" in values):
+            values["measurementType"] = MeasurementType[values["measurementType"]]
+
+        for name in ("uom1", "uom2", "abscissaUnit", "bridgeAbscissaUnit"):
+            reference = values.get(name)
+
+            if (isinstance(reference, str) and reference in Unit.__members__):
+                values[name] = Unit[reference]
+
+        return UnitDefinition(**values)
+
+    ##
+    # Get the unit of measure of the elementary charge constant
+    #
+    # @param msys
+    #            {@link MeasurementSystem}
+    # @return {@link UnitOfMeasure}
+    #
+    @staticmethod
+    def elementaryChargeUnit(msys):
+        return msys.getQuantity(Constant.ELEMENTARY_CHARGE).uom
+
+    ##
+    # Get the amount of the elementary charge constant
+    #
+    # @param msys
+    #            {@link MeasurementSystem}
+    # @return Amount
+    #
+    @staticmethod
+    def elementaryCharge(msys):
+        return msys.getQuantity(Constant.ELEMENTARY_CHARGE).amount
+
+    ##
+    # Get the gravitational acceleration in ft/s^2
+    #
+    # @param msys
+    #            {@link MeasurementSystem}
+    # @return Amount
+    #
+    @staticmethod
+    def gravityInFeet(msys):
+        return msys.getQuantity(Constant.GRAVITY).convert(msys.getUOM(Unit.FEET_PER_SEC_SQUARED)).amount
+
+    ##
+    # Get the nanometre
+    #
+    # @param msys
+    #            {@link MeasurementSystem}
+    # @return {@link UnitOfMeasure}
+    #
+    @staticmethod
+    def nanometre(msys):
+        return msys.createPrefixedUOM(Prefix.nano(), msys.getUOM(Unit.METRE))
+
+    ##
+    # Get lbm/(ft·s^2), the abscissa unit of inches of mercury
+    #
+    # @param msys
+    #            {@link MeasurementSystem}
+    # @return {@link UnitOfMeasure}
+    #
+    @staticmethod
+    def inchOfMercuryBase(msys):
+        u1 = msys.createUnclassifiedProductUOM(msys.getUOM(Unit.FOOT), msys.getUOM(Unit.SQUARE_SECOND))
+        return msys.createUnclassifiedQuotientUOM(msys.getUOM(Unit.POUND_MASS), u1)
+
+##
+# Standard definitions of the units of measure keyed by {@link Unit}
+#
+STANDARD_DEFINITIONS = {
+    Unit.ONE: UnitDefinition(UnitType.UNITY, "one"),
+    Unit.SECOND: UnitDefinition(UnitType.TIME, "sec"),
+    Unit.MINUTE: UnitDefinition(UnitType.TIME, "min", scalingFactor=60.0, abscissaUnit=Unit.SECOND),
+    Unit.HOUR: UnitDefinition(UnitType.TIME, "hr", scalingFactor=3600.0, abscissaUnit=Unit.SECOND),
+    Unit.DAY: UnitDefinition(UnitType.TIME, "day", scalingFactor=86400.0, abscissaUnit=Unit.SECOND),
+    Unit.WEEK: UnitDefinition(UnitType.TIME, "week", scalingFactor=604800.0, abscissaUnit=Unit.SECOND),
+    Unit.JULIAN_YEAR: UnitDefinition(UnitType.TIME, "jyear", scalingFactor=31557600.0, abscissaUnit=Unit.SECOND),
+    Unit.METRE: UnitDefinition(UnitType.LENGTH, "m"),
+    Unit.SQUARE_METRE: UnitDefinition(UnitType.AREA, "m2", MeasurementType.POWER, uom1=Unit.METRE, exponent=2),
+    Unit.CUBIC_METRE: UnitDefinition(UnitType.VOLUME, "m3", MeasurementType.POWER, uom1=Unit.METRE, exponent=3),
+    Unit.KILOGRAM: UnitDefinition(UnitType.MASS, "kg"),
+    Unit.GRAM: UnitDefinition(UnitType.MASS, "gram", scalingFactor=Prefix.milli().factor, abscissaUnit=Unit.KILOGRAM),
+    Unit.LITRE: UnitDefinition(UnitType.VOLUME, "litre", scalingFactor=Prefix.milli().factor,
+        abscissaUnit=Unit.CUBIC_METRE),
+    Unit.KELVIN: UnitDefinition(UnitType.TEMPERATURE, "kelvin"),
+    Unit.CELSIUS: UnitDefinition(UnitType.TEMPERATURE, "celsius", scalingFactor=1.0, abscissaUnit=Unit.KELVIN,
+        offset=273.15),
+    Unit.AMPERE: UnitDefinition(UnitType.ELECTRIC_CURRENT, "amp"),
+
+    # SI units
+    Unit.PERCENT: UnitDefinition(UnitType.UNITY, "percent", scalingFactor=0.01, abscissaUnit=Unit.ONE),
+    Unit.SQUARE_SECOND: UnitDefinition(UnitType.TIME_SQUARED, "s2", MeasurementType.POWER, uom1=Unit.SECOND,
+        exponent=2),
+    Unit.MOLE: UnitDefinition(UnitType.SUBSTANCE_AMOUNT, "mole"),
+    Unit.EQUIVALENT: UnitDefinition(UnitType.SUBSTANCE_AMOUNT, "equivalent"),
+    Unit.DECIBEL: UnitDefinition(UnitType.INTENSITY, "db"),
+    Unit.RADIAN: UnitDefinition(UnitType.PLANE_ANGLE, "radian", scalingFactor=1.0, abscissaUnit=Unit.ONE),
+    Unit.STERADIAN: UnitDefinition(UnitType.SOLID_ANGLE, "steradian", scalingFactor=1.0, abscissaUnit=Unit.ONE),
+    Unit.DEGREE: UnitDefinition(UnitType.PLANE_ANGLE, "degree", scalingFactor=math.pi / 180.0,
+        abscissaUnit=Unit.RADIAN),
+    Unit.ARC_SECOND: UnitDefinition(UnitType.PLANE_ANGLE, "arcsec", scalingFactor=math.pi / 648000.0,
+        abscissaUnit=Unit.RADIAN),
+    Unit.DIOPTER: UnitDefinition(UnitType.RECIPROCAL_LENGTH, "diopter", MeasurementType.QUOTIENT, uom1=Unit.ONE,
+        uom2=Unit.METRE),
+    Unit.TONNE: UnitDefinition(UnitType.MASS, "tonne", scalingFactor=Prefix.kilo().factor, abscissaUnit=Unit.KILOGRAM),
+    Unit.CANDELA: UnitDefinition(UnitType.LUMINOSITY, "cd"),
+    Unit.MOLARITY: UnitDefinition(UnitType.MOLAR_CONCENTRATION, "molarity", MeasurementType.QUOTIENT, uom1=Unit.MOLE,
+        uom2=Unit.LITRE),
+    Unit.CARAT: UnitDefinition(UnitType.MASS, "carat", scalingFactor=0.2, abscissaUnit=Unit.GRAM),
+    Unit.HECTARE: UnitDefinition(UnitType.AREA, "hectare", scalingFactor=10000.0, abscissaUnit=Unit.SQUARE_METRE),
+    Unit.METRE_PER_SEC: UnitDefinition(UnitType.VELOCITY, "mps", MeasurementType.QUOTIENT, uom1=Unit.METRE,
+        uom2=Unit.SECOND),
+    Unit.METRE_PER_SEC_SQUARED: UnitDefinition(UnitType.ACCELERATION, "mps2", MeasurementType.QUOTIENT,
+        uom1=Unit.METRE, uom2=Unit.SQUARE_SECOND),
+    Unit.CUBIC_METRE_PER_SEC: UnitDefinition(UnitType.VOLUMETRIC_FLOW, "m3PerSec", MeasurementType.QUOTIENT,
+        uom1=Unit.CUBIC_METRE, uom2=Unit.SECOND),
+    Unit.KILOGRAM_PER_SEC: UnitDefinition(UnitType.MASS_FLOW, "kgPerSec", MeasurementType.QUOTIENT,
+        uom1=Unit.KILOGRAM, uom2=Unit.SECOND),
+    Unit.KILOGRAM_PER_CU_METRE: UnitDefinition(UnitType.DENSITY, "kg_m3", MeasurementType.QUOTIENT,
+        uom1=Unit.KILOGRAM, uom2=Unit.CUBIC_METRE),
+    Unit.PASCAL_SECOND: UnitDefinition(UnitType.DYNAMIC_VISCOSITY, "pascal_sec", MeasurementType.PRODUCT,
+        uom1=Unit.PASCAL, uom2=Unit.SECOND),
+    Unit.SQUARE_METRE_PER_SEC: UnitDefinition(UnitType.KINEMATIC_VISCOSITY, "m2PerSec", MeasurementType.QUOTIENT,
+        uom1=Unit.SQUARE_METRE, uom2=Unit.SECOND),
+    Unit.CALORIE: UnitDefinition(UnitType.ENERGY, "calorie", scalingFactor=4.184, abscissaUnit=Unit.JOULE),
+    Unit.NEWTON: UnitDefinition(UnitType.FORCE, "newton", MeasurementType.PRODUCT, uom1=Unit.KILOGRAM,
+        uom2=Unit.METRE_PER_SEC_SQUARED),
+    Unit.NEWTON_METRE: UnitDefinition(UnitType.ENERGY, "n_m", MeasurementType.PRODUCT, uom1=Unit.NEWTON,
+        uom2=Unit.METRE),
+    Unit.JOULE: UnitDefinition(UnitType.ENERGY, "joule", MeasurementType.PRODUCT, uom1=Unit.NEWTON, uom2=Unit.METRE),
+    Unit.ELECTRON_VOLT: UnitDefinition(UnitType.ENERGY, "ev", MeasurementType.PRODUCT,
+        uom1=UnitDefinition.elementaryChargeUnit, uom2=Unit.VOLT, scalingFactor=UnitDefinition.elementaryCharge),
+    Unit.WATT_HOUR: UnitDefinition(UnitType.ENERGY, "wh", MeasurementType.PRODUCT, uom1=Unit.WATT, uom2=Unit.HOUR),
+    Unit.WATT: UnitDefinition(UnitType.POWER, "watt", MeasurementType.QUOTIENT, uom1=Unit.JOULE, uom2=Unit.SECOND),
+    Unit.HERTZ: UnitDefinition(UnitType.FREQUENCY, "hertz", MeasurementType.QUOTIENT, uom1=Unit.ONE, uom2=Unit.SECOND),
+    Unit.RAD_PER_SEC: UnitDefinition(UnitType.FREQUENCY, "radpers", MeasurementType.QUOTIENT, uom1=Unit.RADIAN,
+        uom2=Unit.SECOND, scalingFactor=1.0 / (2.0 * math.pi), abscissaUnit=Unit.HERTZ),
+    Unit.PASCAL: UnitDefinition(UnitType.PRESSURE, "pascal", MeasurementType.QUOTIENT, uom1=Unit.NEWTON,
+        uom2=Unit.SQUARE_METRE),
+    Unit.ATMOSPHERE: UnitDefinition(UnitType.PRESSURE, "atm", scalingFactor=101325.0, abscissaUnit=Unit.PASCAL),
+    Unit.BAR: UnitDefinition(UnitType.PRESSURE, "bar", scalingFactor=1.0, abscissaUnit=Unit.PASCAL, offset=100000.0),
+    Unit.COULOMB: UnitDefinition(UnitType.ELECTRIC_CHARGE, "coulomb", MeasurementType.PRODUCT, uom1=Unit.AMPERE,
+        uom2=Unit.SECOND),
+    Unit.VOLT: UnitDefinition(UnitType.ELECTROMOTIVE_FORCE, "volt", MeasurementType.QUOTIENT, uom1=Unit.WATT,
+        uom2=Unit.AMPERE),
+    Unit.OHM: UnitDefinition(UnitType.ELECTRIC_RESISTANCE, "ohm", MeasurementType.QUOTIENT, uom1=Unit.VOLT,
+        uom2=Unit.AMPERE),
+    Unit.FARAD: UnitDefinition(UnitType.ELECTRIC_CAPACITANCE, "farad", MeasurementType.QUOTIENT, uom1=Unit.COULOMB,
+        uom2=Unit.VOLT),
+    Unit.FARAD_PER_METRE: UnitDefinition(UnitType.ELECTRIC_PERMITTIVITY, "fperm", MeasurementType.QUOTIENT,
+        uom1=Unit.FARAD, uom2=Unit.METRE),
+    Unit.AMPERE_PER_METRE: UnitDefinition(UnitType.ELECTRIC_FIELD_STRENGTH, "aperm", MeasurementType.QUOTIENT,
+        uom1=Unit.AMPERE, uom2=Unit.METRE),
+    Unit.WEBER: UnitDefinition(UnitType.MAGNETIC_FLUX, "weber", MeasurementType.PRODUCT, uom1=Unit.VOLT,
+        uom2=Unit.SECOND),
+    Unit.TESLA: UnitDefinition(UnitType.MAGNETIC_FLUX_DENSITY, "tesla", MeasurementType.QUOTIENT, uom1=Unit.WEBER,
+        uom2=Unit.SQUARE_METRE),
+    Unit.HENRY: UnitDefinition(UnitType.ELECTRIC_INDUCTANCE, "henry", MeasurementType.QUOTIENT, uom1=Unit.WEBER,
+        uom2=Unit.AMPERE),
+    Unit.SIEMENS: UnitDefinition(UnitType.ELECTRIC_CONDUCTANCE, "siemens", MeasurementType.QUOTIENT,
+        uom1=Unit.AMPERE, uom2=Unit.VOLT),
+    Unit.LUMEN: UnitDefinition(UnitType.LUMINOUS_FLUX, "lumen", MeasurementType.PRODUCT, uom1=Unit.CANDELA,
+        uom2=Unit.STERADIAN),
+    Unit.LUX: UnitDefinition(UnitType.ILLUMINANCE, "lux", MeasurementType.QUOTIENT, uom1=Unit.LUMEN,
+        uom2=Unit.SQUARE_METRE),
+    Unit.BECQUEREL: UnitDefinition(UnitType.RADIOACTIVITY, "becquerel", MeasurementType.QUOTIENT, uom1=Unit.ONE,
+        uom2=Unit.SECOND),
+    Unit.GRAY: UnitDefinition(UnitType.RADIATION_DOSE_ABSORBED, "gray", MeasurementType.QUOTIENT, uom1=Unit.JOULE,
+        uom2=Unit.KILOGRAM),
+    Unit.SIEVERT: UnitDefinition(UnitType.RADIATION_DOSE_EFFECTIVE, "sievert", MeasurementType.QUOTIENT,
+        uom1=Unit.JOULE, uom2=Unit.KILOGRAM),
+    Unit.SIEVERTS_PER_HOUR: UnitDefinition(UnitType.RADIATION_DOSE_RATE, "sph", MeasurementType.QUOTIENT,
+        uom1=Unit.SIEVERT, uom2=Unit.HOUR),
+    Unit.KATAL: UnitDefinition(UnitType.CATALYTIC_ACTIVITY, "katal", MeasurementType.QUOTIENT, uom1=Unit.MOLE,
+        uom2=Unit.SECOND),
+    Unit.UNIT: UnitDefinition(UnitType.CATALYTIC_ACTIVITY, "unit", scalingFactor=1e-06 / 60.0, abscissaUnit=Unit.KATAL),
+    Unit.INTERNATIONAL_UNIT: UnitDefinition(UnitType.SUBSTANCE_AMOUNT, "iu"),
+    Unit.ANGSTROM: UnitDefinition(UnitType.LENGTH, "angstrom", scalingFactor=0.1,
+        abscissaUnit=UnitDefinition.nanometre),
+    Unit.BIT: UnitDefinition(UnitType.COMPUTER_SCIENCE, "bit"),
+    Unit.BYTE: UnitDefinition(UnitType.COMPUTER_SCIENCE, "byte", scalingFactor=8.0, abscissaUnit=Unit.BIT),
+    Unit.WATTS_PER_SQ_METRE: UnitDefinition(UnitType.IRRADIANCE, "wsm", MeasurementType.QUOTIENT, uom1=Unit.WATT,
+        uom2=Unit.SQUARE_METRE),
+    Unit.PARSEC: UnitDefinition(UnitType.LENGTH, "parsec", scalingFactor=3.08567758149137e+16, abscissaUnit=Unit.METRE),
+    Unit.ASTRONOMICAL_UNIT: UnitDefinition(UnitType.LENGTH, "au", scalingFactor=149597870700.0,
+        abscissaUnit=Unit.METRE),
+
+    # International customary units
+    Unit.RANKINE: UnitDefinition(UnitType.TEMPERATURE, "rankine", bridgeScalingFactor=5.0 / 9.0,
+        bridgeAbscissaUnit=Unit.KELVIN),
+    Unit.FAHRENHEIT: UnitDefinition(UnitType.TEMPERATURE, "fahrenheit", scalingFactor=1.0, abscissaUnit=Unit.RANKINE,
+        offset=459.67),
+    Unit.POUND_MASS: UnitDefinition(UnitType.MASS, "lbm", bridgeScalingFactor=0.45359237,
+        bridgeAbscissaUnit=Unit.KILOGRAM),
+    Unit.OUNCE: UnitDefinition(UnitType.MASS, "ounce", scalingFactor=0.0625, abscissaUnit=Unit.POUND_MASS),
+    Unit.TROY_OUNCE: UnitDefinition(UnitType.MASS, "troy_oz", scalingFactor=31.1034768, abscissaUnit=Unit.GRAM),
+    Unit.SLUG: UnitDefinition(UnitType.MASS, "slug", scalingFactor=UnitDefinition.gravityInFeet,
+        abscissaUnit=Unit.POUND_MASS),
+    Unit.FOOT: UnitDefinition(UnitType.LENGTH, "foot", bridgeScalingFactor=0.3048, bridgeAbscissaUnit=Unit.METRE),
+    Unit.INCH: UnitDefinition(UnitType.LENGTH, "inch", scalingFactor=1.0 / 12.0, abscissaUnit=Unit.FOOT),
+    Unit.MIL: UnitDefinition(UnitType.LENGTH, "mil", scalingFactor=Prefix.milli().factor, abscissaUnit=Unit.INCH),
+    Unit.POINT: UnitDefinition(UnitType.LENGTH, "point", scalingFactor=1.0 / 72.0, abscissaUnit=Unit.INCH),
+    Unit.YARD: UnitDefinition(UnitType.LENGTH, "yard", scalingFactor=3.0, abscissaUnit=Unit.FOOT),
+    Unit.MILE: UnitDefinition(UnitType.LENGTH, "mile", scalingFactor=5280.0, abscissaUnit=Unit.FOOT),
+    Unit.NAUTICAL_MILE: UnitDefinition(UnitType.LENGTH, "NM", scalingFactor=6080.0, abscissaUnit=Unit.FOOT),
+    Unit.FATHOM: UnitDefinition(UnitType.LENGTH, "fth", scalingFactor=6.0, abscissaUnit=Unit.FOOT),
+    Unit.PSI: UnitDefinition(UnitType.PRESSURE, "psi", MeasurementType.QUOTIENT, uom1=Unit.POUND_FORCE,
+        uom2=Unit.SQUARE_INCH),
+    Unit.IN_HG: UnitDefinition(UnitType.PRESSURE, "inhg", scalingFactor=2275.520677,
+        abscissaUnit=UnitDefinition.inchOfMercuryBase),
+    Unit.SQUARE_INCH: UnitDefinition(UnitType.AREA, "in2", MeasurementType.POWER, uom1=Unit.INCH, exponent=2,
+        scalingFactor=1.0 / 144.0, abscissaUnit=Unit.SQUARE_FOOT),
+    Unit.SQUARE_FOOT: UnitDefinition(UnitType.AREA, "ft2", MeasurementType.POWER, uom1=Unit.FOOT, exponent=2),
+    Unit.SQUARE_YARD: UnitDefinition(UnitType.AREA, "yd2", MeasurementType.POWER, uom1=Unit.YARD, exponent=2),
+    Unit.ACRE: UnitDefinition(UnitType.AREA, "acre", scalingFactor=43560.0, abscissaUnit=Unit.SQUARE_FOOT),
+    Unit.CUBIC_INCH: UnitDefinition(UnitType.VOLUME, "in3", MeasurementType.POWER, uom1=Unit.INCH, exponent=3,
+        scalingFactor=1.0 / 1728.0, abscissaUnit=Unit.CUBIC_FOOT),
+    Unit.CUBIC_FOOT: UnitDefinition(UnitType.VOLUME, "ft3", MeasurementType.POWER, uom1=Unit.FOOT, exponent=3),
+    Unit.CUBIC_FEET_PER_SEC: UnitDefinition(UnitType.VOLUMETRIC_FLOW, "ft3PerSec", MeasurementType.QUOTIENT,
+        uom1=Unit.CUBIC_FOOT, uom2=Unit.SECOND),
+    Unit.CORD: UnitDefinition(UnitType.VOLUME, "cord", scalingFactor=128.0, abscissaUnit=Unit.CUBIC_FOOT),
+    Unit.CUBIC_YARD: UnitDefinition(UnitType.VOLUME, "yd3", MeasurementType.POWER, uom1=Unit.YARD, exponent=3),
+    Unit.FEET_PER_SEC: UnitDefinition(UnitType.VELOCITY, "fps", MeasurementType.QUOTIENT, uom1=Unit.FOOT,
+        uom2=Unit.SECOND),
+    Unit.KNOT: UnitDefinition(UnitType.VELOCITY, "knot", scalingFactor=6080.0 / 3600.0, abscissaUnit=Unit.FEET_PER_SEC),
+    Unit.FEET_PER_SEC_SQUARED: UnitDefinition(UnitType.ACCELERATION, "ftps2", MeasurementType.QUOTIENT,
+        uom1=Unit.FOOT, uom2=Unit.SQUARE_SECOND),
+    Unit.HP: UnitDefinition(UnitType.POWER, "hp", MeasurementType.PRODUCT, uom1=Unit.POUND_FORCE,
+        uom2=Unit.FEET_PER_SEC, scalingFactor=550.0),
+    Unit.BTU: UnitDefinition(UnitType.ENERGY, "btu", scalingFactor=778.1692622659652,
+        abscissaUnit=Unit.FOOT_POUND_FORCE),
+    Unit.FOOT_POUND_FORCE: UnitDefinition(UnitType.ENERGY, "ft_lbf", MeasurementType.PRODUCT, uom1=Unit.FOOT,
+        uom2=Unit.POUND_FORCE),
+    Unit.POUND_FORCE: UnitDefinition(UnitType.FORCE, "lbf", MeasurementType.PRODUCT, uom1=Unit.POUND_MASS,
+        uom2=Unit.FEET_PER_SEC_SQUARED, scalingFactor=UnitDefinition.gravityInFeet),
+    Unit.GRAIN: UnitDefinition(UnitType.MASS, "grain", scalingFactor=1.0 / 7000.0, abscissaUnit=Unit.POUND_MASS),
+    Unit.MILES_PER_HOUR: UnitDefinition(UnitType.VELOCITY, "mph", scalingFactor=5280.0 / 3600.0,
+        abscissaUnit=Unit.FEET_PER_SEC),
+    Unit.REV_PER_MIN: UnitDefinition(UnitType.FREQUENCY, "rpm", MeasurementType.QUOTIENT, uom1=Unit.ONE,
+        uom2=Unit.MINUTE),
+
+    # US units
+    Unit.US_GALLON: UnitDefinition(UnitType.VOLUME, "us_gallon", scalingFactor=231.0, abscissaUnit=Unit.CUBIC_INCH),
+    Unit.US_BARREL: UnitDefinition(UnitType.VOLUME, "us_bbl", scalingFactor=42.0, abscissaUnit=Unit.US_GALLON),
+    Unit.US_BUSHEL: UnitDefinition(UnitType.VOLUME, "us_bu", scalingFactor=2150.42058, abscissaUnit=Unit.CUBIC_INCH),
+    Unit.US_FLUID_OUNCE: UnitDefinition(UnitType.VOLUME, "us_fl_oz", scalingFactor=0.0078125,
+        abscissaUnit=Unit.US_GALLON),
+    Unit.US_CUP: UnitDefinition(UnitType.VOLUME, "us_cup", scalingFactor=8.0, abscissaUnit=Unit.US_FLUID_OUNCE),
+    Unit.US_PINT: UnitDefinition(UnitType.VOLUME, "us_pint", scalingFactor=16.0, abscissaUnit=Unit.US_FLUID_OUNCE),
+    Unit.US_QUART: UnitDefinition(UnitType.VOLUME, "us_quart", scalingFactor=32.0, abscissaUnit=Unit.US_FLUID_OUNCE),
+    Unit.US_TABLESPOON: UnitDefinition(UnitType.VOLUME, "us_tbsp", scalingFactor=0.5, abscissaUnit=Unit.US_FLUID_OUNCE),
+    Unit.US_TEASPOON: UnitDefinition(UnitType.VOLUME, "us_tsp", scalingFactor=1.0 / 6.0,
+        abscissaUnit=Unit.US_FLUID_OUNCE),
+    Unit.US_TON: UnitDefinition(UnitType.MASS, "us_ton", scalingFactor=2000.0, abscissaUnit=Unit.POUND_MASS),
+
+    # British Imperial units
+    Unit.BR_GALLON: UnitDefinition(UnitType.VOLUME, "br_gallon", scalingFactor=277.4194327916215,
+        abscissaUnit=Unit.CUBIC_INCH),
+    Unit.BR_BUSHEL: UnitDefinition(UnitType.VOLUME, "br_bu", scalingFactor=8.0, abscissaUnit=Unit.BR_GALLON),
+    Unit.BR_FLUID_OUNCE: UnitDefinition(UnitType.VOLUME, "br_fl_oz", scalingFactor=0.00625,
+        abscissaUnit=Unit.BR_GALLON),
+    Unit.BR_CUP: UnitDefinition(UnitType.VOLUME, "br_cup", scalingFactor=8.0, abscissaUnit=Unit.BR_FLUID_OUNCE),
+    Unit.BR_PINT: UnitDefinition(UnitType.VOLUME, "br_pint", scalingFactor=20.0, abscissaUnit=Unit.BR_FLUID_OUNCE),
+    Unit.BR_QUART: UnitDefinition(UnitType.VOLUME, "br_quart", scalingFactor=40.0, abscissaUnit=Unit.BR_FLUID_OUNCE),
+    Unit.BR_TABLESPOON: UnitDefinition(UnitType.VOLUME, "br_tbsp", scalingFactor=0.625,
+        abscissaUnit=Unit.BR_FLUID_OUNCE),
+    Unit.BR_TEASPOON: UnitDefinition(UnitType.VOLUME, "br_tsp", scalingFactor=5.0 / 24.0,
+        abscissaUnit=Unit.BR_FLUID_OUNCE),
+    Unit.BR_TON: UnitDefinition(UnitType.MASS, "br_ton", scalingFactor=2240.0, abscissaUnit=Unit.POUND_MASS),
+
+    # financial units
+    Unit.US_DOLLAR: UnitDefinition(UnitType.CURRENCY, "us_dollar"),
+    Unit.EURO: UnitDefinition(UnitType.CURRENCY, "euro"),
+    Unit.YUAN: UnitDefinition(UnitType.CURRENCY, "yuan"),
+}
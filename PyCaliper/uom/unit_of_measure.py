@@ -1,10 +1,13 @@
 import math
 import time
+import weakref
 from PyCaliper.uom.symbolic import Symbolic
 from PyCaliper.uom.enums import UnitType
 from PyCaliper.uom.enums import MeasurementType
 from PyCaliper.uom.localizer import Localizer
+from PyCaliper.uom.quantity_formatter import QuantityFormatter
 from PyCaliper.uom.cache_manager import CacheManager
+from PyCaliper.uom.dimension import Dimension
 from PyCaliper.uom.enums import Unit
 from PyCaliper.uom.caliper_exception import PyCaliperException
 
@@ -44,12 +47,17 @@ class Reducer:
         
         # scaling
         if (len(self.pathExponents) > 0):
-            lastExponent = self.pathExponents[-1]
+            # the exponent of this UOM is the product of the exponents down the path,
+            # e.g. -2 for the inch in lbf/in^2
+            pathExponent = 1
+
+            for exp in self.pathExponents:
+                pathExponent = pathExponent * exp
 
             # compute the overall scaling factor using power
-            factor = math.pow(uom.scalingFactor, abs(lastExponent))
+            factor = math.pow(uom.scalingFactor, abs(pathExponent))
 
-            if (lastExponent < 0):
+            if (pathExponent < 0):
                 self.mapScalingFactor = self.mapScalingFactor / factor
             else:
                 self.mapScalingFactor = self.mapScalingFactor * factor
@@ -241,12 +249,54 @@ class PathParameters:
 #        
 class UnitOfMeasure(Symbolic):  
     MAX_SYMBOL_LENGTH = 16
+
+    __slots__ = ("nameText", "symbol", "descriptionText", "textKey", "prefix", "reducer", "dimension", "canonical", "dependents", "revision",
+                 "internKey", "frozen", "hashValue", "texts", "categoryText", "unit", "unitType", "abscissaUnit", "scalingFactor", "offset", "uom1", "uom2",
+                 "exponent1", "exponent2", "bridgeScalingFactor", "bridgeOffset", "bridgeAbscissaUnit", "baseSymbol",
+                 "__weakref__")
+
+    # attributes that the reduction to base units of measure depends on
+    REDUCTION_ATTRIBUTES = frozenset(["scalingFactor", "abscissaUnit", "uom1", "uom2", "exponent1", "exponent2"])
+
+    # attributes that the hash depends on
+    HASH_ATTRIBUTES = frozenset(["unitType", "symbol", "unit", "abscissaUnit", "scalingFactor", "offset"])
+
+    # attributes that the rendered text depends on
+    TEXT_ATTRIBUTES = HASH_ATTRIBUTES | frozenset(["nameText", "descriptionText", "textKey", "prefix", "baseSymbol"])
+
+    # cached and bookkeeping attributes, not part of the definition
+    INTERNAL_ATTRIBUTES = frozenset(["reducer", "dimension", "canonical", "dependents", "revision", "internKey", "frozen",
+                                     "hashValue", "texts", "baseSymbol"])
              
     def __init__(self, unitType=UnitType.UNCLASSIFIED, name=None, symbol=None, description=None):
+        # key of this product or quotient in the interning table
+        self.internKey = None
+
+        # a frozen unit of measure cannot be changed
+        self.frozen = False
+
+        # cached reduction and the units of measure whose reduction uses this one
+        self.reducer = None
+        self.dimension = None
+        self.canonical = None
+        self.dependents = None
+
+        # incremented when the definition changes so that cached conversion factors are not used
+        self.revision = 0
+
+        # computed on first use
+        self.hashValue = None
+
+        # rendered text by style and locale
+        self.texts = None
+
+        # message id of a localized name and description, and the prefix of a prefixed unit
+        self.textKey = None
+        self.prefix = None
+
         super().__init__(name, symbol, description)
         
-        self.conversionRegistry = {}
-        self.category = Localizer.instance().langStr("default.category.text")
+        self.categoryText = None
         self.unit = None
         self.unitType = unitType    
         self.abscissaUnit = self
@@ -271,8 +321,160 @@ class UnitOfMeasure(Symbolic):
     @staticmethod
     def isValidExponent(exponent):
         return False if exponent is None else True
+
+    ##
+    # The name, in the current language if it is localized
+    @property
+    def name(self):
+        if (self.nameText is None and self.textKey is not None):
+            name = Localizer.instance().langStr(self.textKey + ".name")
+            return name if self.prefix is None else self.prefix.name + name
+        return self.nameText
+
+    @name.setter
+    def name(self, value):
+        self.nameText = value
+
+    ##
+    # The description, in the current language if it is localized
+    @property
+    def description(self):
+        if (self.descriptionText is None and self.textKey is not None):
+            if (self.prefix is not None):
+                return str(self.prefix.factor) + " " + Localizer.instance().langStr(self.textKey + ".name")
+            return Localizer.instance().langStr(self.textKey + ".desc")
+        return self.descriptionText
+
+    @description.setter
+    def description(self, value):
+        self.descriptionText = value
+
+    ##
+    # The category, by default the localized default category
+    @property
+    def category(self):
+        if (self.categoryText is None):
+            return Localizer.instance().langStr("default.category.text")
+        return self.categoryText
+
+    @category.setter
+    def category(self, value):
+        self.categoryText = value
+
+    def __setattr__(self, name, value):
+        if (name not in UnitOfMeasure.INTERNAL_ATTRIBUTES and self.frozen):
+            # no part of the definition of a frozen unit can be changed
+            self.checkMutable()
+
+        if (name not in UnitOfMeasure.INTERNAL_ATTRIBUTES and self.internKey is not None):
+            # a changed product or quotient is no longer the shared result of its operation
+            CacheManager.instance().unregisterDerivedUOM(self.internKey, self)
+            object.__setattr__(self, "internKey", None)
+
+        if (name in UnitOfMeasure.TEXT_ATTRIBUTES):
+            object.__setattr__(self, "texts", None)
+
+            if (name in UnitOfMeasure.HASH_ATTRIBUTES):
+                object.__setattr__(self, "hashValue", None)
+
+                # the hash and text of a dependent include the symbol of its abscissa unit
+                if (name == "symbol" and self.dependents is not None):
+                    for dependent in list(self.dependents.values()):
+                        object.__setattr__(dependent, "hashValue", None)
+                        object.__setattr__(dependent, "texts", None)
+
+        if (name in UnitOfMeasure.REDUCTION_ATTRIBUTES):
+            super().__setattr__(name, value)
+            self.revision = self.revision + 1
+
+            # remember that this unit's reduction depends on the other one
+            if (isinstance(value, UnitOfMeasure) and value is not self):
+                value.addDependent(self)
+
+            # the cached reductions of this unit and its dependents are stale
+            if (self.reducer is not None or self.dimension is not None or self.canonical is not None
+                    or self.dependents is not None or self.internKey is not None):
+                self.clearCache()
+        else:
+            super().__setattr__(name, value)
+
+    def __getstate__(self):
+        state = {name: getattr(self, name) for name in UnitOfMeasure.__slots__ if name != "__weakref__"}
+
+        # caches that refer to objects in this process are rebuilt after unpickling
+        state["reducer"] = None
+        state["dimension"] = None
+        state["canonical"] = None
+        state["dependents"] = None
+        state["internKey"] = None
+
+        # string hashes differ between processes
+        state["hashValue"] = None
+        state["texts"] = None
+        return state
+
+    def __setstate__(self, state):
+        # restore the attributes as they were, without the bookkeeping of __setattr__
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    ##
+    # Check that this unit of measure is not frozen
+    def checkMutable(self):
+        if (self.frozen):
+            msg = Localizer.instance().messageStr("unit.frozen").format(self.symbol)
+            raise PyCaliperException(msg)
+
+    ##
+    # Freeze this unit of measure so that it cannot be changed. The cached
+    # hash, reduction, dimension, canonical form, base symbol and texts in the
+    # current locale are computed first, so that reading a frozen unit does
+    # not write to it. An unclassified unit is classified first for the same
+    # reason.
+    def freeze(self):
+        self.classify()
+        hash(self)
+        self.getReducer()
+        self.getDimension()
+        self.getCanonicalForm()
+        self.getBaseSymbol()
+
+        for style in (QuantityFormatter.SYMBOL, QuantityFormatter.NAME, QuantityFormatter.FULL):
+            self.getText(style)
+
+        self.frozen = True
+
+    ##
+    # Remember that the reduction of another unit of measure depends on this one
+    # 
+    # @param uom Dependent {@link UnitOfMeasure}
+    def addDependent(self, uom):
+        if (self.dependents is None):
+            self.dependents = weakref.WeakValueDictionary()
+        self.dependents[id(uom)] = uom
+
+    ##
+    # Register this unit of measure as a dependent of the units of measure that
+    # its reduction depends on, e.g. after unpickling
+    def linkDependencies(self):
+        for name in UnitOfMeasure.REDUCTION_ATTRIBUTES:
+            value = getattr(self, name)
+
+            if (isinstance(value, UnitOfMeasure) and value is not self):
+                value.addDependent(self)
+
+    ##
+    # Get the units of measure that this unit of measure refers to
+    # 
+    # @return List of {@link UnitOfMeasure}
+    def getReferencedUOMs(self):
+        references = (self.abscissaUnit, self.uom1, self.uom2, self.bridgeAbscissaUnit)
+        return [uom for uom in references if uom is not None and uom is not self]
  
     def __hash__(self):
+        if (self.hashValue is not None):
+            return self.hashValue
+
         # Convert floats to integers for hashing (since we use math.isclose in __eq__)
         scaling_factor_int = int(self.scalingFactor * 1e10)  # 10 decimal places precision
         offset_int = int(self.offset * 1e10)
@@ -280,7 +482,7 @@ class UnitOfMeasure(Symbolic):
         # Include unit enumeration if it exists
         unit_hash = hash(self.unit) if self.unit is not None else 0
         
-        return hash((
+        self.hashValue = hash((
             self.unitType,
             self.symbol,
             unit_hash,
@@ -288,8 +490,13 @@ class UnitOfMeasure(Symbolic):
             scaling_factor_int,
             offset_int
         ))
+        return self.hashValue
     
     def __eq__(self, other):
+        # same object
+        if (other is self):
+            return True
+
         # same type
         if (other is None or self.unitType != other.unitType):
             return False
@@ -319,9 +526,53 @@ class UnitOfMeasure(Symbolic):
         return self.symbol > other.symbol
     
     def __ne__(self, other):
+        if (other is self):
+            return False
         return not self.__eq__(other)
     
     def __str__(self):
+        return self.getText(QuantityFormatter.FULL)
+
+    def __format__(self, spec):
+        return self.getText(spec if len(spec) > 0 else QuantityFormatter.FULL)
+
+    ##
+    # Get the text of this unit of measure in a style of {@link QuantityFormatter}.
+    # The text is rendered once for each locale.
+    # 
+    # @param style {@link QuantityFormatter#SYMBOL}, {@link QuantityFormatter#NAME} or {@link QuantityFormatter#FULL}
+    # @return Text
+    def getText(self, style):
+        key = (style, Localizer.getLocale())
+        texts = self.texts
+
+        if (texts is None):
+            texts = {}
+            self.texts = texts
+
+        text = texts.get(key)
+
+        if (text is None):
+            if (style == QuantityFormatter.SYMBOL):
+                text = self.symbol
+            elif (style == QuantityFormatter.NAME):
+                text = self.name if self.name is not None else self.symbol
+            elif (style == QuantityFormatter.FULL):
+                text = self.buildText()
+            else:
+                msg = Localizer.instance().messageStr("format.style.invalid").format(style)
+                raise PyCaliperException(msg)
+
+            texts[key] = text
+
+        return text
+
+    ##
+    # Build the complete text of this unit of measure, with its type,
+    # conversion and base symbol
+    # 
+    # @return Text
+    def buildText(self):
         # type
         value = Localizer.instance().langStr("unit.type.text") + " " + str(self.unitType) + ", "
         
@@ -411,17 +662,101 @@ class UnitOfMeasure(Symbolic):
             
         return measurementType
     
+    ##
+    # Get the reduction of this unit of measure to its base units of measure.
+    # The reduction is cached until the conversion of this unit or of a unit
+    # that it depends on is changed.
+    # 
+    # @return {@link Reducer}
     def getReducer(self):
-        reducer = Reducer()
-        reducer.explode(self)
+        reducer = self.reducer
+
+        if (reducer is None):
+            reducer = Reducer()
+            reducer.explode(self)
+            self.reducer = reducer
+
         return reducer
 
+    ##
+    # Get the dimension of this unit of measure, i.e. its exponents over the
+    # base unit types and the cumulative scaling factor. The dimension of a
+    # product, quotient or power is computed from the dimensions of its
+    # operands, otherwise from the reduction to base units of measure.
+    # 
+    # @return {@link Dimension}
+    def getDimension(self):
+        if (self.dimension is None):
+            if (self.abscissaUnit is self and self.uom1 is not None):
+                dimension = self.uom1.getDimension().power(self.exponent1)
+
+                if (self.uom2 is not None):
+                    dimension = dimension.multiply(self.uom2.getDimension().power(self.exponent2))
+
+                self.dimension = Dimension(dimension.exponents, self.scalingFactor * dimension.scalingFactor)
+            else:
+                reducer = self.getReducer()
+                self.dimension = Dimension.fromTerms(reducer.terms, reducer.mapScalingFactor)
+        return self.dimension
+
+    ##
+    # Get the canonical form of this unit of measure. This is its reduction
+    # with each base unit of measure that has a bridge conversion replaced by
+    # the bridged unit of measure, e.g. foot by metre, so that units of measure
+    # from different measurement systems have the same form. An amount in
+    # this unit of measure is amount * factor + offset in the canonical form.
+    # 
+    # @return Tuple of the sorted (symbol, exponent) terms, the scaling factor
+    # and the offset to them
+    def getCanonicalForm(self):
+        if (self.canonical is None):
+            reducer = self.getReducer()
+            factor = reducer.mapScalingFactor
+            terms = {}
+
+            for uom, power in reducer.terms.items():
+                if (uom.bridgeAbscissaUnit is not None):
+                    factor = factor * math.pow(uom.bridgeScalingFactor, power)
+                    uom = uom.bridgeAbscissaUnit
+
+                terms[uom.symbol] = terms.get(uom.symbol, 0) + power
+
+            key = tuple(sorted((symbol, power) for symbol, power in terms.items() if power != 0))
+            self.canonical = (key, factor, self.getCanonicalOffset())
+        return self.canonical
+
+    ##
+    # Get the offset of an amount in the canonical form. Offsets are only
+    # supported along a path of scalar units of measure, where each step
+    # converts an amount x to (x + offset) * scalingFactor, e.g. from a unit
+    # defined relative to Celsius to Celsius and then to Kelvin.
+    # 
+    # @return Offset
+    def getCanonicalOffset(self):
+        offset = 0.0
+        uom = self
+        visited = set()
+
+        while (uom.getMeasurementType() == MeasurementType.SCALAR and id(uom) not in visited):
+            visited.add(id(uom))
+
+            if (uom.isTerminal()):
+                # the bridge to another measurement system
+                if (uom.bridgeAbscissaUnit is not None):
+                    offset = (offset + uom.bridgeOffset) * uom.bridgeScalingFactor
+                break
+
+            offset = (offset + uom.offset) * uom.scalingFactor
+            uom = uom.abscissaUnit
+
+        return offset
+
     ##
     # Get the most reduced units of measure
     # 
     # @return Map of {@link UnitOfMeasure} and exponent
     def getBaseUnitsOfMeasure(self):
-        return self.getReducer().terms
+        return dict(self.getReducer().terms)
 
     ##
     # Check to see if this unit of measure has a conversion to another unit of
@@ -429,13 +764,18 @@ class UnitOfMeasure(Symbolic):
     # 
     # @return True if it does not
     def isTerminal(self):
-        return True if self == self.abscissaUnit else False
+        abscissaUnit = self.abscissaUnit
+        return True if abscissaUnit is self or self == abscissaUnit else False
     
     def setBridgeConversion(self, scalingFactor, abscissaUnit, offset):
+        self.checkMutable()
         self.bridgeScalingFactor = scalingFactor
         self.bridgeAbscissaUnit = abscissaUnit
         self.bridgeOffset = offset
 
+        # conversions through the bridge are stale
+        self.clearCache()
+
     ##
     # Define a conversion with the specified scaling factor, abscissa unit of
     # measure and scaling factor.
@@ -447,6 +787,8 @@ class UnitOfMeasure(Symbolic):
     # @param offset
     #            Offset
     def setConversion(self, scalingFactor, abscissaUnit, offset=0.0):
+        self.checkMutable()
+
         if (abscissaUnit is None):
             msg = Localizer.instance().messageStr("unit.cannot.be.null")
             raise PyCaliperException(msg)
@@ -457,8 +799,8 @@ class UnitOfMeasure(Symbolic):
                 msg = Localizer.instance().messageStr("conversion.not.allowed")
                 raise PyCaliperException(msg)
 
-        # unit has been previously cached, so first remove it, then cache again
-        CacheManager.instance().unregisterUOM(self)
+        # unit has been previously cached, so cache it again with the new base symbol
+        oldBaseSymbol = self.getBaseSymbol()
         
         self.baseSymbol = None
         self.scalingFactor = scalingFactor
@@ -466,11 +808,7 @@ class UnitOfMeasure(Symbolic):
         self.offset = offset
 
         # re-cache
-        CacheManager.instance().registerUOM(self)
-        
-        # remove from conversion registry
-        if abscissaUnit in self.conversionRegistry:
-            self.conversionRegistry.pop(abscissaUnit)
+        CacheManager.instance().reregisterUOM(self, oldBaseSymbol)
 
     ##
     # Get the exponent of a power unit
@@ -587,35 +925,12 @@ class UnitOfMeasure(Symbolic):
             # already classified
             return self
 
-        # base unit map
-        uomBaseMap = self.getReducer().terms
-
-        # try to find this map in the unit types
+        # find the unit type with the dimension exponents
+        exponents = self.getDimension().exponents
         matchedType = UnitType.UNCLASSIFIED
 
-        for unitType in UnitType:
-            unitTypeMap = CacheManager.instance().getTypeMap(unitType)
-
-            if (len(unitTypeMap) != len(uomBaseMap)):
-                # not a match
-                continue
-
-            match = True
-
-            # same size, now check base unit types and exponents
-            for uomBase, uomPower in uomBaseMap.items():
-                uomBaseType = uomBase.unitType
-                
-                unitValue = unitTypeMap.get(uomBaseType)
-
-                if (unitValue is None or unitValue != uomPower):
-                    # not a match
-                    match = False
-                    break
-
-            if (match):
-                matchedType = unitType
-                break
+        if (exponents is not None):
+            matchedType = CacheManager.instance().getDimensionType(exponents)
 
         if (matchedType != UnitType.UNCLASSIFIED):
             self.unitType = matchedType
@@ -667,8 +982,44 @@ class UnitOfMeasure(Symbolic):
             msg = Localizer.instance().messageStr("offset.not.supported").format(str(other))
             raise PyCaliperException(msg)
         
+    ##
+    # Clear the cached reductions and conversion factors of this unit of
+    # measure and of all of the units of measure that depend on it
     def clearCache(self):
-        self.conversionRegistry.clear()
+        cacheManager = CacheManager.instance()
+        pending = [self]
+        cleared = set()
+
+        while (len(pending) > 0):
+            uom = pending.pop()
+
+            if (id(uom) in cleared):
+                continue
+
+            cleared.add(id(uom))
+            uom.reducer = None
+            uom.dimension = None
+            uom.canonical = None
+            uom.texts = None
+            uom.hashValue = None
+            uom.revision = uom.revision + 1
+
+            # a dependent is cached again by its new base symbol; this unit of
+            # measure is re-cached by the caller once its definition is complete
+            if (uom is not self and uom.baseSymbol is not None):
+                oldBaseSymbol = uom.baseSymbol
+                uom.baseSymbol = None
+
+                if (cacheManager.getUOMBySymbol(uom.symbol) is uom):
+                    cacheManager.reregisterUOM(uom, oldBaseSymbol)
+
+            # an interned product or quotient no longer matches its operands
+            if (uom.internKey is not None):
+                cacheManager.unregisterDerivedUOM(uom.internKey, uom)
+                uom.internKey = None
+
+            if (uom.dependents is not None):
+                pending.extend(uom.dependents.values())
         
     def clonePowerProduct(self, uom1, uom2):        
         invert = False
@@ -686,15 +1037,51 @@ class UnitOfMeasure(Symbolic):
                 msg = Localizer.instance().messageStr("incompatible.units").format(self, one)
                 raise PyCaliperException(msg)
 
-        newUOM = uom1.multiplyOrDivide(uom2, invert)
+        # not interned since the unit type is changed
+        newUOM = uom1.createPowerProduct(uom2, invert)
         newUOM.unitType = self.unitType
 
         return newUOM 
     
+    ##
+    # Multiply or divide this unit of measure by another one. The result is
+    # interned so that repeating the operation on the same operands returns the
+    # same unit of measure.
+    # 
+    # @param other
+    #            {@link UnitOfMeasure}
+    # @param invert
+    #            True to divide, False to multiply
+    # @return {@link UnitOfMeasure}
     def multiplyOrDivide(self, other, invert): 
         if (other is None):
             msg = Localizer.instance().messageStr("unit.cannot.be.null")
             raise PyCaliperException(msg)
+
+        # the interned result references both operands, so their ids are not reused
+        key = (id(self), id(other), invert)
+        cacheManager = CacheManager.instance()
+        result = cacheManager.getDerivedUOM(key)
+
+        if (result is None):
+            result = self.createPowerProduct(other, invert)
+            result.internKey = key
+            cacheManager.registerDerivedUOM(key, result)
+
+        return result
+
+    ##
+    # Create a new product or quotient of this unit of measure and another one
+    # 
+    # @param other
+    #            {@link UnitOfMeasure}
+    # @param invert
+    #            True to divide, False to multiply
+    # @return {@link UnitOfMeasure}
+    def createPowerProduct(self, other, invert): 
+        if (other is None):
+            msg = Localizer.instance().messageStr("unit.cannot.be.null")
+            raise PyCaliperException(msg)
         
         self.checkOffset(self)
         self.checkOffset(other)
@@ -703,9 +1090,9 @@ class UnitOfMeasure(Symbolic):
         thisReducer = self.getReducer()
         thisMap = thisReducer.terms
         
-        # other base symbol map
+        # other base symbol map (copied since matched terms are removed)
         otherReducer = other.getReducer()
-        otherMap = otherReducer.terms
+        otherMap = dict(otherReducer.terms)
         
         # create a map of the unit of measure powers
         resultMap = {}
@@ -771,6 +1158,8 @@ class UnitOfMeasure(Symbolic):
             result.abscissaUnit = baseUOM
             result.unitType = baseUOM.unitType
 
+        result.baseSymbol = baseSymbol
+
         return result
     
     def convertScalarToScalar(self, targetUOM):
@@ -850,14 +1239,18 @@ class UnitOfMeasure(Symbolic):
             raise PyCaliperException(msg)
         
         # first check the cache
-        cachedFactor = None
-        if targetUOM in self.conversionRegistry: 
-            cachedFactor = self.conversionRegistry[targetUOM]
+        cacheManager = CacheManager.instance()
+        cachedFactor = cacheManager.getConversionFactor(self, targetUOM)
 
         if (cachedFactor is not None):
             return cachedFactor
         
         UnitOfMeasure.checkTypes(self, targetUOM)
+
+        # the dimensions must agree
+        if (not self.getDimension().isCompatible(targetUOM.getDimension())):
+            msg = Localizer.instance().messageStr("incompatible.units").format(self, targetUOM)
+            raise PyCaliperException(msg)
         
         fromReducer = self.getReducer()
         toReducer = targetUOM.getReducer()
@@ -896,7 +1289,7 @@ class UnitOfMeasure(Symbolic):
         cachedFactor = factor * scaling
 
         # cache it
-        self.conversionRegistry[targetUOM] = cachedFactor
+        cacheManager.registerConversionFactor(self, targetUOM, cachedFactor)
 
         return cachedFactor
     